@@ -0,0 +1,42 @@
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from django.views import View
+
+
+class AsyncAPIView(View):
+    """
+    Base view for read-only endpoints served natively under ASGI.
+
+    DRF's APIView only supports synchronous handlers, so this is a plain Django
+    view with `async def` handlers: the request is wrapped in a DRF Request
+    (for `query_params` and the paginators) and the returned DRF Response is
+    rendered as JSON. While a handler awaits the database or Redis the event
+    loop keeps serving other requests instead of pinning a worker thread.
+
+    There is no authentication, throttling or content negotiation; use it only
+    for public GET endpoints that mirror an existing APIView.
+    """
+
+    renderer_class = JSONRenderer
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request)
+        try:
+            response = await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            response = Response({"error": exc.detail}, status=exc.status_code)
+        return self.finalize_response(request, response)
+
+    def finalize_response(self, request, response):
+        if isinstance(response, Response):
+            response.accepted_renderer = self.renderer_class()
+            response.accepted_media_type = self.renderer_class.media_type
+            response.renderer_context = {
+                "view": self,
+                "request": request,
+                "response": response,
+            }
+        return response
@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from gameboard.games.metadata import contestant_metadata
 from gameboard.games.models import Contestant
 
 
@@ -10,6 +11,7 @@ class DeleteContestantView(APIView):
             contestant = Contestant.objects.get(id=contestant_id)
             contestant.is_active = False
             contestant.save()
+            contestant_metadata.invalidate(contestant.id)
             return Response(
                 {"message": "Contestant marked as inactive."}, status=status.HTTP_200_OK
             )
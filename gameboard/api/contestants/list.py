@@ -1,27 +1,32 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
-from django.db.models import Sum
+from rest_framework.exceptions import NotFound
+from django.db.models import Sum, Value
+from django.db.models.functions import Coalesce
 
+from gameboard.api.pagination import KeysetPagination
 from gameboard.games.models import Contestant
 
 
-class ContestantListView(APIView, PageNumberPagination):
+class ContestantListView(APIView, KeysetPagination):
     """
     API to list contestants with pagination, total scores, and optional search.
     """
 
     page_size = 10
+    cursor_ordering = ("-total_score", "name", "id")
 
     def get(self, request):
         try:
             search_query = request.GET.get("search", "").strip()
 
             contestants = (
-                Contestant.objects.annotate(total_score=Sum("gamesession__score"))
+                Contestant.objects.annotate(
+                    total_score=Coalesce(Sum("gamesession__score"), Value(0))
+                )
                 .only("id", "name", "is_active", "joined_at")
-                .order_by("-total_score", "name")
+                .order_by("-total_score", "name", "id")
             )
 
             if search_query:
@@ -42,6 +47,8 @@ class ContestantListView(APIView, PageNumberPagination):
 
             return self.get_paginated_response(data)
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
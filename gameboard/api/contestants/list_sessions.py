@@ -1,18 +1,22 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 from django.db.models import Q
+from django.utils.dateparse import parse_date
 
+from gameboard.api.pagination import KeysetPagination
 from gameboard.games.models import GameSession, Contestant
+from gameboard.games.scores import day_bounds
 
 
-class ContestantSessionsListView(APIView, PageNumberPagination):
+class ContestantSessionsListView(APIView, KeysetPagination):
     """
     API to list game sessions for a specific contestant with pagination and filtering.
     """
 
     page_size = 10
+    cursor_ordering = ("-start_time", "-id")
 
     def get(self, request, contestant_id):
         try:
@@ -28,14 +32,21 @@ class ContestantSessionsListView(APIView, PageNumberPagination):
             sessions = GameSession.objects.filter(contestant_id=contestant_id)
 
             if date_filter:
+                date = parse_date(date_filter)
+                if not date:
+                    return Response(
+                        {"error": "Invalid date format."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                start, end = day_bounds(date)
                 sessions = sessions.filter(
-                    Q(start_time__date=date_filter) | Q(end_time__date=date_filter)
+                    Q(start_date=date) | Q(end_time__gte=start, end_time__lt=end)
                 )
 
             sessions = (
                 sessions.select_related("game")
                 .only("id", "game__name", "start_time", "end_time", "score")
-                .order_by("-start_time")
+                .order_by("-start_time", "-id")
             )
 
             result_page = self.paginate_queryset(sessions, request, view=self)
@@ -53,6 +64,8 @@ class ContestantSessionsListView(APIView, PageNumberPagination):
 
             return self.get_paginated_response(data)
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 
+from gameboard.games.metadata import contestant_metadata
 from gameboard.games.models import Contestant
 
 
@@ -25,6 +26,7 @@ class UpdateContestantView(APIView):
 
             contestant.name = new_name
             contestant.save()
+            contestant_metadata.invalidate(contestant.id)
 
             return Response(
                 {"message": "Contestant updated successfully", "name": contestant.name},
@@ -0,0 +1,82 @@
+import csv
+import json
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+
+class _Echo:
+    """File-like object for csv.writer that returns each line instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(fields, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_ndjson(fields, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+class BaseExportView(APIView):
+    """
+    Base view streaming every row of a query as CSV (default) or NDJSON
+    (`?output=ndjson`). Rows are read with `.iterator(chunk_size=...)`, which
+    uses server-side cursors on PostgreSQL, so memory stays flat regardless of
+    the number of rows.
+
+    Subclasses set `fields` and implement `get_rows()`, returning an iterable
+    of tuples in `fields` order or an error Response.
+    """
+
+    fields = ()
+    filename = "export"
+    chunk_size = 2000
+    outputs = {
+        "csv": (stream_csv, "text/csv"),
+        "ndjson": (stream_ndjson, "application/x-ndjson"),
+    }
+
+    def get_rows(self, request, **kwargs):
+        raise NotImplementedError
+
+    def get_filename(self, request, **kwargs):
+        return self.filename
+
+    def get(self, request, **kwargs):
+        try:
+            output = request.query_params.get("output", "csv")
+            if output not in self.outputs:
+                return Response(
+                    {"error": f"'output' must be one of: {', '.join(self.outputs)}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            rows = self.get_rows(request, **kwargs)
+            if isinstance(rows, Response):
+                return rows
+
+            stream, content_type = self.outputs[output]
+            response = StreamingHttpResponse(
+                stream(self.fields, rows), content_type=content_type
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="{self.get_filename(request, **kwargs)}.{output}"'
+            )
+            return response
+
+        except Exception as e:
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -0,0 +1,48 @@
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from gameboard.api.async_view import AsyncAPIView
+from gameboard.games.feed import stream_feed
+
+
+class BaseFeedView(AsyncAPIView):
+    """
+    Base view streaming a live top-N feed as server-sent events (see
+    games/feed.py). Subclasses implement `get_feed()`, returning a Feed or an
+    error Response.
+
+    Each open stream holds a Redis subscription rather than a worker thread,
+    so the endpoint is only served under ASGI; WSGI servers would buffer the
+    endless response.
+    """
+
+    async def get_feed(self, request, **kwargs):
+        raise NotImplementedError
+
+    async def get(self, request, **kwargs):
+        try:
+            feed = await self.get_feed(request, **kwargs)
+            if isinstance(feed, Response):
+                return feed
+
+            if not isinstance(request._request, ASGIRequest):
+                return Response(
+                    {"error": "The live feed requires an ASGI server."},
+                    status=status.HTTP_501_NOT_IMPLEMENTED,
+                )
+
+            response = StreamingHttpResponse(
+                stream_feed(feed), content_type="text/event-stream"
+            )
+            response["Cache-Control"] = "no-cache"
+            response["X-Accel-Buffering"] = "no"
+            return response
+
+        except Exception as e:
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
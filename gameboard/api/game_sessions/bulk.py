@@ -0,0 +1,82 @@
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from gameboard.api.leaderboard.cache import GLOBAL_SCOPE, date_scope, game_scope
+from gameboard.api.response_cache import invalidate_scopes
+from gameboard.games.ingest import (
+    SessionImporter,
+    iter_csv_records,
+    iter_jsonl_records,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BulkGameSessionsView(APIView):
+    """
+    API to import completed game sessions in bulk from a JSON Lines or CSV body.
+    Each row needs game_id, contestant_id, start_time, end_time and score.
+    Invalid rows are reported by line number without aborting the import.
+    """
+
+    readers = {
+        "application/x-ndjson": iter_jsonl_records,
+        "application/jsonl": iter_jsonl_records,
+        "text/csv": iter_csv_records,
+    }
+    default_batch_size = 1000
+    max_batch_size = 5000
+
+    def post(self, request):
+        try:
+            content_type = request.content_type.split(";")[0].strip().lower()
+            reader = self.readers.get(content_type)
+            if reader is None:
+                return Response(
+                    {
+                        "error": "Content-Type must be one of: "
+                        f"{', '.join(self.readers)}."
+                    },
+                    status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                )
+
+            try:
+                batch_size = int(
+                    request.query_params.get("batch_size", self.default_batch_size)
+                )
+            except ValueError:
+                return Response(
+                    {"error": "'batch_size' must be an integer."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            batch_size = min(max(batch_size, 1), self.max_batch_size)
+
+            stream = request.stream
+            if stream is None:
+                return Response(
+                    {"error": "Request body is empty."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            lines = (line.decode("utf-8", errors="replace") for line in stream)
+            importer = SessionImporter(batch_size=batch_size)
+            report = importer.run(reader(lines))
+
+            if importer.created:
+                invalidate_scopes(
+                    GLOBAL_SCOPE,
+                    *(game_scope(game_id) for game_id in importer.game_ids),
+                    *(date_scope(date) for date in importer.dates),
+                )
+
+            return Response(report, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error importing game sessions: {e}")
+            return Response(
+                {"error": f"An unexpected error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
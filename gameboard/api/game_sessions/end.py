@@ -1,16 +1,21 @@
+import uuid
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from django.utils.timezone import now
-from django.db import transaction
-
-from gameboard.games.models import GameSession
+from gameboard.api.leaderboard.cache import GLOBAL_SCOPE, date_scope, game_scope
+from gameboard.api.response_cache import invalidate_scopes
+from gameboard.games.metadata import contestant_metadata, game_metadata
+from gameboard.games.scores import session_date
+from gameboard.games.sessions import end_session
 
 
 class EndGameSessionView(APIView):
     """
     API to end an active game session for a contestant and save the final score.
+    The session is ended with a single UPDATE (see games/sessions.py) and the
+    game and contestant names come from the in-process metadata cache.
     """
 
     def post(self, request):
@@ -23,6 +28,14 @@ class EndGameSessionView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        try:
+            session_id = uuid.UUID(str(session_id))
+        except ValueError:
+            return Response(
+                {"error": "'session_id' must be a UUID."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         if final_score is None or not isinstance(final_score, int):
             return Response(
                 {"error": "'score' is required and must be an integer."},
@@ -30,33 +43,36 @@ class EndGameSessionView(APIView):
             )
 
         try:
-            with transaction.atomic():
-                session = GameSession.objects.select_for_update().get(
-                    id=session_id, end_time__isnull=True
-                )
-                session.end_time = now()
-                session.score = final_score
-                session.save()
-        except GameSession.DoesNotExist:
-            return Response(
-                {"error": f"No active session found with id '{session_id}'."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+            session = end_session(session_id, final_score)
         except Exception as e:
             return Response(
                 {"error": f"An unexpected error occurred: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        if session is None:
+            return Response(
+                {"error": f"No active session found with id '{session_id}'."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        invalidate_scopes(
+            GLOBAL_SCOPE,
+            game_scope(session["game_id"]),
+            date_scope(session_date(session["start_time"])),
+        )
+
+        game = game_metadata.get(session["game_id"])
+        contestant = contestant_metadata.get(session["contestant_id"])
         return Response(
             {
                 "message": "Game session ended successfully.",
-                "session_id": session.id,
-                "contestant": session.contestant.name,
-                "game": session.game.name,
-                "start_time": session.start_time,
-                "end_time": session.end_time,
-                "final_score": session.score,
+                "session_id": session_id,
+                "contestant": contestant["name"] if contestant else None,
+                "game": game["name"] if game else None,
+                "start_time": session["start_time"],
+                "end_time": session["end_time"],
+                "final_score": session["score"],
             },
             status=status.HTTP_200_OK,
         )
@@ -0,0 +1,53 @@
+import uuid
+
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.utils.dateparse import parse_datetime
+
+from gameboard.api.export import BaseExportView
+from gameboard.games.models import GameSession
+
+
+class GameSessionExportView(BaseExportView):
+    """
+    View to export game session history, optionally filtered by `game_id`,
+    `contestant_id` and a `since`/`until` range on start_time. Rows are
+    ordered by id, which follows creation order.
+    """
+
+    fields = ("id", "game_id", "contestant_id", "start_time", "end_time", "score")
+    filename = "game-sessions"
+
+    def get_rows(self, request, **kwargs):
+        sessions = GameSession.objects.all()
+
+        for param in ("game_id", "contestant_id"):
+            if request.query_params.get(param):
+                try:
+                    value = uuid.UUID(request.query_params[param])
+                except ValueError:
+                    return Response(
+                        {"error": f"'{param}' must be a UUID."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                sessions = sessions.filter(**{param: value})
+
+        for param, lookup in (
+            ("since", "start_time__gte"),
+            ("until", "start_time__lt"),
+        ):
+            if request.query_params.get(param):
+                value = parse_datetime(request.query_params[param])
+                if value is None:
+                    return Response(
+                        {"error": f"'{param}' must be an ISO 8601 datetime."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                sessions = sessions.filter(**{lookup: value})
+
+        return (
+            sessions.order_by("id")
+            .values_list(*self.fields)
+            .iterator(chunk_size=self.chunk_size)
+        )
@@ -1,15 +1,25 @@
+import uuid
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+
+from functools import partial
+
 from django.utils.timezone import now
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
-from gameboard.games.models import Game, Contestant, GameSession
+from gameboard.games.live import change_live_players
+from gameboard.games.metadata import contestant_metadata, game_metadata
+from gameboard.games.models import GameSession
 
 
 class StartGameSessionView(APIView):
     """
     API to start a game session for a contestant.
+    Game and contestant are validated from the in-process metadata cache and the
+    session is created with a single INSERT; the unique_open_session constraint
+    rejects a second ongoing session, so concurrent starts cannot both succeed.
     """
 
     def post(self, request):
@@ -23,46 +33,54 @@ class StartGameSessionView(APIView):
             )
 
         try:
-            game = Game.objects.get(id=game_id)
-        except Game.DoesNotExist:
+            game_id = uuid.UUID(str(game_id))
+            contestant_id = uuid.UUID(str(contestant_id))
+        except ValueError:
+            return Response(
+                {"error": "'game_id' and 'contestant_id' must be UUIDs."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        game = game_metadata.get(game_id)
+        if game is None:
             return Response(
                 {"error": f"Game with id '{game_id}' not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        if not game["is_active"]:
+            return Response(
+                {"error": f"Game '{game['name']}' is not active."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        try:
-            contestant = Contestant.objects.get(id=contestant_id)
-            if not contestant.is_active:
-                return Response(
-                    {"error": f"Contestant '{contestant.name}' is not active."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        except Contestant.DoesNotExist:
+        contestant = contestant_metadata.get(contestant_id)
+        if contestant is None:
             return Response(
                 {"error": f"Contestant with id '{contestant_id}' not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-
-        # Check if contestant already has an ongoing session in this game
-        ongoing_session = GameSession.objects.filter(
-            game=game,
-            contestant=contestant,
-            end_time__isnull=True,
-        ).exists()
-
-        if ongoing_session:
+        if not contestant["is_active"]:
             return Response(
-                {
-                    "error": f"Contestant '{contestant.name}' already has an ongoing session in game '{game.name}'."
-                },
+                {"error": f"Contestant '{contestant['name']}' is not active."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         try:
-            session = GameSession.objects.create(
-                game=game, contestant=contestant, start_time=now()
-            )
+            with transaction.atomic():
+                session = GameSession.objects.create(
+                    game_id=game_id, contestant_id=contestant_id, start_time=now()
+                )
+                transaction.on_commit(partial(change_live_players, game_id, 1))
         except IntegrityError as e:
+            if GameSession.objects.filter(
+                game_id=game_id, contestant_id=contestant_id, end_time__isnull=True
+            ).exists():
+                return Response(
+                    {
+                        "error": f"Contestant '{contestant['name']}' already has an ongoing session in game '{game['name']}'."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
                 {"error": f"Failed to create game session: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,8 +95,8 @@ class StartGameSessionView(APIView):
             {
                 "message": "Game session started successfully.",
                 "session_id": session.id,
-                "contestant": contestant.name,
-                "game": game.name,
+                "contestant": contestant["name"],
+                "game": game["name"],
                 "start_time": session.start_time,
             },
             status=status.HTTP_201_CREATED,
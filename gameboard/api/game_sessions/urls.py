@@ -3,6 +3,8 @@ from django.urls import path
 from .start import StartGameSessionView
 from .end import EndGameSessionView
 from .details import GameSessionDetailsView
+from .bulk import BulkGameSessionsView
+from .export import GameSessionExportView
 
 urlpatterns = [
     path(
@@ -11,6 +13,8 @@ urlpatterns = [
         name="start-game-session",
     ),
     path("end/", EndGameSessionView.as_view(), name="end-game-session"),
+    path("bulk/", BulkGameSessionsView.as_view(), name="bulk-game-sessions"),
+    path("export/", GameSessionExportView.as_view(), name="game-sessions-export"),
     path(
         "<uuid:session_id>/",
         GameSessionDetailsView.as_view(),
@@ -2,9 +2,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from functools import partial
+
 from django.utils.timezone import now
 from django.db import transaction
 
+from gameboard.api.leaderboard.cache import game_scope
+from gameboard.api.response_cache import invalidate_scopes
+from gameboard.games.live import change_live_players
+from gameboard.games.metadata import game_metadata
 from gameboard.games.models import Game, GameSession
 
 
@@ -34,9 +40,14 @@ class DeleteGameView(APIView):
                 game.save()
 
                 # End all ongoing game sessions
-                GameSession.objects.filter(game=game, end_time__isnull=True).update(
-                    end_time=now()
+                ended_sessions = GameSession.objects.filter(
+                    game=game, end_time__isnull=True
+                ).update(end_time=now())
+                transaction.on_commit(
+                    partial(change_live_players, game.id, -ended_sessions)
                 )
+                transaction.on_commit(partial(invalidate_scopes, game_scope(game.id)))
+                transaction.on_commit(partial(game_metadata.invalidate, game.id))
 
             return Response(
                 {"message": f"Game '{game.name}' has been deleted."},
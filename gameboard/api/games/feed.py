@@ -0,0 +1,22 @@
+from rest_framework.response import Response
+from rest_framework import status
+
+from gameboard.api.feed import BaseFeedView
+from gameboard.games.feed import PopularityFeed
+from gameboard.games.models import PopularityProfile
+
+
+class GamePopularityFeedView(BaseFeedView):
+    """
+    View streaming top-N changes of the popularity ranking for a weight profile
+    (`?profile=`, default "default"), published on every popularity refresh.
+    """
+
+    async def get_feed(self, request):
+        profile = request.query_params.get("profile", "default")
+        if not await PopularityProfile.objects.filter(name=profile).aexists():
+            return Response(
+                {"error": f"Popularity profile '{profile}' not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return PopularityFeed(profile)
@@ -3,67 +3,79 @@ import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 
-from django.core.cache import cache
+from redis.exceptions import RedisError
+
+from django.utils.dateparse import parse_date
 from django.utils.timezone import now
 
-from gameboard.games.models import GamePopularity
+from gameboard.api.pagination import KeysetPagination
+from gameboard.games.leaderboard import LeaderboardPageSource, LeaderboardUnavailable
+from gameboard.games.popularity import PopularityRanking, overlay_cached_scores
 
 logger = logging.getLogger(__name__)
 
 
-class GamePopularityPagination(PageNumberPagination):
+class GamePopularityPagination(KeysetPagination):
     """Custom pagination for game popularity rankings."""
 
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+    cursor_ordering = ("-popularity_score", "-game_id")
 
 
 class GamePopularityView(APIView):
     """
     API to fetch the cached popularity index of all games.
-    Supports filtering by date, pagination, and continuous ranking.
+    Supports filtering by date and weight profile, pagination, and continuous ranking.
+    Pages come from the Redis ranking of the profile and date; when it is
+    unavailable they are read from the database and only the rows of the
+    page get the latest cached scores, with one get_many.
     """
 
     pagination_class = GamePopularityPagination
 
     def get(self, request):
         try:
-            date_str = request.query_params.get("date", now().date().isoformat())
-
-            popularity_query = (
-                GamePopularity.objects.select_related("game")
-                .filter(date=date_str)
-                .order_by("-popularity_score")
-                .values("game_id", "game__name", "popularity_score")
+            date = parse_date(
+                request.query_params.get("date", now().date().isoformat())
             )
-
-            if not popularity_query:
+            if not date:
                 return Response(
-                    {"message": "No popularity data found for this date."},
-                    status=status.HTTP_200_OK,
-                )
-
-            for entry in popularity_query:
-                cache_key = f"game_{entry['game_id']}_score"
-                entry["popularity_score"] = cache.get(
-                    cache_key, entry["popularity_score"]
+                    {"error": "Invalid date format."},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
+            profile = request.query_params.get("profile", "default")
 
+            ranking = PopularityRanking(profile, date)
             paginator = self.pagination_class()
-            paginated_results = paginator.paginate_queryset(popularity_query, request)
+            try:
+                paginated_results = paginator.paginate_queryset(
+                    LeaderboardPageSource(ranking), request, view=self
+                )
+            except (LeaderboardUnavailable, RedisError) as e:
+                logger.warning(f"Serving game popularity from database: {e}")
+                paginated_results = paginator.paginate_queryset(
+                    ranking.database_queryset(), request, view=self
+                )
+                overlay_cached_scores(paginated_results, profile)
 
-            page_number = paginator.page.number
-            page_size = paginator.page.paginator.per_page
-            start_rank = (page_number - 1) * page_size + 1
+            if not paginated_results:
+                return Response(
+                    {"message": "No popularity data found for this date."},
+                    status=status.HTTP_200_OK,
+                )
 
+            start_rank = paginator.get_start_rank()
             for rank, entry in enumerate(paginated_results, start=start_rank):
                 entry["rank"] = rank
 
             return paginator.get_paginated_response({"games": paginated_results})
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error fetching game popularity data: {e}")
             return Response(
@@ -1,12 +1,13 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 from django.db.models import F
+from gameboard.api.pagination import KeysetPagination
 from gameboard.games.models import Game, GameSession
 
 
-class ListGameSessionsPagination(PageNumberPagination):
+class ListGameSessionsPagination(KeysetPagination):
     """
     Custom pagination for game sessions.
     """
@@ -14,6 +15,7 @@ class ListGameSessionsPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+    cursor_ordering = ("-start_time", "-id")
 
 
 class ListGameSessionsView(APIView, ListGameSessionsPagination):
@@ -33,7 +35,7 @@ class ListGameSessionsView(APIView, ListGameSessionsPagination):
                 GameSession.objects.filter(game_id=game_id)
                 .select_related("contestant")
                 .annotate(contestant_name=F("contestant__name"))
-                .order_by("-start_time")
+                .order_by("-start_time", "-id")
             )
 
             paginated_sessions = self.paginate_queryset(sessions, request, view=self)
@@ -57,6 +59,8 @@ class ListGameSessionsView(APIView, ListGameSessionsPagination):
 
             return self.get_paginated_response(session_data)
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             return Response(
                 {"error": f"An error occurred: {str(e)}"},
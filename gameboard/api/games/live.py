@@ -0,0 +1,34 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from gameboard.games.live import current_player_count
+from gameboard.games.models import Game
+
+
+class GameLiveView(APIView):
+    """
+    API to get the number of contestants playing a game right now.
+    Reads the live counter instead of counting open sessions.
+    """
+
+    def get(self, request, game_id):
+        try:
+            if not Game.objects.filter(id=game_id).exists():
+                return Response(
+                    {"error": "Game not found."}, status=status.HTTP_404_NOT_FOUND
+                )
+
+            return Response(
+                {
+                    "game_id": str(game_id),
+                    "current_players": current_player_count(game_id),
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
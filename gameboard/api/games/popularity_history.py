@@ -0,0 +1,121 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from gameboard.games.history import (
+    MAX_POINTS,
+    RESOLUTION_NAMES,
+    pick_resolution,
+    popularity_curve,
+)
+from gameboard.games.metadata import game_metadata
+
+DEFAULT_RANGE = timedelta(days=7)
+
+
+def parse_moment(value):
+    """Parse an ISO 8601 datetime or date (as midnight UTC); None if invalid."""
+    try:
+        # Well formatted but impossible values (e.g. 2024-02-30) raise ValueError
+        moment = parse_datetime(value) or parse_date(value)
+    except ValueError:
+        return None
+    if moment is None:
+        return None
+    if not isinstance(moment, datetime):
+        moment = datetime.combine(moment, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, dt_timezone.utc)
+    return moment
+
+
+class GamePopularityHistoryView(APIView):
+    """
+    API to get a game's popularity curve over a `since`/`until` range (ISO 8601
+    dates or datetimes, default: the last 7 days) for one `profile`.
+    The `resolution` (5m, 1h or 1d) defaults to the finest one still retained
+    that fits the range in MAX_POINTS buckets.
+    """
+
+    def get(self, request, game_id):
+        try:
+            if game_metadata.get(game_id) is None:
+                return Response(
+                    {"error": "Game not found."}, status=status.HTTP_404_NOT_FOUND
+                )
+
+            until = timezone.now()
+            if request.query_params.get("until"):
+                until = parse_moment(request.query_params["until"])
+            try:
+                since = until - DEFAULT_RANGE if until else None
+            except OverflowError:
+                return Response(
+                    {"error": "'until' is out of range."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if request.query_params.get("since"):
+                since = parse_moment(request.query_params["since"])
+            if since is None or until is None:
+                return Response(
+                    {"error": "'since' and 'until' must be ISO 8601 datetimes."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if since >= until:
+                return Response(
+                    {"error": "'since' must be before 'until'."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            resolution_name = request.query_params.get("resolution")
+            if resolution_name:
+                resolution = RESOLUTION_NAMES.get(resolution_name)
+                if resolution is None:
+                    return Response(
+                        {
+                            "error": "'resolution' must be one of "
+                            f"{', '.join(RESOLUTION_NAMES)}."
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if (until - since).total_seconds() / resolution > MAX_POINTS:
+                    return Response(
+                        {
+                            "error": f"The range spans more than {MAX_POINTS} "
+                            f"buckets at resolution {resolution_name}."
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            else:
+                resolution = pick_resolution(since, until)
+                resolution_name = next(
+                    name
+                    for name, value in RESOLUTION_NAMES.items()
+                    if value == resolution
+                )
+
+            profile = request.query_params.get("profile", "default")
+            points = popularity_curve(game_id, profile, since, until, resolution)
+
+            return Response(
+                {
+                    "game_id": str(game_id),
+                    "profile": profile,
+                    "resolution": resolution_name,
+                    "since": since,
+                    "until": until,
+                    "points": points,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
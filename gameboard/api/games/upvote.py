@@ -1,37 +1,56 @@
+import logging
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from django.db import transaction
+from redis.exceptions import RedisError
+
+from django.conf import settings
+from django.db.models import F
 
 from gameboard.games.models import Game
+from gameboard.games.upvotes import buffer_upvote
+
+logger = logging.getLogger(__name__)
 
 
 class UpvoteGameView(APIView):
     """
     API to upvote a game.
+    With UPVOTES_WRITE_BEHIND the upvote is buffered in Redis and flushed to the
+    game row by a periodic task; otherwise (or if Redis is unavailable) the row
+    is incremented in place with an atomic F() update.
     """
 
     def post(self, request, game_id):
         try:
-            with transaction.atomic():
-                game = (
-                    Game.objects.filter(id=game_id, is_active=True)
-                    .select_for_update()
-                    .first()
+            game = (
+                Game.objects.filter(id=game_id, is_active=True)
+                .only("id", "name", "upvotes")
+                .first()
+            )
+
+            if not game:
+                return Response(
+                    {"error": "Game not found or inactive."},
+                    status=status.HTTP_404_NOT_FOUND,
                 )
 
-                if not game:
-                    return Response(
-                        {"error": "Game not found or inactive."},
-                        status=status.HTTP_404_NOT_FOUND,
-                    )
+            upvotes = None
+            if settings.UPVOTES_WRITE_BEHIND:
+                try:
+                    upvotes = game.upvotes + buffer_upvote(game.id)
+                except RedisError as e:
+                    logger.warning(f"Upvoting game {game.id} in database: {e}")
 
-                game.upvotes = game.upvotes + 1
-                game.save(update_fields=["upvotes"])
+            if upvotes is None:
+                Game.objects.filter(id=game.id).update(upvotes=F("upvotes") + 1)
+                game.refresh_from_db(fields=["upvotes"])
+                upvotes = game.upvotes
 
             return Response(
-                {"message": f"Upvoted game '{game.name}'.", "upvotes": game.upvotes},
+                {"message": f"Upvoted game '{game.name}'.", "upvotes": upvotes},
                 status=status.HTTP_200_OK,
             )
 
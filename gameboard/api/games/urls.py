@@ -7,6 +7,9 @@ from .list import ListGamesView
 from .upvote import UpvoteGameView
 from .list_sessions import ListGameSessionsView
 from .game_popularity_index import GamePopularityView
+from .live import GameLiveView
+from .feed import GamePopularityFeedView
+from .popularity_history import GamePopularityHistoryView
 
 urlpatterns = [
     path("", ListGamesView.as_view(), name="list-games"),
@@ -19,9 +22,20 @@ urlpatterns = [
         ListGameSessionsView.as_view(),
         name="list-game-sessions",
     ),
+    path("<uuid:game_id>/live/", GameLiveView.as_view(), name="game-live"),
+    path(
+        "<uuid:game_id>/popularity-history/",
+        GamePopularityHistoryView.as_view(),
+        name="game-popularity-history",
+    ),
     path(
         "popularity-leaderboard/",
         GamePopularityView.as_view(),
         name="popularity-leaderboard",
     ),
+    path(
+        "popularity-leaderboard/feed/",
+        GamePopularityFeedView.as_view(),
+        name="popularity-leaderboard-feed",
+    ),
 ]
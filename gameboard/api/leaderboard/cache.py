@@ -0,0 +1,24 @@
+"""
+Response cache scopes for the leaderboard views. Ending a session invalidates
+the global, game and date scopes it touched; see gameboard/api/response_cache.py.
+"""
+
+from django.utils.dateparse import parse_date
+
+GLOBAL_SCOPE = "leaderboard:global"
+
+
+def game_scope(game_id):
+    return f"leaderboard:game:{game_id}"
+
+
+def date_scope(date):
+    return f"leaderboard:date:{date.isoformat()}"
+
+
+def date_request_scope(request):
+    try:
+        date = parse_date(request.query_params.get("date", ""))
+    except ValueError:
+        return None
+    return date_scope(date) if date else None
@@ -0,0 +1,20 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from gameboard.api.response_cache import response_cache_stats
+
+
+class ResponseCacheStatsView(APIView):
+    """
+    View to get the response cache hit ratio and recompute time per cached view.
+    """
+
+    def get(self, request):
+        try:
+            return Response(response_cache_stats(), status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -0,0 +1,121 @@
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from redis.exceptions import RedisError
+
+from django.utils.dateparse import parse_date
+
+from gameboard.games.leaderboard import (
+    DateLeaderboard,
+    GameLeaderboard,
+    GlobalLeaderboard,
+    LeaderboardUnavailable,
+)
+from gameboard.games.models import Contestant, Game
+
+logger = logging.getLogger(__name__)
+
+
+class BaseContestantRankView(APIView):
+    """
+    Base view returning a contestant's rank, total score and the `window`
+    neighbours above and below them on a leaderboard.
+    """
+
+    default_window = 5
+    max_window = 50
+
+    def get_leaderboard(self, request, **kwargs):
+        raise NotImplementedError
+
+    def get_window(self, request):
+        window = int(request.query_params.get("window", self.default_window))
+        return min(max(window, 0), self.max_window)
+
+    def get(self, request, contestant_id, **kwargs):
+        try:
+            try:
+                window = self.get_window(request)
+            except ValueError:
+                return Response(
+                    {"error": "'window' must be an integer."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            leaderboard = self.get_leaderboard(request, **kwargs)
+            if isinstance(leaderboard, Response):
+                return leaderboard
+
+            try:
+                result = leaderboard.rank(contestant_id, window)
+            except (LeaderboardUnavailable, RedisError) as e:
+                logger.warning(f"Serving rank for {contestant_id} from database: {e}")
+                result = leaderboard.database_rank(contestant_id, window)
+
+            if result is None:
+                if not Contestant.objects.filter(id=contestant_id).exists():
+                    return Response(
+                        {"error": "Contestant not found."},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+                return Response(
+                    {"message": "Contestant has no score on this leaderboard."},
+                    status=status.HTTP_200_OK,
+                )
+
+            return Response(result, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error fetching contestant rank: {e}")
+            return Response(
+                {"error": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class GlobalRankView(BaseContestantRankView):
+    """
+    View to get a contestant's rank on the global leaderboard.
+    """
+
+    def get_leaderboard(self, request, **kwargs):
+        return GlobalLeaderboard()
+
+
+class GameRankView(BaseContestantRankView):
+    """
+    View to get a contestant's rank on a game leaderboard.
+    """
+
+    def get_leaderboard(self, request, game_id):
+        if not Game.objects.filter(id=game_id).exists():
+            return Response(
+                {"error": "Game not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return GameLeaderboard(game_id)
+
+
+class DateRankView(BaseContestantRankView):
+    """
+    View to get a contestant's rank on the leaderboard for a specific date.
+    """
+
+    def get_leaderboard(self, request, **kwargs):
+        date_str = request.query_params.get("date")
+        if not date_str:
+            return Response(
+                {"error": "Date parameter is required (YYYY-MM-DD)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        date = parse_date(date_str)
+        if not date:
+            return Response(
+                {"error": "Invalid date format."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return DateLeaderboard(date)
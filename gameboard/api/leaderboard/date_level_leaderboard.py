@@ -1,32 +1,37 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 
-from django.db.models import Sum
 from django.utils.dateparse import parse_date
-from gameboard.games.models import GameSession
+from gameboard.api.leaderboard.cache import date_request_scope
+from gameboard.api.pagination import KeysetPagination
+from gameboard.api.response_cache import cached_response
+from gameboard.games.models import ContestantDailyScore
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class DateLeaderboardPagination(PageNumberPagination):
+class DateLeaderboardPagination(KeysetPagination):
     """Custom pagination for date-level leaderboard views."""
 
     page_size = 10  # Default to 10 results per page
     page_size_query_param = "page_size"
     max_page_size = 100
+    cursor_ordering = ("-total_score", "-contestant")
 
 
 class DateLeaderboardView(APIView):
     """
     View to get leaderboard for a specific date.
+    Responses are cached briefly and invalidated when a session on that date ends.
     """
 
     pagination_class = DateLeaderboardPagination
 
+    @cached_response(date_request_scope)
     def get(self, request):
         try:
             date_str = request.query_params.get("date")
@@ -44,13 +49,12 @@ class DateLeaderboardView(APIView):
                 )
 
             leaderboard_query = (
-                GameSession.objects.filter(start_time__date=date)
-                .values("contestant", "contestant__name")
-                .annotate(total_score=Sum("score"))
-                .order_by("-total_score")
+                ContestantDailyScore.objects.filter(date=date)
+                .values("contestant", "contestant__name", "total_score")
+                .order_by("-total_score", "-contestant")
             )
 
-            if not leaderboard_query:
+            if not leaderboard_query.exists():
                 return Response(
                     {"message": "No leaderboard data found for the specified date."},
                     status=status.HTTP_200_OK,
@@ -68,14 +72,14 @@ class DateLeaderboardView(APIView):
                 )
 
             # Calculate the starting rank for the current page
-            page_number = paginator.page.number
-            page_size = paginator.page.paginator.per_page
-            start_rank = (page_number - 1) * page_size + 1
+            start_rank = paginator.get_start_rank()
             for rank, entry in enumerate(paginated_leaderboard, start=start_rank):
                 entry["rank"] = rank
 
             return paginator.get_paginated_response(paginated_leaderboard)
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error fetching date-level leaderboard: {e}")
             return Response(
@@ -0,0 +1,88 @@
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.utils.dateparse import parse_date
+
+from gameboard.api.export import BaseExportView
+from gameboard.games.leaderboard import (
+    DateLeaderboard,
+    GameLeaderboard,
+    GlobalLeaderboard,
+)
+from gameboard.games.models import Game
+
+
+class BaseLeaderboardExportView(BaseExportView):
+    """
+    Base view streaming a full leaderboard from the database, in leaderboard order.
+    """
+
+    fields = ("rank", "contestant_id", "contestant_name", "total_score")
+
+    def get_leaderboard(self, request, **kwargs):
+        raise NotImplementedError
+
+    def get_rows(self, request, **kwargs):
+        leaderboard = self.get_leaderboard(request, **kwargs)
+        if isinstance(leaderboard, Response):
+            return leaderboard
+
+        rows = (
+            leaderboard.database_queryset()
+            .values_list("contestant_id", "contestant__name", "total_score")
+            .iterator(chunk_size=self.chunk_size)
+        )
+        return ((rank, *row) for rank, row in enumerate(rows, start=1))
+
+
+class GlobalLeaderboardExportView(BaseLeaderboardExportView):
+    """
+    View to export the global leaderboard.
+    """
+
+    filename = "leaderboard"
+
+    def get_leaderboard(self, request, **kwargs):
+        return GlobalLeaderboard()
+
+
+class GameLeaderboardExportView(BaseLeaderboardExportView):
+    """
+    View to export a game leaderboard.
+    """
+
+    def get_filename(self, request, game_id):
+        return f"leaderboard-game-{game_id}"
+
+    def get_leaderboard(self, request, game_id):
+        if not Game.objects.filter(id=game_id).exists():
+            return Response(
+                {"error": "Game not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return GameLeaderboard(game_id)
+
+
+class DateLeaderboardExportView(BaseLeaderboardExportView):
+    """
+    View to export the leaderboard for a specific date.
+    """
+
+    def get_filename(self, request, **kwargs):
+        return f"leaderboard-date-{request.query_params.get('date')}"
+
+    def get_leaderboard(self, request, **kwargs):
+        date_str = request.query_params.get("date")
+        if not date_str:
+            return Response(
+                {"error": "Date parameter is required (YYYY-MM-DD)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        date = parse_date(date_str)
+        if not date:
+            return Response(
+                {"error": "Invalid date format."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return DateLeaderboard(date)
@@ -0,0 +1,50 @@
+from rest_framework.response import Response
+from rest_framework import status
+
+from django.utils.dateparse import parse_date
+
+from gameboard.api.feed import BaseFeedView
+from gameboard.games.feed import LeaderboardFeed
+from gameboard.games.leaderboard import (
+    DateLeaderboard,
+    GameLeaderboard,
+    GlobalLeaderboard,
+)
+from gameboard.games.models import Game
+
+
+class GlobalLeaderboardFeedView(BaseFeedView):
+    """
+    View streaming top-N changes of the global leaderboard.
+    """
+
+    async def get_feed(self, request):
+        return LeaderboardFeed(GlobalLeaderboard())
+
+
+class GameLeaderboardFeedView(BaseFeedView):
+    """
+    View streaming top-N changes of a game's leaderboard.
+    """
+
+    async def get_feed(self, request, game_id):
+        if not await Game.objects.filter(id=game_id).aexists():
+            return Response(
+                {"error": "Game not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        return LeaderboardFeed(GameLeaderboard(game_id))
+
+
+class DateLeaderboardFeedView(BaseFeedView):
+    """
+    View streaming top-N changes of a date's leaderboard.
+    """
+
+    async def get_feed(self, request):
+        date = parse_date(request.query_params.get("date", ""))
+        if not date:
+            return Response(
+                {"error": "Date parameter is required (YYYY-MM-DD)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return LeaderboardFeed(DateLeaderboard(date))
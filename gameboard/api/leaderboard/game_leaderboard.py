@@ -3,41 +3,45 @@ import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 
-from django.db.models import Sum
-from gameboard.games.models import GameSession, Game
+from gameboard.api.leaderboard.cache import game_scope
+from gameboard.api.pagination import KeysetPagination
+from gameboard.api.response_cache import cached_response
+from gameboard.games.models import ContestantGameScore, Game
 
 logger = logging.getLogger(__name__)
 
 
-class GameLeaderboardPagination(PageNumberPagination):
+class GameLeaderboardPagination(KeysetPagination):
     """Custom pagination for game-wise leaderboard views."""
 
     page_size = 10  # Default to 10 results per page
     page_size_query_param = "page_size"
     max_page_size = 100
+    cursor_ordering = ("-total_score", "-contestant")
 
 
 class GameLeaderboardView(APIView):
     """
     View to get the game-wise leaderboard with pagination.
+    Responses are cached briefly and invalidated when a session of the game ends.
     """
 
     pagination_class = GameLeaderboardPagination
 
+    @cached_response(lambda request, game_id: game_scope(game_id))
     def get(self, request, game_id):
         try:
             game = Game.objects.get(id=game_id)
 
             leaderboard_query = (
-                GameSession.objects.filter(game=game)
-                .values("contestant", "contestant__name")
-                .annotate(total_score=Sum("score"))
-                .order_by("-total_score")
+                ContestantGameScore.objects.filter(game=game)
+                .values("contestant", "contestant__name", "total_score")
+                .order_by("-total_score", "-contestant")
             )
 
-            if not leaderboard_query:
+            if not leaderboard_query.exists():
                 return Response(
                     {"message": "No leaderboard data found for the specified game."},
                     status=status.HTTP_200_OK,
@@ -49,9 +53,7 @@ class GameLeaderboardView(APIView):
             )
 
             # Calculate the starting rank for the current page
-            page_number = paginator.page.number
-            page_size = paginator.page.paginator.per_page
-            start_rank = (page_number - 1) * page_size + 1
+            start_rank = paginator.get_start_rank()
 
             # Add ranks to the paginated leaderboard
             for rank, entry in enumerate(paginated_leaderboard, start=start_rank):
@@ -66,6 +68,8 @@ class GameLeaderboardView(APIView):
                 {"error": "Game not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error fetching game leaderboard: {e}")
             return Response(
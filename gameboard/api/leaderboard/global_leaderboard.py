@@ -3,52 +3,63 @@ import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
 
-from django.db.models import Sum
-from gameboard.games.models import GameSession
+from redis.exceptions import RedisError
+
+from gameboard.api.leaderboard.cache import GLOBAL_SCOPE
+from gameboard.api.pagination import KeysetPagination
+from gameboard.api.response_cache import cached_response
+from gameboard.games.leaderboard import (
+    GlobalLeaderboard,
+    LeaderboardPageSource,
+    LeaderboardUnavailable,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class GlobalLeaderboardPagination(PageNumberPagination):
+class GlobalLeaderboardPagination(KeysetPagination):
     """Custom pagination for leaderboard views."""
 
     page_size = 10  # Default to 10 results per page
     page_size_query_param = "page_size"
     max_page_size = 100
+    cursor_ordering = ("-total_score", "-contestant_id")
 
 
 class GlobalLeaderboardView(APIView):
     """
     View to get the global leaderboard with pagination.
+    Served from the Redis sorted set, falling back to the database if it is unavailable.
+    Responses are cached briefly and invalidated when a session ends.
     """
 
     pagination_class = GlobalLeaderboardPagination
 
+    @cached_response(lambda request: GLOBAL_SCOPE)
     def get(self, request):
         try:
-            leaderboard_query = (
-                GameSession.objects.values("contestant_id", "contestant__name")
-                .annotate(total_score=Sum("score"))
-                .order_by("-total_score")
-            )
+            leaderboard = GlobalLeaderboard()
+            paginator = self.pagination_class()
+            try:
+                paginated_leaderboard = paginator.paginate_queryset(
+                    LeaderboardPageSource(leaderboard), request
+                )
+            except (LeaderboardUnavailable, RedisError) as e:
+                logger.warning(f"Serving global leaderboard from database: {e}")
+                paginated_leaderboard = paginator.paginate_queryset(
+                    leaderboard.database_queryset(), request
+                )
 
-            if not leaderboard_query:
+            if not paginated_leaderboard:
                 return Response(
                     {"message": "No leaderboard data found."},
                     status=status.HTTP_200_OK,
                 )
 
-            paginator = self.pagination_class()
-            paginated_leaderboard = paginator.paginate_queryset(
-                leaderboard_query, request
-            )
-
             # Calculate the starting rank for the current page
-            page_number = paginator.page.number
-            page_size = paginator.page.paginator.per_page
-            start_rank = (page_number - 1) * page_size + 1
+            start_rank = paginator.get_start_rank()
 
             for rank, entry in enumerate(paginated_leaderboard, start=start_rank):
                 entry["rank"] = rank
@@ -57,6 +68,8 @@ class GlobalLeaderboardView(APIView):
                 {"leaderboard": paginated_leaderboard}
             )
 
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error fetching global leaderboard: {e}")
             return Response(
@@ -5,6 +5,19 @@ from .game_leaderboard import GameLeaderboardView
 from .date_level_leaderboard import (
     DateLeaderboardView,
 )
+from .contestant_rank import DateRankView, GameRankView, GlobalRankView
+from .cache_stats import ResponseCacheStatsView
+from .window_leaderboard import GameWindowLeaderboardView, WindowLeaderboardView
+from .feed import (
+    DateLeaderboardFeedView,
+    GameLeaderboardFeedView,
+    GlobalLeaderboardFeedView,
+)
+from .export import (
+    DateLeaderboardExportView,
+    GameLeaderboardExportView,
+    GlobalLeaderboardExportView,
+)
 
 urlpatterns = [
     path("", GlobalLeaderboardView.as_view(), name="global-leaderboard"),
@@ -12,4 +25,44 @@ urlpatterns = [
         "game/<uuid:game_id>/", GameLeaderboardView.as_view(), name="game-leaderboard"
     ),
     path("date/", DateLeaderboardView.as_view(), name="date-leaderboard"),
+    path("window/", WindowLeaderboardView.as_view(), name="window-leaderboard"),
+    path(
+        "game/<uuid:game_id>/window/",
+        GameWindowLeaderboardView.as_view(),
+        name="game-window-leaderboard",
+    ),
+    path("feed/", GlobalLeaderboardFeedView.as_view(), name="global-leaderboard-feed"),
+    path(
+        "game/<uuid:game_id>/feed/",
+        GameLeaderboardFeedView.as_view(),
+        name="game-leaderboard-feed",
+    ),
+    path("date/feed/", DateLeaderboardFeedView.as_view(), name="date-leaderboard-feed"),
+    path(
+        "export/",
+        GlobalLeaderboardExportView.as_view(),
+        name="global-leaderboard-export",
+    ),
+    path(
+        "game/<uuid:game_id>/export/",
+        GameLeaderboardExportView.as_view(),
+        name="game-leaderboard-export",
+    ),
+    path(
+        "date/export/",
+        DateLeaderboardExportView.as_view(),
+        name="date-leaderboard-export",
+    ),
+    path("rank/<uuid:contestant_id>/", GlobalRankView.as_view(), name="global-rank"),
+    path(
+        "rank/<uuid:contestant_id>/game/<uuid:game_id>/",
+        GameRankView.as_view(),
+        name="game-rank",
+    ),
+    path("rank/<uuid:contestant_id>/date/", DateRankView.as_view(), name="date-rank"),
+    path(
+        "cache-stats/",
+        ResponseCacheStatsView.as_view(),
+        name="leaderboard-cache-stats",
+    ),
 ]
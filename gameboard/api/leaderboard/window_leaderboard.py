@@ -0,0 +1,136 @@
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from gameboard.api.leaderboard.cache import GLOBAL_SCOPE, game_scope
+from gameboard.api.pagination import KeysetPagination
+from gameboard.api.response_cache import cached_response
+from gameboard.games.metadata import game_metadata
+from gameboard.games.scores import WINDOWS, window_bounds, window_scores
+
+logger = logging.getLogger(__name__)
+
+
+class WindowLeaderboardPagination(KeysetPagination):
+    """Custom pagination for time-window leaderboard views."""
+
+    page_size = 10  # Default to 10 results per page
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_ordering = ("-total_score", "-contestant")
+
+
+def parse_window(request):
+    """
+    Return (window, start, end) from the `window` (default: week) and `date`
+    (default: today) query parameters, or an error Response.
+    """
+    window = request.query_params.get("window", "week")
+    if window not in WINDOWS:
+        return Response(
+            {"error": f"'window' must be one of {', '.join(WINDOWS)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    date = timezone.localdate()
+    if request.query_params.get("date"):
+        try:
+            date = parse_date(request.query_params["date"])
+        except ValueError:
+            date = None
+        if date is None:
+            return Response(
+                {"error": "Invalid date format (YYYY-MM-DD)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    try:
+        return (window, *window_bounds(window, date))
+    except OverflowError:
+        return Response(
+            {"error": "Date is out of range for this window."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+def window_leaderboard_response(request, view, game_id=None):
+    parsed = parse_window(request)
+    if isinstance(parsed, Response):
+        return parsed
+    window, start, end = parsed
+
+    paginator = view.pagination_class()
+    leaderboard = paginator.paginate_queryset(
+        window_scores(start, end, game_id=game_id), request, view=view
+    )
+    for rank, entry in enumerate(leaderboard, start=paginator.get_start_rank()):
+        entry["rank"] = rank
+
+    return paginator.get_paginated_response(
+        {
+            "window": window,
+            "start_date": start,
+            "end_date": end,
+            "leaderboard": leaderboard,
+        }
+    )
+
+
+class WindowLeaderboardView(APIView):
+    """
+    View to get the leaderboard of a time window: the `day`, `week` or `month`
+    containing `date`, or the `last-7-days` / `last-30-days` ending on it.
+    Totals are summed from the daily score rows of the window.
+    Responses are cached briefly and invalidated when any session ends.
+    """
+
+    pagination_class = WindowLeaderboardPagination
+
+    @cached_response(lambda request: GLOBAL_SCOPE)
+    def get(self, request):
+        try:
+            return window_leaderboard_response(request, self)
+
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error fetching window leaderboard: {e}")
+            return Response(
+                {"error": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class GameWindowLeaderboardView(APIView):
+    """
+    View to get a game's leaderboard for a time window (see WindowLeaderboardView),
+    summed from the game's daily score rows.
+    Responses are cached briefly and invalidated when a session of the game ends.
+    """
+
+    pagination_class = WindowLeaderboardPagination
+
+    @cached_response(lambda request, game_id: game_scope(game_id))
+    def get(self, request, game_id):
+        try:
+            if game_metadata.get(game_id) is None:
+                return Response(
+                    {"error": "Game not found."}, status=status.HTTP_404_NOT_FOUND
+                )
+
+            return window_leaderboard_response(request, self, game_id=game_id)
+
+        except NotFound as e:
+            return Response({"error": e.detail}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error fetching game window leaderboard: {e}")
+            return Response(
+                {"error": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
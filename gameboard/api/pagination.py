@@ -0,0 +1,116 @@
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from gameboard.common.db.keyset import (
+    coerce_key,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    ordering_fields,
+    row_key,
+)
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Page number pagination with an optional keyset (cursor) mode.
+
+    Passing `?pagination=cursor` (or a `cursor` from a previous response)
+    switches to keyset mode: rows are filtered to those after the last row of
+    the previous page according to `cursor_ordering`, so deep pages cost the
+    same as the first and no COUNT(*) query is issued. Cursor responses
+    contain only `next` and `results`.
+
+    `cursor_ordering` is read from the view when present, otherwise from the
+    pagination class, and must be a unique ordering, e.g.
+    ("-total_score", "-contestant"). Cursor keys are converted with the
+    ordering's model fields, so a malformed or tampered cursor is a 404.
+    """
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    cursor_ordering = None
+
+    def is_cursor_mode(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == "cursor"
+        )
+
+    def get_cursor_ordering(self, view):
+        return getattr(view, "cursor_ordering", None) or self.cursor_ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.is_cursor_mode(request)
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.ordering = self.get_cursor_ordering(view)
+        page_size = self.get_page_size(request)
+        self.position, after = self.decode_cursor(request)
+        if after is not None:
+            try:
+                after = coerce_key(self.get_ordering_fields(queryset), after)
+            except ValueError:
+                raise NotFound("Invalid cursor.")
+
+        if hasattr(queryset, "keyset_slice"):
+            rows = queryset.keyset_slice(after, page_size + 1)
+        else:
+            if after is not None:
+                queryset = queryset.filter(self.keyset_filter(after))
+            rows = list(queryset.order_by(*self.ordering)[: page_size + 1])
+
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        return self.rows
+
+    def keyset_filter(self, after):
+        return keyset_filter(self.ordering, after)
+
+    def get_ordering_fields(self, queryset):
+        if hasattr(queryset, "ordering_fields"):
+            return queryset.ordering_fields(self.ordering)
+        return ordering_fields(queryset, self.ordering)
+
+    def get_row_key(self, row):
+        return row_key(row, self.ordering)
+
+    def encode_cursor(self, position, key):
+        return encode_cursor({"p": position, "k": key})
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return 0, None
+        try:
+            payload = decode_cursor(encoded)
+            return int(payload["p"]), payload["k"]
+        except (TypeError, ValueError, KeyError):
+            raise NotFound("Invalid cursor.")
+
+    def get_start_rank(self):
+        """1-based rank of the first row on the current page."""
+        if self.cursor_mode:
+            return self.position + 1
+        return (self.page.number - 1) * self.page.paginator.per_page + 1
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        cursor = self.encode_cursor(
+            self.position + len(self.rows), self.get_row_key(self.rows[-1])
+        )
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "results": data})
@@ -0,0 +1,264 @@
+"""
+Short-lived response cache for read-heavy endpoints.
+
+Responses are cached per view, scope and request (path + query string). Each
+scope, e.g. "game:<id>", has a generation token; invalidating a scope replaces
+its token, which marks every cached response in that scope stale without
+having to find the individual keys.
+
+Fresh entries are served directly. When an entry is expired or invalidated a
+single request (guarded by a cache.add lock) recomputes it while concurrent
+requests keep receiving the stale copy, so a popular page is never recomputed
+by many requests at once. Hits, stale hits, misses and recompute time are
+counted per view in process and added to the shared totals in the cache at
+most every RESPONSE_CACHE_METRICS_INTERVAL seconds, so serving a hit costs no
+extra cache write; `response_cache_stats()` reports the totals.
+
+Tokens, locks and counters are only coordinated across workers when the
+default cache is shared by them (Redis, see CACHES); `check_shared_cache`
+warns when it is per-process.
+"""
+
+from collections import Counter
+import hashlib
+import threading
+import time
+import uuid
+from functools import wraps
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from django.core import checks
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+RESPONSE_CACHE_TIMEOUT = 10  # seconds an entry is fresh
+RESPONSE_CACHE_STALE_TIMEOUT = 30  # extra seconds a stale entry may be served
+RESPONSE_CACHE_LOCK_TIMEOUT = 10
+RESPONSE_CACHE_LOCK_WAIT = 0.5  # seconds to wait for another request's recompute
+RESPONSE_CACHE_POLL_INTERVAL = 0.05
+# Must outlive every entry (timeout + stale timeout): an entry whose generation
+# token has expired is treated as stale
+RESPONSE_CACHE_GENERATION_TIMEOUT = 24 * 60 * 60
+RESPONSE_CACHE_METRICS_INTERVAL = 10  # seconds between writes of a process's counts
+
+METRICS = ("hits", "stale_hits", "misses", "recompute_us")
+
+cached_views = set()
+
+
+def generation_key(scope):
+    return f"response_cache:generation:{scope}"
+
+
+def metric_key(name, metric):
+    return f"response_cache:metrics:{name}:{metric}"
+
+
+def invalidate_scopes(*scopes):
+    """Mark every cached response in the given scopes stale."""
+    cache.set_many(
+        {generation_key(scope): uuid.uuid4().hex for scope in scopes},
+        timeout=RESPONSE_CACHE_GENERATION_TIMEOUT,
+    )
+
+
+def check_shared_cache(app_configs, **kwargs):
+    if isinstance(caches["default"], LocMemCache):
+        return [
+            checks.Warning(
+                "The default cache is per-process, so response cache "
+                "invalidations, recompute locks and stats only cover one worker.",
+                hint="Set CACHE_BACKEND to a shared backend such as RedisCache.",
+                id="gameboard.W001",
+            )
+        ]
+    return []
+
+
+def _incr(key, delta=1):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+class ResponseCacheMetrics:
+    def __init__(self, interval=RESPONSE_CACHE_METRICS_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self.flushed_at = time.monotonic()
+        # Threaded WSGI/ASGI workers count from several threads
+        self.lock = threading.Lock()
+
+    def add(self, name, metric, delta=1):
+        with self.lock:
+            self.counts[(name, metric)] += delta
+            due = time.monotonic() - self.flushed_at >= self.interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Add this process's counts to the shared totals in the cache."""
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.flushed_at = time.monotonic()
+        for (name, metric), delta in counts.items():
+            _incr(metric_key(name, metric), delta)
+
+    def clear(self):
+        with self.lock:
+            self.counts.clear()
+
+
+response_cache_metrics = ResponseCacheMetrics()
+
+
+def response_cache_stats():
+    """
+    Return {view name: metrics} for every cached view, with the hit ratio
+    (stale hits count as hits) and the average recompute time in milliseconds.
+    Other processes' counts from the last RESPONSE_CACHE_METRICS_INTERVAL
+    seconds may not be included yet.
+    """
+    response_cache_metrics.flush()
+    keys = {
+        (name, metric): metric_key(name, metric)
+        for name in sorted(cached_views)
+        for metric in METRICS
+    }
+    values = cache.get_many(keys.values())
+
+    stats = {}
+    for name in sorted(cached_views):
+        counts = {metric: values.get(keys[(name, metric)], 0) for metric in METRICS}
+        requests = counts["hits"] + counts["stale_hits"] + counts["misses"]
+        stats[name] = {
+            "hits": counts["hits"],
+            "stale_hits": counts["stale_hits"],
+            "misses": counts["misses"],
+            "hit_ratio": (
+                round((counts["hits"] + counts["stale_hits"]) / requests, 4)
+                if requests
+                else None
+            ),
+            "avg_recompute_ms": (
+                round(counts["recompute_us"] / counts["misses"] / 1000, 2)
+                if counts["misses"]
+                else None
+            ),
+        }
+    return stats
+
+
+class ResponseCache:
+    def __init__(self, name, scope, timeout, stale_timeout):
+        self.name = name
+        self.scope = scope
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+
+    def entry_key(self, request):
+        digest = hashlib.md5(
+            f"{request.get_host()}{request.get_full_path()}".encode()
+        ).hexdigest()
+        return f"response_cache:{self.name}:{self.scope}:{digest}"
+
+    def respond(self, entry, outcome):
+        response_cache_metrics.add(self.name, outcome)
+        response = Response(entry["data"], status=entry["status"])
+        response["X-Cache"] = "HIT" if outcome == "hits" else "STALE"
+        return response
+
+    def is_fresh(self, entry, generation):
+        return (
+            entry is not None
+            and entry["generation"] == generation
+            and entry["fresh_until"] > time.time()
+        )
+
+    def acquire(self, lock_key):
+        """Single-flight lock: only the request that adds the key recomputes."""
+        return cache.add(lock_key, 1, timeout=RESPONSE_CACHE_LOCK_TIMEOUT)
+
+    def get_or_compute(self, request, compute):
+        entry_key = self.entry_key(request)
+        lock_key = f"{entry_key}:lock"
+        cached = cache.get_many([entry_key, generation_key(self.scope)])
+        entry = cached.get(entry_key)
+        generation = cached.get(generation_key(self.scope))
+
+        if self.is_fresh(entry, generation):
+            return self.respond(entry, "hits")
+
+        if self.acquire(lock_key):
+            try:
+                return self.recompute(entry_key, generation, compute)
+            finally:
+                cache.delete(lock_key)
+
+        if entry is not None:
+            return self.respond(entry, "stale_hits")
+
+        # Nothing to serve yet: give the request holding the lock a moment to finish
+        deadline = time.monotonic() + RESPONSE_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(RESPONSE_CACHE_POLL_INTERVAL)
+            entry = cache.get(entry_key)
+            if entry is not None and entry["generation"] == generation:
+                return self.respond(entry, "hits")
+
+        return self.recompute(entry_key, generation, compute)
+
+    def recompute(self, entry_key, generation, compute):
+        started = time.monotonic()
+        response = compute()
+        elapsed_us = int((time.monotonic() - started) * 1_000_000)
+
+        response_cache_metrics.add(self.name, "misses")
+        response_cache_metrics.add(self.name, "recompute_us", elapsed_us)
+
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(
+                entry_key,
+                {
+                    "data": response.data,
+                    "status": response.status_code,
+                    "generation": generation,
+                    "fresh_until": time.time() + self.timeout,
+                },
+                timeout=self.timeout + self.stale_timeout,
+            )
+        response["X-Cache"] = "MISS"
+        return response
+
+
+def cached_response(
+    scope,
+    timeout=RESPONSE_CACHE_TIMEOUT,
+    stale_timeout=RESPONSE_CACHE_STALE_TIMEOUT,
+):
+    """
+    Cache a view's GET responses. `scope(request, **kwargs)` returns the scope
+    used for invalidation, or None to bypass the cache (e.g. invalid input).
+    Only 200 responses are cached.
+    """
+
+    def decorator(method):
+        name = method.__qualname__.split(".")[0]
+        cached_views.add(name)
+
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            cache_scope = scope(request, *args, **kwargs)
+            if cache_scope is None:
+                return method(view, request, *args, **kwargs)
+            return ResponseCache(
+                name, cache_scope, timeout, stale_timeout
+            ).get_or_compute(request, lambda: method(view, request, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
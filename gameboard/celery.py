@@ -32,6 +32,26 @@ app.conf.beat_schedule = {
         "task": "gameboard.games.tasks.refresh_game_popularity",
         "schedule": 5 * 60,  # Run every 5 minutes
     },
+    "rollup_popularity_history": {
+        "task": "gameboard.games.tasks.rollup_popularity_history",
+        "schedule": 15 * 60,  # Run every 15 minutes
+    },
+    "verify_leaderboards": {
+        "task": "gameboard.games.tasks.verify_leaderboards",
+        "schedule": 60 * 60,  # Run every hour
+    },
+    "reconcile_live_player_counts": {
+        "task": "gameboard.games.tasks.reconcile_live_player_counts",
+        "schedule": 10 * 60,  # Run every 10 minutes
+    },
+    "flush_buffered_upvotes": {
+        "task": "gameboard.games.tasks.flush_buffered_upvotes",
+        "schedule": 5,  # Run every 5 seconds
+    },
+    "publish_leaderboard_feeds": {
+        "task": "gameboard.games.tasks.publish_leaderboard_feeds",
+        "schedule": 2,  # Run every 2 seconds
+    },
 }
 
 app.autodiscover_tasks()
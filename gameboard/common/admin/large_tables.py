@@ -0,0 +1,134 @@
+"""
+Admin changelists for tables with millions of rows.
+
+The stock changelist runs COUNT(*) twice per page (filtered and unfiltered),
+pages with OFFSET and searches with icontains, casting UUIDs to text; all of
+these scan the table. LargeTableModelAdmin instead:
+
+- counts with EstimatedCountPaginator: the planner's row estimate for the
+  unfiltered table on PostgreSQL, otherwise a count capped at COUNT_LIMIT;
+- pages by keyset on `keyset_ordering` ("Next" links carry a cursor), which
+  must be unique and backed by an index; column sorting is disabled;
+- matches a search term that is a UUID exactly against `uuid_search_fields`,
+  and any other term against `search_fields` as usual.
+"""
+
+import uuid
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from gameboard.common.admin.utils import BaseModelAdmin
+from gameboard.common.db.keyset import (
+    coerce_key,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    ordering_fields,
+    row_key,
+)
+
+CURSOR_VAR = "after"
+COUNT_LIMIT = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    count_limit = COUNT_LIMIT
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = table_row_estimate(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.count_limit:
+                return estimate
+        return queryset.order_by()[: self.count_limit + 1].count()
+
+    @property
+    def is_estimate(self):
+        return self.count > self.count_limit
+
+
+def table_row_estimate(model, using):
+    """Row count from PostgreSQL's statistics; None elsewhere or if never analyzed."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class KeysetChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        # Not a field lookup; keep it out of the filters and the other links
+        self.cursor = self.params.pop(CURSOR_VAR, getattr(self, "cursor", None))
+        self.filter_params.pop(CURSOR_VAR, None)
+        return super().get_queryset(request, exclude_parameters)
+
+    def get_ordering(self, request, queryset):
+        return list(self.model_admin.keyset_ordering)
+
+    def get_results(self, request):
+        ordering = self.model_admin.keyset_ordering
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        queryset = self.queryset.order_by(*ordering)
+        if self.cursor:
+            try:
+                after = coerce_key(
+                    ordering_fields(queryset, ordering), decode_cursor(self.cursor)
+                )
+                queryset = queryset.filter(keyset_filter(ordering, after))
+            except (TypeError, ValueError):
+                raise IncorrectLookupParameters
+        rows = list(queryset[: self.list_per_page + 1])
+
+        self.next_page_url = None
+        if len(rows) > self.list_per_page:
+            key = row_key(rows[self.list_per_page - 1], ordering)
+            self.next_page_url = self.get_query_string({CURSOR_VAR: encode_cursor(key)})
+        self.first_page_url = self.get_query_string() if self.cursor else None
+
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.full_result_count = None
+        self.show_admin_actions = True
+        self.result_list = rows[: self.list_per_page]
+        self.can_show_all = False
+        self.multi_page = bool(self.next_page_url or self.cursor)
+        self.paginator = paginator
+
+
+class LargeTableModelAdmin(BaseModelAdmin):
+    keyset_ordering = ("-created_at", "-id")
+    uuid_search_fields = ["id"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    sortable_by = ()
+    change_list_template = "admin/large_table_change_list.html"
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        try:
+            value = uuid.UUID(search_term.strip())
+        except ValueError:
+            return super().get_search_results(request, queryset, search_term)
+
+        condition = Q()
+        for field in self.uuid_search_fields:
+            condition |= Q(**{field: value})
+        return queryset.filter(condition), False
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from functools import lru_cache
 import json
 import pytz
 
@@ -42,10 +43,11 @@ class BaseModelAdmin(admin.ModelAdmin):
         return readonly_fields
 
 
+IST = pytz.timezone("Asia/Kolkata")
+
+
 def datetime_ist(utc_datetime_obj):
-    return utc_datetime_obj.replace(tzinfo=pytz.utc).astimezone(
-        pytz.timezone("Asia/Kolkata")
-    )
+    return utc_datetime_obj.replace(tzinfo=pytz.utc).astimezone(IST)
 
 
 def datetime_format(datetime_obj, output_format="N j, Y, f a"):
@@ -56,8 +58,14 @@ def datetime_format(datetime_obj, output_format="N j, Y, f a"):
 def datetime_format_ist(utc_datetime_obj):
     if not utc_datetime_obj:
         return None
-    ist_datetime_obj = datetime_ist(utc_datetime_obj)
-    return datetime_format(ist_datetime_obj)
+    # The default format stops at minutes, so rows from the same minute share
+    # one conversion and formatting
+    return _minute_format_ist(utc_datetime_obj.replace(second=0, microsecond=0))
+
+
+@lru_cache(maxsize=4096)
+def _minute_format_ist(utc_datetime_obj):
+    return datetime_format(datetime_ist(utc_datetime_obj))
 
 
 def formatted_duration(seconds):
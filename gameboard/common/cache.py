@@ -0,0 +1,53 @@
+"""
+Cache backends that count their calls and time in the per-request stats
+(see timing.py). The async methods of the base backend call these sync ones,
+so they are counted as well.
+"""
+
+import functools
+
+from django.utils.module_loading import import_string
+
+from gameboard.common.timing import timed
+
+TIMED_METHODS = (
+    "add",
+    "get",
+    "set",
+    "touch",
+    "delete",
+    "get_many",
+    "set_many",
+    "delete_many",
+    "has_key",
+    "incr",
+    "decr",
+    "get_or_set",
+    "clear",
+)
+
+
+@functools.cache
+def timed_cache_backend(backend_class):
+    """Return a subclass of a cache backend class whose calls are timed."""
+    methods = {
+        name: timed("cache", getattr(backend_class, name)) for name in TIMED_METHODS
+    }
+    return type(f"Timed{backend_class.__name__}", (backend_class,), methods)
+
+
+class TimedCache:
+    """
+    Cache backend that times the backend named by the TIMED_BACKEND entry of
+    its CACHES configuration, e.g.
+
+        "default": {
+            "BACKEND": "gameboard.common.cache.TimedCache",
+            "TIMED_BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://redis:6379/3",
+        }
+    """
+
+    def __new__(cls, location, params):
+        backend_class = import_string(params["TIMED_BACKEND"])
+        return timed_cache_backend(backend_class)(location, params)
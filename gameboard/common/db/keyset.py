@@ -0,0 +1,94 @@
+"""
+Keyset (cursor) pagination helpers shared by the API pagination classes and
+the admin changelists of large tables.
+
+A page is the first N rows after the last row of the previous page in a
+unique ordering, e.g. ("-start_time", "-id"). With an index on that ordering
+every page costs the same as the first, unlike OFFSET pagination.
+"""
+
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """Keep full microsecond precision so datetime keys compare exactly."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def keyset_filter(ordering, after):
+    """
+    Build the "row comes after `after`" condition for the ordering, e.g.
+    (a < x) OR (a = x AND b < y) for ("-a", "-b").
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, after):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def ordering_fields(queryset, ordering):
+    """Model fields (or annotation output fields) of the ordering's columns."""
+    fields = []
+    for field in ordering:
+        name = field.lstrip("-")
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            fields.append(annotation.output_field)
+        else:
+            fields.append(queryset.model._meta.get_field(name))
+    return fields
+
+
+def coerce_key(fields, key):
+    """
+    Convert a decoded cursor key to the Python values of `fields`; raises
+    ValueError if it does not have one non-null, valid value per field.
+    """
+    if not isinstance(key, list) or len(key) != len(fields):
+        raise ValueError("Invalid cursor: the key does not match the ordering.")
+    values = []
+    for field, value in zip(fields, key):
+        try:
+            value = field.to_python(value)
+        except ValidationError as e:
+            raise ValueError(f"Invalid cursor: {e.messages[0]}")
+        if value is None:
+            raise ValueError("Invalid cursor: the key has a null value.")
+        values.append(value)
+    return values
+
+
+def row_key(row, ordering):
+    """Values of the ordering fields for a model instance or values() dict."""
+    values = []
+    for field in ordering:
+        name = field.lstrip("-")
+        values.append(row[name] if isinstance(row, dict) else getattr(row, name))
+    return values
+
+
+def encode_cursor(payload):
+    data = json.dumps(payload, cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(encoded):
+    """Return the payload of a cursor; raises ValueError if it is malformed."""
+    try:
+        return json.loads(base64.urlsafe_b64decode(encoded.encode()))
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
@@ -0,0 +1,35 @@
+"""
+Database router for an optional set of read replicas (DATABASE_REPLICAS).
+
+Reads of the models in DATABASE_REPLICA_MODELS, the leaderboard and
+popularity tables, go to a random replica; every other read and all writes
+go to the primary. Reads made inside a transaction on the primary stay on it,
+so write paths always see their own changes. Without replicas every query
+goes to the primary.
+"""
+
+import random
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if (
+            not settings.DATABASE_REPLICAS
+            or model._meta.label_lower not in settings.DATABASE_REPLICA_MODELS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,79 @@
+"""
+Request timing middleware.
+
+A sampled share of requests (REQUEST_TIMING_SAMPLE_RATE) records database
+query count and time, cache and Redis call count and time, and the total time
+until the response is returned, and reports them in a Server-Timing header.
+Any request slower than SLOW_REQUEST_THRESHOLD_MS is logged as JSON to the
+"gameboard.performance" logger, with the slowest SQL statements when it was
+sampled. Unsampled requests only pay for two perf_counter() calls.
+"""
+
+import json
+import logging
+import random
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+
+from gameboard.common import timing
+
+logger = logging.getLogger("gameboard.performance")
+
+
+class RequestTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        timing.install_query_recorders()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats, token = self.start()
+        started = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                timing.stop(token)
+        return self.finish(request, response, stats, perf_counter() - started)
+
+    async def __acall__(self, request):
+        stats, token = self.start()
+        started = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                timing.stop(token)
+        return self.finish(request, response, stats, perf_counter() - started)
+
+    def start(self):
+        if random.random() >= settings.REQUEST_TIMING_SAMPLE_RATE:
+            return None, None
+        return timing.start()
+
+    def finish(self, request, response, stats, duration):
+        if stats is not None:
+            response["Server-Timing"] = stats.server_timing(duration)
+
+        if duration * 1000 >= settings.SLOW_REQUEST_THRESHOLD_MS:
+            entry = {
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "ms": round(duration * 1000, 1),
+                "sampled": stats is not None,
+            }
+            if stats is not None:
+                entry.update(stats.summary())
+            logger.warning(f"Slow request: {json.dumps(entry)}")
+        return response
@@ -0,0 +1,87 @@
+import asyncio
+import weakref
+
+import redis
+import redis.asyncio
+import redis.asyncio.client
+import redis.client
+
+from django.conf import settings
+
+from gameboard.common.timing import atimed, timed
+
+_connection = None
+
+
+class TimedPipeline(redis.client.Pipeline):
+    execute = timed("redis", redis.client.Pipeline.execute)
+
+
+class TimedRedis(redis.Redis):
+    """Redis client whose commands and pipelines are counted per request."""
+
+    execute_command = timed("redis", redis.Redis.execute_command)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return TimedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class TimedAsyncPipeline(redis.asyncio.client.Pipeline):
+    execute = atimed("redis", redis.asyncio.client.Pipeline.execute)
+
+
+class TimedAsyncRedis(redis.asyncio.Redis):
+    """redis.asyncio counterpart of TimedRedis."""
+
+    execute_command = atimed("redis", redis.asyncio.Redis.execute_command)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return TimedAsyncPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+def get_redis_connection():
+    """
+    Return a process-wide Redis client for application data (leaderboards, counters).
+    The underlying connection pool is created lazily on first use.
+    """
+    global _connection
+    if _connection is None:
+        _connection = TimedRedis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _connection
+
+
+_async_connections = weakref.WeakKeyDictionary()
+
+
+def get_async_redis_connection():
+    """
+    Return a redis.asyncio client for the running event loop. Async clients are
+    bound to the loop they were created on, so one client is kept per loop
+    (a single one under an ASGI server).
+    """
+    loop = asyncio.get_running_loop()
+    connection = _async_connections.get(loop)
+    if connection is None:
+        connection = _async_connections[loop] = TimedAsyncRedis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return connection
+
+
+def reset_redis_connections():
+    """Drop the cached clients so the next call connects with the current settings."""
+    global _connection
+    _connection = None
+    _async_connections.clear()
@@ -0,0 +1,36 @@
+"""
+Test runner that puts the default cache on an in-memory fake Redis server,
+so the tests exercise the shared Redis cache backend without a Redis service.
+The application's own Redis connections are left alone: with no server they
+fail and the database fallbacks are tested.
+"""
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+TEST_CACHE_URL = "redis://test-cache:6379/0"
+
+
+def test_caches():
+    import fakeredis
+
+    return {
+        "default": {
+            "BACKEND": "gameboard.common.cache.TimedCache",
+            "TIMED_BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": TEST_CACHE_URL,
+            # Connections to the same host and port share one fake server
+            "OPTIONS": {"connection_class": fakeredis.FakeConnection},
+        }
+    }
+
+
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.cache_settings = override_settings(CACHES=test_caches())
+        self.cache_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.cache_settings.disable()
+        super().teardown_test_environment(**kwargs)
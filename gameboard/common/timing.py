@@ -0,0 +1,137 @@
+"""
+Per-request performance counters.
+
+While a request is being timed (see RequestTimingMiddleware) a RequestStats is
+held in a context variable, so it follows the request into sync_to_async
+threads. Database queries are recorded by a wrapper installed on every
+connection (`connection.execute_wrappers`); cache and Redis clients record
+their calls with `timed` or `atimed`. Outside a timed request each hook costs
+one context variable lookup.
+"""
+
+from contextvars import ContextVar
+import functools
+from time import perf_counter
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+MAX_CAPTURED_QUERIES = 200  # SQL statements kept per request for the slow log
+
+_current = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    def __init__(self, capture_sql=True):
+        self.capture_sql = capture_sql
+        self.calls = {}  # metric -> [count, seconds]
+        self.queries = []  # (seconds, sql)
+        self.query_count = 0
+        self.in_call = False
+
+    def add(self, metric, duration):
+        totals = self.calls.setdefault(metric, [0, 0.0])
+        totals[0] += 1
+        totals[1] += duration
+
+    def add_query(self, sql, duration):
+        self.add("db", duration)
+        if self.capture_sql and len(self.queries) < MAX_CAPTURED_QUERIES:
+            self.queries.append((duration, sql))
+
+    def server_timing(self, total):
+        """Return a Server-Timing header value, durations in milliseconds."""
+        metrics = [
+            f'{metric};dur={seconds * 1000:.1f};desc="{count} calls"'
+            for metric, (count, seconds) in self.calls.items()
+        ]
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def summary(self, slowest=5):
+        """Counters and the slowest captured statements, for the slow-request log."""
+        statements = [sql for _, sql in self.queries]
+        return {
+            **{
+                metric: {"calls": count, "ms": round(seconds * 1000, 1)}
+                for metric, (count, seconds) in self.calls.items()
+            },
+            "repeated_queries": len(statements) - len(set(statements)),
+            "slowest_queries": [
+                {"ms": round(duration * 1000, 1), "sql": sql}
+                for duration, sql in sorted(self.queries, reverse=True)[:slowest]
+            ],
+        }
+
+
+def start(capture_sql=True):
+    """Start recording for the current context; returns (stats, token)."""
+    stats = RequestStats(capture_sql)
+    return stats, _current.set(stats)
+
+
+def stop(token):
+    _current.reset(token)
+
+
+def timed(metric, method):
+    """
+    Wrap a client method so each call is counted under `metric`. Calls made
+    from within another timed call (e.g. get_many looping over get) are not
+    counted twice.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        stats = _current.get()
+        if stats is None or stats.in_call:
+            return method(*args, **kwargs)
+        stats.in_call = True
+        started = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.in_call = False
+            stats.add(metric, perf_counter() - started)
+
+    return wrapper
+
+
+def atimed(metric, method):
+    """Async counterpart of `timed` for coroutine methods."""
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        stats = _current.get()
+        if stats is None:
+            return await method(*args, **kwargs)
+        started = perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            stats.add(metric, perf_counter() - started)
+
+    return wrapper
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add_query(sql, perf_counter() - started)
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_query_recorders():
+    """Record queries on the connections opened so far and on every new one."""
+    connection_created.connect(install_query_recorder)
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection)
@@ -1,6 +1,18 @@
 from django.contrib import admin
-from .models import Contestant, Game, GameSession, GamePopularity
+from .models import (
+    Contestant,
+    ContestantDailyScore,
+    ContestantGameDailyScore,
+    ContestantGameScore,
+    Game,
+    GameSession,
+    GamePopularity,
+    PopularityHistory,
+    PopularityProfile,
+    UpvoteFlush,
+)
 
+from gameboard.common.admin.large_tables import LargeTableModelAdmin
 from gameboard.common.admin.utils import (
     BaseModelAdmin,
     datetime_format_ist,
@@ -45,7 +57,7 @@ class GameAdmin(BaseModelAdmin):
 
 
 @admin.register(GameSession)
-class GameSessionAdmin(BaseModelAdmin):
+class GameSessionAdmin(LargeTableModelAdmin):
 
     def game(self: GameSession):
         return object_link(self.game, display_value=self.game.name)
@@ -71,14 +83,12 @@ class GameSessionAdmin(BaseModelAdmin):
         "end_time",
         "score",
     ]
+    uuid_search_fields = ["id", "game", "contestant"]
     search_fields = [
-        "id",
-        "game__id",
-        "game__name",
-        "contestant__id",
-        "contestant__name",
+        "=game__name",
+        "=contestant__name",
     ]
-    ordering = ("start_time",)
+    keyset_ordering = ("-start_time", "-id")
     list_select_related = [
         "game",
         "contestant",
@@ -87,7 +97,7 @@ class GameSessionAdmin(BaseModelAdmin):
 
 
 @admin.register(GamePopularity)
-class GamePopularityAdmin(BaseModelAdmin):
+class GamePopularityAdmin(LargeTableModelAdmin):
 
     def game(self: GamePopularity):
         return object_link(self.game, display_value=self.game.name)
@@ -102,9 +112,135 @@ class GamePopularityAdmin(BaseModelAdmin):
         "popularity_score",
         last_updated_ist,
     ]
-    search_fields = [
+    list_filter = ["profile"]
+    uuid_search_fields = ["id", "game"]
+    search_fields = ["=game__name"]
+    keyset_ordering = ("-date", "-id")
+    list_select_related = ["game"]
+
+
+@admin.register(PopularityHistory)
+class PopularityHistoryAdmin(LargeTableModelAdmin):
+
+    def game(self: PopularityHistory):
+        return object_link(self.game, display_value=self.game.name)
+
+    list_display = [
         "id",
-        "game__id",
-        "game__name",
+        game,
+        "profile",
+        "resolution",
+        "bucket",
+        "score",
+        "samples",
+    ]
+    list_filter = ["resolution", "profile"]
+    uuid_search_fields = ["game"]
+    search_fields = ["=game__name"]
+    # Auto-increment ids follow insertion, so the primary key gives newest first
+    keyset_ordering = ("-id",)
+    list_select_related = ["game", "profile"]
+    raw_id_fields = ["game"]
+
+
+@admin.register(PopularityProfile)
+class PopularityProfileAdmin(BaseModelAdmin):
+    list_display = [
+        "name",
+        "daily_players_weight",
+        "current_players_weight",
+        "upvotes_weight",
+        "session_length_weight",
+        "daily_sessions_weight",
+        "is_active",
+    ]
+    list_filter = ["is_active"]
+    search_fields = ["name"]
+
+
+@admin.register(UpvoteFlush)
+class UpvoteFlushAdmin(BaseModelAdmin):
+    list_display = [
+        "batch_id",
+        "games",
+        "upvotes",
+        "created_at",
+    ]
+    search_fields = ["batch_id"]
+    ordering = ("-created_at",)
+
+
+@admin.register(ContestantGameScore)
+class ContestantGameScoreAdmin(LargeTableModelAdmin):
+
+    def game(self: ContestantGameScore):
+        return object_link(self.game, display_value=self.game.name)
+
+    def contestant(self: ContestantGameScore):
+        return object_link(self.contestant, display_value=self.contestant.name)
+
+    list_display = [
+        "truncated_id",
+        game,
+        contestant,
+        "total_score",
+    ]
+    uuid_search_fields = ["id", "game", "contestant"]
+    search_fields = [
+        "=game__name",
+        "=contestant__name",
+    ]
+    # ULID primary keys sort by creation time
+    keyset_ordering = ("-id",)
+    list_select_related = [
+        "game",
+        "contestant",
+    ]
+    raw_id_fields = ["game", "contestant"]
+
+
+@admin.register(ContestantDailyScore)
+class ContestantDailyScoreAdmin(LargeTableModelAdmin):
+
+    def contestant(self: ContestantDailyScore):
+        return object_link(self.contestant, display_value=self.contestant.name)
+
+    list_display = [
+        "truncated_id",
+        "date",
+        contestant,
+        "total_score",
     ]
-    ordering = ("date",)
+    list_filter = ["date"]
+    uuid_search_fields = ["id", "contestant"]
+    search_fields = ["=contestant__name"]
+    keyset_ordering = ("-id",)
+    list_select_related = ["contestant"]
+    raw_id_fields = ["contestant"]
+
+
+@admin.register(ContestantGameDailyScore)
+class ContestantGameDailyScoreAdmin(LargeTableModelAdmin):
+
+    def game(self: ContestantGameDailyScore):
+        return object_link(self.game, display_value=self.game.name)
+
+    def contestant(self: ContestantGameDailyScore):
+        return object_link(self.contestant, display_value=self.contestant.name)
+
+    list_display = [
+        "truncated_id",
+        "date",
+        game,
+        contestant,
+        "total_score",
+    ]
+    list_filter = ["date"]
+    uuid_search_fields = ["id", "game", "contestant"]
+    search_fields = [
+        "=game__name",
+        "=contestant__name",
+    ]
+    keyset_ordering = ("-id",)
+    list_select_related = ["game", "contestant"]
+    raw_id_fields = ["game", "contestant"]
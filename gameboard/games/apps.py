@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class GamesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "gameboard.games"
+
+    def ready(self):
+        from gameboard.api.response_cache import check_shared_cache
+
+        checks.register(check_shared_cache, checks.Tags.caches)
@@ -0,0 +1,326 @@
+"""
+Endpoint benchmarks.
+
+Every named route under gameboard/api is requested through the Django test
+client against a synthetic dataset (see synthetic.py). Each route gets one
+warm-up request and `iterations` measured ones; for each the wall time
+(including streamed bodies) and the queries on every database connection are
+recorded, and one extra request is traced with tracemalloc for its peak Python
+memory. Write routes get a fresh payload, and a fresh object where they
+consume one, before every request; that setup is not measured.
+
+Results are plain JSON so a run can be kept as a baseline and a later run
+compared with it by `compare`.
+"""
+
+from contextlib import ExitStack
+from datetime import timedelta
+import json
+import re
+import tracemalloc
+import uuid
+from time import perf_counter
+
+import numpy as np
+from redis.exceptions import RedisError
+
+from django.core.cache import cache
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, reverse
+from django.utils import timezone
+
+from gameboard.games.leaderboard import iter_leaderboards
+from gameboard.games.models import Contestant, Game, GameSession
+from gameboard.games.scores import rebuild_score_totals
+from gameboard.games.synthetic import GAME_NAMES, generate
+from gameboard.games.tasks import (
+    cache_popularity_factors_and_max_values,
+    refresh_game_popularity,
+)
+
+SIZES = {
+    "small": {"games": 20, "contestants": 1000, "sessions": 10_000},
+    "medium": {"games": 100, "contestants": 10_000, "sessions": 100_000},
+    "large": {"games": 500, "contestants": 100_000, "sessions": 1_000_000},
+}
+DAYS = 7
+BULK_ROWS = 100  # sessions per bulk import request
+
+# Server-sent event streams never end, so they cannot be timed per request
+SKIPPED_ROUTES = {
+    "global-leaderboard-feed",
+    "game-leaderboard-feed",
+    "date-leaderboard-feed",
+    "popularity-leaderboard-feed",
+}
+HTTP_METHODS = ("get", "post", "patch", "put", "delete")
+
+# Regressions are only reported past both the relative and absolute margins
+DEFAULT_THRESHOLD = 0.2
+MIN_LATENCY_DELTA_MS = 1.0
+MIN_MEMORY_DELTA_KIB = 64
+
+
+def iter_routes(patterns=None, prefix=""):
+    """Yield (name, route, view class) for every named API route."""
+    if patterns is None:
+        from gameboard.api.urls import urlpatterns as patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif pattern.name:
+            yield pattern.name, prefix + str(
+                pattern.pattern
+            ), pattern.callback.view_class
+
+
+def route_method(view_class):
+    return next(method for method in HTTP_METHODS if hasattr(view_class, method))
+
+
+def prepare_dataset(size, seed=42, redis=False):
+    """Generate the dataset for `size` and build the derived tables and caches."""
+    counts = generate(days=DAYS, seed=seed, **SIZES[size])
+    rebuild_score_totals()
+    cache_popularity_factors_and_max_values()
+    refresh_game_popularity()
+    if redis:
+        for leaderboard in iter_leaderboards(days=DAYS):
+            leaderboard.rebuild()
+    return counts
+
+
+class Fixtures:
+    """The objects routes are requested for: the busiest game and contestant."""
+
+    def __init__(self):
+        self.game = Game.objects.get(name=GAME_NAMES[0])
+        self.contestant = Contestant.objects.get(name="Player_1")
+        self.session = (
+            GameSession.objects.filter(
+                contestant=self.contestant, end_time__isnull=False
+            )
+            .order_by("-end_time")
+            .first()
+        )
+        self.date = timezone.localdate().isoformat()
+
+    def kwargs(self):
+        return {
+            "game_id": self.game.id,
+            "contestant_id": self.contestant.id,
+            "session_id": self.session.id,
+        }
+
+
+def unique_name(prefix):
+    return f"{prefix} {uuid.uuid4().hex[:12]}"
+
+
+def new_contestant(fixtures):
+    return Contestant.objects.create(name=unique_name("Benchmark contestant"))
+
+
+def bulk_body(fixtures):
+    now = timezone.now()
+    rows = (
+        {
+            "game_id": str(fixtures.game.id),
+            "contestant_id": str(fixtures.contestant.id),
+            "start_time": (now - timedelta(minutes=i + 10)).isoformat(),
+            "end_time": (now - timedelta(minutes=i)).isoformat(),
+            "score": i,
+        }
+        for i in range(BULK_ROWS)
+    )
+    return "\n".join(json.dumps(row) for row in rows)
+
+
+# Route name -> function(fixtures) returning the URL kwargs and body to send
+PAYLOADS = {
+    "create-game": lambda f: {"data": {"name": unique_name("Benchmark game")}},
+    "create-contestant": lambda f: {
+        "data": {"name": unique_name("Benchmark contestant")}
+    },
+    "update-contestant": lambda f: {"data": {"name": unique_name("Player")}},
+    "delete-game": lambda f: {
+        "kwargs": {
+            "game_id": Game.objects.create(name=unique_name("Benchmark game")).id
+        }
+    },
+    "delete-contestant": lambda f: {"kwargs": {"contestant_id": new_contestant(f).id}},
+    "start-game-session": lambda f: {
+        "data": {"game_id": f.game.id, "contestant_id": new_contestant(f).id}
+    },
+    "end-game-session": lambda f: {
+        "data": {
+            "session_id": GameSession.objects.create(
+                game=f.game, contestant=new_contestant(f), start_time=timezone.now()
+            ).id,
+            "score": 100,
+        }
+    },
+    "bulk-game-sessions": lambda f: {
+        "data": bulk_body(f),
+        "content_type": "application/x-ndjson",
+    },
+}
+
+
+class RouteBenchmark:
+    def __init__(self, name, route, view_class, fixtures):
+        self.name = name
+        self.route = route
+        self.method = route_method(view_class)
+        self.fixtures = fixtures
+        self.parameters = re.findall(r"<(?:\w+:)?(\w+)>", route)
+
+    def request(self):
+        """Return the path, body and content type of the next request."""
+        payload = PAYLOADS.get(self.name, lambda f: {})(self.fixtures)
+        kwargs = {
+            name: value
+            for name, value in self.fixtures.kwargs().items()
+            if name in self.parameters
+        }
+        kwargs.update(payload.get("kwargs", {}))
+        path = reverse(self.name, kwargs=kwargs)
+        if "date" in self.name:
+            path += f"?date={self.fixtures.date}"
+        return (
+            path,
+            payload.get("data", {}),
+            payload.get("content_type", "application/json"),
+        )
+
+    def send(self, client):
+        """Send one request; returns (seconds, status code, query count)."""
+        path, data, content_type = self.request()
+        with ExitStack() as stack:
+            captured = [
+                stack.enter_context(CaptureQueriesContext(connection))
+                for connection in connections.all()
+            ]
+            started = perf_counter()
+            if self.method == "get":
+                response = client.get(path)
+            else:
+                response = getattr(client, self.method)(
+                    path, data, content_type=content_type
+                )
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            elapsed = perf_counter() - started
+        return elapsed, response.status_code, sum(len(c) for c in captured)
+
+    def run(self, client, iterations, cold=True):
+        self.send(client)  # warm-up: imports, metadata caches, connection
+
+        latencies, queries, statuses = [], [], {}
+        for _ in range(iterations):
+            if cold:
+                cache.clear()
+            elapsed, status_code, query_count = self.send(client)
+            latencies.append(elapsed * 1000)
+            queries.append(query_count)
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+
+        if cold:
+            cache.clear()
+        tracemalloc.start()
+        try:
+            self.send(client)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {
+            "method": self.method.upper(),
+            "route": self.route,
+            "requests": iterations,
+            "status": statuses,
+            "errors": sum(
+                count for code, count in statuses.items() if int(code) >= 400
+            ),
+            "mean_ms": round(float(np.mean(latencies)), 3),
+            "p50_ms": round(float(p50), 3),
+            "p95_ms": round(float(p95), 3),
+            "p99_ms": round(float(p99), 3),
+            "queries": round(float(np.mean(queries)), 2),
+            "max_queries": max(queries),
+            "peak_memory_kib": round(peak / 1024, 1),
+        }
+
+
+def benchmark_routes(iterations, names=None, cold=True, progress=None):
+    """Benchmark every API route (or those in `names`); returns results by name."""
+    fixtures = Fixtures()
+    client = Client()
+    results = {}
+    for name, route, view_class in iter_routes():
+        if name in SKIPPED_ROUTES or (names and name not in names):
+            continue
+        benchmark = RouteBenchmark(name, route, view_class, fixtures)
+        results[name] = benchmark.run(client, iterations, cold=cold)
+        if progress:
+            progress(name, results[name])
+    return results
+
+
+def redis_available():
+    from gameboard.common.redis.client import get_redis_connection
+
+    try:
+        return bool(get_redis_connection().ping())
+    except RedisError:
+        return False
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Return the regressions of `results` against `baseline`, as dicts with the
+    size, route, metric and both values: p95 latency or peak memory grown by
+    more than `threshold` (and a minimum absolute margin), more queries per
+    request, or errors on a route that had none. Routes or sizes missing from
+    either run are ignored.
+    """
+    regressions = []
+    for size, current in results["sizes"].items():
+        previous_routes = baseline["sizes"].get(size, {}).get("routes", {})
+        for name, now in current["routes"].items():
+            before = previous_routes.get(name)
+            if before is None:
+                continue
+
+            checks = (
+                (
+                    "p95_ms",
+                    now["p95_ms"] > before["p95_ms"] * (1 + threshold)
+                    and now["p95_ms"] - before["p95_ms"] >= MIN_LATENCY_DELTA_MS,
+                ),
+                (
+                    "peak_memory_kib",
+                    now["peak_memory_kib"] > before["peak_memory_kib"] * (1 + threshold)
+                    and now["peak_memory_kib"] - before["peak_memory_kib"]
+                    >= MIN_MEMORY_DELTA_KIB,
+                ),
+                ("max_queries", now["max_queries"] > before["max_queries"]),
+                ("errors", now["errors"] > 0 and before["errors"] == 0),
+            )
+            regressions.extend(
+                {
+                    "size": size,
+                    "route": name,
+                    "metric": metric,
+                    "baseline": before[metric],
+                    "current": now[metric],
+                }
+                for metric, regressed in checks
+                if regressed
+            )
+    return regressions
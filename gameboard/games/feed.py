@@ -0,0 +1,234 @@
+"""
+Live top-N feeds for leaderboards and popularity rankings.
+
+Ending a session only marks the leaderboards it changed as pending; every
+few seconds a Celery task (or a popularity refresh, for its ranking) compares
+the top N entries of each pending board with the last published snapshot,
+kept in Redis, and publishes only the difference on the board's pub/sub
+channel:
+
+    {"seq": 42, "changed": [entries with their new rank], "removed": [ids]}
+
+Snapshot and sequence number are replaced in a WATCH/MULTI transaction, so
+concurrent publishers from several processes produce consecutive deltas.
+Subscribers (the server-sent events endpoints) can run in any web process:
+each stream starts with the current snapshot and re-sends it if it ever
+misses a sequence number.
+"""
+
+import heapq
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from redis.exceptions import RedisError
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from gameboard.common.redis.client import (
+    get_async_redis_connection,
+    get_redis_connection,
+)
+from gameboard.games.models import GamePopularity
+
+logger = logging.getLogger(__name__)
+
+FEED_PENDING_KEY = "feed:pending"  # set of leaderboard keys changed since publishing
+FEED_PENDING_BATCH = 100  # pending leaderboards popped per SPOP
+FEED_KEEPALIVE = 15  # seconds between SSE comments on an idle stream
+FEED_RETRY_MS = 5000  # reconnect delay suggested to EventSource clients
+
+
+def diff_top(previous, current, id_field):
+    """
+    Return (changed, removed): entries of `current` that are new or whose
+    rank or value changed, and the ids of `previous` entries no longer listed.
+    """
+    before = {entry[id_field]: entry for entry in previous}
+    changed = [entry for entry in current if before.get(entry[id_field]) != entry]
+    current_ids = {entry[id_field] for entry in current}
+    removed = [entry_id for entry_id in before if entry_id not in current_ids]
+    return changed, removed
+
+
+class Feed:
+    """
+    A top-N feed published on `feed:<key>`. Subclasses implement `top()`,
+    returning the current top entries (JSON-serializable dicts with a rank).
+    """
+
+    key = None
+    id_field = None
+
+    def __init__(self, connection=None):
+        self.redis = connection or get_redis_connection()
+
+    @property
+    def channel(self):
+        return f"feed:{self.key}"
+
+    @property
+    def snapshot_key(self):
+        return f"feed:{self.key}:snapshot"
+
+    def top(self):
+        raise NotImplementedError
+
+    def publish(self, entries=None):
+        """
+        Publish the difference between `entries` (or `top()`) and the last
+        snapshot. Returns the published delta, or None if nothing changed.
+        Failures are logged rather than raised.
+        """
+        try:
+            if entries is None:
+                entries = self.top()
+            if entries is None:
+                return None
+            # Round-trip through JSON so entries compare equal to the stored snapshot
+            entries = json.loads(json.dumps(entries, cls=DjangoJSONEncoder))
+            return self.redis.transaction(
+                lambda pipe: self._publish(pipe, entries),
+                self.snapshot_key,
+                value_from_callable=True,
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to publish feed '{self.key}': {e}")
+            return None
+
+    def _publish(self, pipe, entries):
+        stored = pipe.get(self.snapshot_key)
+        snapshot = json.loads(stored) if stored else {"seq": 0, "entries": []}
+        changed, removed = diff_top(snapshot["entries"], entries, self.id_field)
+        if stored and not changed and not removed:
+            return None
+
+        seq = snapshot["seq"] + 1
+        delta = {"seq": seq, "changed": changed, "removed": removed}
+        pipe.multi()
+        pipe.set(self.snapshot_key, json.dumps({"seq": seq, "entries": entries}))
+        pipe.publish(self.channel, json.dumps(delta))
+        return delta
+
+
+class LeaderboardFeed(Feed):
+    """Top-N feed of a Redis leaderboard (see leaderboard.py)."""
+
+    id_field = "contestant_id"
+
+    def __init__(self, leaderboard):
+        super().__init__(leaderboard.redis)
+        self.leaderboard = leaderboard
+        self.key = leaderboard.key
+
+    def top(self):
+        if not self.leaderboard.is_ready():
+            return None
+        entries = self.leaderboard.entries(0, settings.FEED_TOP_N)
+        for rank, entry in enumerate(entries, start=1):
+            entry["rank"] = rank
+        return entries
+
+
+class PopularityFeed(Feed):
+    """Top-N feed of today's popularity ranking for one weight profile."""
+
+    id_field = "game_id"
+
+    def __init__(self, profile="default", connection=None):
+        super().__init__(connection)
+        self.profile = profile
+        self.key = f"popularity:{profile}"
+
+    def top(self):
+        entries = list(
+            GamePopularity.objects.filter(
+                date=timezone.now().date(), profile__name=self.profile
+            )
+            .order_by("-popularity_score", "-game_id")
+            .values("game_id", "game__name", "popularity_score")[: settings.FEED_TOP_N]
+        )
+        for rank, entry in enumerate(entries, start=1):
+            entry["rank"] = rank
+        return entries
+
+
+def publish_leaderboards(leaderboards):
+    """Publish the top-N changes of the given leaderboards."""
+    for leaderboard in leaderboards:
+        LeaderboardFeed(leaderboard).publish()
+
+
+def top_popularity(game_ids, names, scores):
+    """
+    Return the top-N popularity entries from parallel sequences of game ids
+    and scores, in the same order as PopularityFeed.top().
+    """
+    ranked = heapq.nlargest(settings.FEED_TOP_N, zip(scores, game_ids))
+    return [
+        {
+            "game_id": game_id,
+            "game__name": names[game_id],
+            "popularity_score": score,
+            "rank": rank,
+        }
+        for rank, (score, game_id) in enumerate(ranked, start=1)
+    ]
+
+
+def _event(name, data):
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _read_snapshot(redis, feed):
+    stored = await redis.get(feed.snapshot_key)
+    return json.loads(stored) if stored else None
+
+
+async def stream_feed(feed):
+    """
+    Yield server-sent events for a feed: a "snapshot" event with the current
+    top entries, then a "delta" event per published change. A gap in the
+    sequence numbers (e.g. a dropped message) is repaired with a new snapshot.
+    """
+    redis = get_async_redis_connection()
+    pubsub = redis.pubsub()
+    try:
+        # Subscribe before reading the snapshot so no delta falls in between
+        await pubsub.subscribe(feed.channel)
+        snapshot = await _read_snapshot(redis, feed)
+        if snapshot is None:
+            await sync_to_async(feed.publish)()
+            snapshot = await _read_snapshot(redis, feed) or {"seq": 0, "entries": []}
+
+        yield f"retry: {FEED_RETRY_MS}\n\n"
+        yield _event("snapshot", snapshot)
+        seq = snapshot["seq"]
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=FEED_KEEPALIVE
+            )
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            delta = json.loads(message["data"])
+            if delta["seq"] <= seq:
+                continue
+            if delta["seq"] == seq + 1:
+                yield _event("delta", delta)
+                seq = delta["seq"]
+                continue
+
+            snapshot = await _read_snapshot(redis, feed)
+            if snapshot is not None and snapshot["seq"] > seq:
+                yield _event("snapshot", snapshot)
+                seq = snapshot["seq"]
+    except RedisError as e:
+        logger.warning(f"Feed '{feed.key}' stream failed: {e}")
+        yield _event("error", {"error": "The live feed is unavailable."})
+    finally:
+        await pubsub.aclose()
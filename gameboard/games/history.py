@@ -0,0 +1,155 @@
+"""
+Popularity history: a time series of popularity scores per game and profile.
+
+Each popularity refresh writes one 5-minute bucket per game and profile. The
+rollup task aggregates 5-minute buckets into hourly buckets and hourly buckets
+into daily ones (weighted mean, min, max and sample count), then prunes each
+resolution past its retention. Only daily buckets are kept indefinitely, so a
+game costs one row per profile and day once its fine-grained rows expire.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+import logging
+
+from django.db.models import F, FloatField, Max, Min, Sum
+from django.db.models.functions import Coalesce, TruncDay, TruncHour
+from django.utils import timezone
+
+from gameboard.games.models import PopularityHistory
+
+logger = logging.getLogger(__name__)
+
+Resolution = PopularityHistory.Resolution
+
+# How long each resolution is kept; None keeps it forever
+RETENTION = {
+    Resolution.FIVE_MINUTES: timedelta(days=2),
+    Resolution.HOUR: timedelta(days=90),
+    Resolution.DAY: None,
+}
+
+# Source and target resolution of each rollup step, finest first
+ROLLUPS = (
+    (Resolution.FIVE_MINUTES, Resolution.HOUR, TruncHour),
+    (Resolution.HOUR, Resolution.DAY, TruncDay),
+)
+
+# Most points returned for one curve; picks the resolution of a range
+MAX_POINTS = 1000
+
+RESOLUTION_NAMES = {
+    "5m": Resolution.FIVE_MINUTES,
+    "1h": Resolution.HOUR,
+    "1d": Resolution.DAY,
+}
+
+HISTORY_KEY = ["game", "profile", "resolution", "bucket"]
+
+
+def bucket_start(moment, resolution):
+    """Return the start (in UTC) of the bucket of `resolution` containing `moment`."""
+    seconds = int(moment.timestamp())
+    return datetime.fromtimestamp(seconds - seconds % resolution, tz=dt_timezone.utc)
+
+
+def pick_resolution(since, until, now=None):
+    """
+    Return the finest resolution still retained at `since` that covers
+    since..until in at most MAX_POINTS buckets.
+    """
+    now = now or timezone.now()
+    span = (until - since).total_seconds()
+    for resolution in Resolution:
+        retention = RETENTION[resolution]
+        if retention is not None and since < now - retention:
+            continue
+        if span / resolution <= MAX_POINTS:
+            return resolution
+    return Resolution.DAY
+
+
+def rollup(lookback=timedelta(hours=2), now=None):
+    """
+    Recompute the hourly and daily buckets from `lookback` ago until now,
+    including the current (partial) buckets, which later runs overwrite.
+    Returns the number of buckets written per target resolution.
+    """
+    now = now or timezone.now()
+    start = now - lookback
+    written = {}
+
+    for source, target, trunc in ROLLUPS:
+        start = bucket_start(start, target)
+        rows = (
+            PopularityHistory.objects.filter(resolution=source, bucket__gte=start)
+            .values(
+                "game_id",
+                "profile_id",
+                target_bucket=trunc("bucket", tzinfo=dt_timezone.utc),
+            )
+            .annotate(
+                weighted_score=Sum(
+                    F("score") * F("samples"), output_field=FloatField()
+                ),
+                total_samples=Sum("samples"),
+                lowest=Min(Coalesce("min_score", "score")),
+                highest=Max(Coalesce("max_score", "score")),
+            )
+        )
+        buckets = [
+            PopularityHistory(
+                game_id=row["game_id"],
+                profile_id=row["profile_id"],
+                resolution=target,
+                bucket=row["target_bucket"],
+                score=row["weighted_score"] / row["total_samples"],
+                min_score=row["lowest"],
+                max_score=row["highest"],
+                samples=row["total_samples"],
+            )
+            for row in rows.iterator(chunk_size=2000)
+        ]
+        PopularityHistory.objects.bulk_create(
+            buckets,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=HISTORY_KEY,
+            update_fields=["score", "min_score", "max_score", "samples"],
+        )
+        written[Resolution(target).label] = len(buckets)
+
+    return written
+
+
+def prune(now=None):
+    """
+    Delete buckets older than the retention of their resolution.
+    Returns the number of rows deleted per resolution.
+    """
+    now = now or timezone.now()
+    deleted = {}
+    for resolution, retention in RETENTION.items():
+        if retention is None:
+            continue
+        deleted[resolution.label], _ = PopularityHistory.objects.filter(
+            resolution=resolution, bucket__lt=now - retention
+        ).delete()
+    return deleted
+
+
+def popularity_curve(game_id, profile, since, until, resolution):
+    """
+    Return the buckets of one game and profile in [since, until), oldest first,
+    with a single query on the unique (game, profile, resolution, bucket) index.
+    """
+    return list(
+        PopularityHistory.objects.filter(
+            game_id=game_id,
+            profile__name=profile,
+            resolution=resolution,
+            bucket__gte=bucket_start(since, resolution),
+            bucket__lt=until,
+        )
+        .order_by("bucket")
+        .values("bucket", "score", "min_score", "max_score", "samples")
+    )
@@ -0,0 +1,206 @@
+"""
+Bulk import of completed game sessions (tournaments, replays).
+
+Rows are read from a JSON Lines or CSV stream and processed in batches. Each
+batch validates its game and contestant ids with one query per model, inserts
+the valid sessions with bulk_create and applies their scores to the summary
+tables and Redis leaderboards once. Invalid rows are reported with their line
+number and skipped; a batch that fails in the database is reported as a whole
+and the import continues with the next one.
+"""
+
+import csv
+from functools import partial
+import json
+import logging
+import uuid
+
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from gameboard.games.leaderboard import record_session_scores
+from gameboard.games.models import Contestant, Game, GameSession
+from gameboard.games.popularity import cache_daily_factors, max_value_cache_key
+from gameboard.games.scores import add_score_totals, session_date
+
+logger = logging.getLogger(__name__)
+
+SESSION_FIELDS = ("game_id", "contestant_id", "start_time", "end_time", "score")
+
+
+def iter_jsonl_records(lines):
+    """Yield (line number, record or None, error or None) from JSON Lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON."
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object."
+            continue
+        yield line_number, record, None
+
+
+def iter_csv_records(lines):
+    """Yield (line number, record or None, error or None) from CSV with a header row."""
+    reader = csv.DictReader(lines)
+    missing = set(SESSION_FIELDS) - set(reader.fieldnames or ())
+    if missing:
+        yield 1, None, f"Missing CSV columns: {', '.join(sorted(missing))}."
+        return
+    for record in reader:
+        yield reader.line_num, record, None
+
+
+def _parse_time(record, field):
+    value = record.get(field)
+    if not value:
+        raise ValueError(f"'{field}' is required.")
+    parsed = parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(f"'{field}' must be an ISO 8601 datetime.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_session(record):
+    """
+    Validate a record and return (game_id, contestant_id, start_time, end_time, score).
+    Raises ValueError with a message for the error report.
+    """
+    try:
+        game_id = uuid.UUID(str(record.get("game_id")))
+        contestant_id = uuid.UUID(str(record.get("contestant_id")))
+    except ValueError:
+        raise ValueError("'game_id' and 'contestant_id' must be UUIDs.")
+
+    start_time = _parse_time(record, "start_time")
+    end_time = _parse_time(record, "end_time")
+    if end_time < start_time:
+        raise ValueError("'end_time' must not be before 'start_time'.")
+
+    score = record.get("score")
+    if isinstance(score, bool):
+        raise ValueError("'score' must be an integer.")
+    try:
+        score = int(str(score))
+    except ValueError:
+        raise ValueError("'score' must be an integer.")
+
+    return game_id, contestant_id, start_time, end_time, score
+
+
+class SessionImporter:
+    def __init__(self, batch_size=1000, max_errors=1000):
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.game_ids = set()
+        self.dates = set()
+
+    def add_error(self, line_number, error):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line_number, "error": error})
+
+    def run(self, records):
+        """
+        Import (line number, record, error) tuples and return the report.
+        """
+        batch = []
+        for line_number, record, error in records:
+            if error is None:
+                try:
+                    batch.append((line_number, parse_session(record)))
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                self.add_error(line_number, error)
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+
+        self.refresh_daily_factors()
+        logger.info(f"Imported {self.created} sessions, {self.failed} rows failed")
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+    def import_batch(self, batch):
+        active_games = set(
+            Game.objects.filter(
+                id__in={row[0] for _, row in batch}, is_active=True
+            ).values_list("id", flat=True)
+        )
+        active_contestants = set(
+            Contestant.objects.filter(
+                id__in={row[1] for _, row in batch}, is_active=True
+            ).values_list("id", flat=True)
+        )
+
+        sessions = []
+        lines = []
+        for line_number, (game_id, contestant_id, start_time, end_time, score) in batch:
+            if game_id not in active_games:
+                self.add_error(line_number, f"Game '{game_id}' not found or inactive.")
+            elif contestant_id not in active_contestants:
+                self.add_error(
+                    line_number, f"Contestant '{contestant_id}' not found or inactive."
+                )
+            else:
+                sessions.append(
+                    GameSession(
+                        game_id=game_id,
+                        contestant_id=contestant_id,
+                        start_time=start_time,
+                        start_date=session_date(start_time),
+                        end_time=end_time,
+                        score=score,
+                    )
+                )
+                lines.append(line_number)
+        if not sessions:
+            return
+
+        scores = [
+            (session.game_id, session.contestant_id, session.start_date, session.score)
+            for session in sessions
+        ]
+        try:
+            with transaction.atomic():
+                GameSession.objects.bulk_create(sessions)
+                add_score_totals(scores)
+                transaction.on_commit(partial(record_session_scores, scores))
+        except DatabaseError as e:
+            logger.error(f"Failed to import batch of {len(sessions)} sessions: {e}")
+            for line_number in lines:
+                self.add_error(line_number, "Batch could not be saved.")
+            return
+
+        self.created += len(sessions)
+        self.game_ids.update(session.game_id for session in sessions)
+        self.dates.update(session.start_date for session in sessions)
+
+    def refresh_daily_factors(self):
+        """
+        Recompute cached popularity factors for imported dates that are
+        currently cached, once per import.
+        """
+        keys = {
+            max_value_cache_key("max_daily_players", date): date for date in self.dates
+        }
+        for key in cache.get_many(keys):
+            cache_daily_factors(keys[key])
@@ -0,0 +1,440 @@
+"""
+Leaderboards kept in Redis sorted sets.
+
+Each leaderboard (global, per game, per date) is a ZSET of contestant_id ->
+total score. Scores are applied incrementally with ZINCRBY when a session ends;
+pages are served with ZREVRANGE and rank lookups with ZREVRANK, so reads cost
+O(log N + page size) regardless of session history. Ties are ordered by
+contestant_id descending, and the database querysets below use the same order.
+
+The database stays the source of truth: `rebuild()` regenerates the ZSET from
+GameSession rows and `check_consistency()` reports any drift. A leaderboard is
+only served once it has been built (tracked by a separate "ready" key), so after
+a Redis flush the API falls back to the database until the next rebuild.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+import logging
+import uuid
+
+from redis.exceptions import RedisError
+
+from django.db.models import Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from gameboard.common.db.keyset import ordering_fields
+from gameboard.common.redis.client import get_redis_connection
+from gameboard.games.feed import (
+    FEED_PENDING_BATCH,
+    FEED_PENDING_KEY,
+    publish_leaderboards,
+)
+from gameboard.games.models import (
+    Contestant,
+    ContestantDailyScore,
+    ContestantGameScore,
+    Game,
+    GameSession,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardUnavailable(Exception):
+    """The Redis leaderboard is missing or unreachable; read from the database instead."""
+
+
+class RedisLeaderboard:
+    key = None
+    ttl = None  # seconds; None keeps the leaderboard indefinitely
+    rebuild_batch_size = 1000
+
+    def __init__(self, connection=None):
+        self.redis = connection or get_redis_connection()
+
+    @property
+    def ready_key(self):
+        return f"{self.key}:ready"
+
+    def load_totals(self):
+        """
+        Return an iterable of (contestant_id, total_score) computed from the database.
+        """
+        raise NotImplementedError
+
+    def database_queryset(self):
+        """
+        Return the equivalent database leaderboard as a values() queryset with
+        contestant_id, contestant__name and total_score, in leaderboard order.
+        """
+        raise NotImplementedError
+
+    def incr(self, contestant_id, delta, pipe=None):
+        redis = pipe if pipe is not None else self.redis
+        redis.zincrby(self.key, delta, str(contestant_id))
+        if self.ttl:
+            redis.expire(self.key, self.ttl)
+
+    def is_ready(self):
+        return bool(self.redis.exists(self.ready_key))
+
+    def count(self):
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.exists(self.ready_key)
+        pipe.zcard(self.key)
+        ready, count = pipe.execute()
+        if not ready:
+            raise LeaderboardUnavailable(
+                f"Leaderboard '{self.key}' has not been built."
+            )
+        return count
+
+    def entries(self, start, stop):
+        """
+        Return leaderboard entries for zero-based positions [start, stop),
+        highest score first.
+        """
+        if stop is not None and stop <= start:
+            return []
+        end = -1 if stop is None else stop - 1
+        rows = self.redis.zrevrange(self.key, start, end, withscores=True)
+        return self._hydrate(rows)
+
+    def entries_after(self, after, limit):
+        """
+        Return up to `limit` entries following the (total_score, contestant_id)
+        key `after`, or from the top when `after` is None.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.exists(self.ready_key)
+        if after is not None:
+            pipe.zrevrank(self.key, str(after[1]))
+        ready, *position = pipe.execute()
+        if not ready:
+            raise LeaderboardUnavailable(
+                f"Leaderboard '{self.key}' has not been built."
+            )
+
+        if after is None:
+            return self.entries(0, limit)
+        if position[0] is not None:
+            return self.entries(position[0] + 1, position[0] + 1 + limit)
+
+        # The anchor contestant left the board (e.g. after a rebuild); resume by score
+        rows = self.redis.zrevrangebyscore(
+            self.key, f"({after[0]}", "-inf", start=0, num=limit, withscores=True
+        )
+        return self._hydrate(rows)
+
+    def _hydrate(self, rows):
+        names = dict(
+            Contestant.objects.filter(
+                id__in=[contestant_id for contestant_id, _ in rows]
+            ).values_list("id", "name")
+        )
+        return [
+            {
+                "contestant_id": contestant_id,
+                "contestant__name": names.get(uuid.UUID(contestant_id)),
+                "total_score": int(score),
+            }
+            for contestant_id, score in rows
+        ]
+
+    def rank(self, contestant_id, window=0):
+        """
+        Return the contestant's 1-based rank and total score together with up to
+        `window` neighbours above and below, or None if they are not on the board.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.exists(self.ready_key)
+        pipe.zrevrank(self.key, str(contestant_id))
+        ready, position = pipe.execute()
+        if not ready:
+            raise LeaderboardUnavailable(
+                f"Leaderboard '{self.key}' has not been built."
+            )
+        if position is None:
+            return None
+
+        start = max(position - window, 0)
+        entries = self.entries(start, position + window + 1)
+        return _rank_result(entries, start, position)
+
+    def database_rank(self, contestant_id, window=0):
+        """
+        Same as `rank()`, computed from the database when Redis is unavailable.
+        """
+        queryset = self.database_queryset()
+        entry = queryset.filter(contestant_id=contestant_id).first()
+        if entry is None:
+            return None
+
+        position = queryset.filter(
+            Q(total_score__gt=entry["total_score"])
+            | Q(total_score=entry["total_score"], contestant_id__gt=contestant_id)
+        ).count()
+        start = max(position - window, 0)
+        entries = list(queryset[start : position + window + 1])
+        return _rank_result(entries, start, position)
+
+    def rebuild(self, totals=None):
+        """
+        Regenerate the sorted set from the database, or from the given
+        (member, score) pairs. The new set is written to a temporary key and
+        swapped in atomically, so readers never see a partial set.
+
+        Scores applied with `incr` while the database is read would be lost by
+        a plain swap, so the live set is copied before the read, and at the
+        swap the difference between the live set and that copy is added to the
+        new set. A session whose database commit precedes the read but whose
+        ZINCRBY follows the copy (the few milliseconds between commit and
+        on_commit) is counted twice; `check_consistency()` reports it.
+        """
+        tmp_key = f"{self.key}:rebuild"
+        before_key = f"{self.key}:rebuild:before"
+        changes_key = f"{self.key}:rebuild:changes"
+        pipe = self.redis.pipeline()
+        pipe.delete(tmp_key)
+        pipe.zunionstore(before_key, [self.key])
+        pipe.execute()
+
+        total = 0
+        batch = {}
+        if totals is None:
+            totals = self.load_totals()
+        for contestant_id, total_score in totals:
+            batch[str(contestant_id)] = total_score or 0
+            if len(batch) >= self.rebuild_batch_size:
+                self.redis.zadd(tmp_key, batch)
+                total += len(batch)
+                batch = {}
+        if batch:
+            self.redis.zadd(tmp_key, batch)
+            total += len(batch)
+
+        pipe = self.redis.pipeline()
+        pipe.zunionstore(changes_key, {self.key: 1, before_key: -1})
+        pipe.zremrangebyscore(changes_key, 0, 0)
+        pipe.zunionstore(self.key, [tmp_key, changes_key])
+        pipe.delete(tmp_key, before_key, changes_key)
+        if self.ttl:
+            pipe.expire(self.key, self.ttl)
+        pipe.set(self.ready_key, 1, ex=self.ttl)
+        pipe.execute()
+
+        logger.info(f"Rebuilt leaderboard '{self.key}' with {total} contestants")
+        return total
+
+    def check_consistency(self):
+        """
+        Compare the sorted set against the database.
+        Returns a list of (contestant_id, expected_score, cached_score) mismatches.
+        """
+        expected = {
+            str(contestant_id): total_score or 0
+            for contestant_id, total_score in self.load_totals()
+        }
+        cached = {
+            contestant_id: int(score)
+            for contestant_id, score in self.redis.zscan_iter(self.key)
+        }
+
+        mismatches = []
+        for contestant_id in expected.keys() | cached.keys():
+            expected_score = expected.get(contestant_id, 0)
+            cached_score = cached.get(contestant_id, 0)
+            if expected_score != cached_score:
+                mismatches.append((contestant_id, expected_score, cached_score))
+        return mismatches
+
+
+class GlobalLeaderboard(RedisLeaderboard):
+    key = "leaderboard:global"
+
+    def database_queryset(self):
+        return (
+            GameSession.objects.values("contestant_id", "contestant__name")
+            .annotate(total_score=Sum("score"))
+            .order_by("-total_score", "-contestant_id")
+        )
+
+    def load_totals(self):
+        return (
+            GameSession.objects.values("contestant_id")
+            .annotate(total_score=Sum("score"))
+            .order_by()
+            .values_list("contestant_id", "total_score")
+            .iterator()
+        )
+
+
+class GameLeaderboard(RedisLeaderboard):
+    def __init__(self, game_id, connection=None):
+        super().__init__(connection)
+        self.game_id = game_id
+        self.key = f"leaderboard:game:{game_id}"
+
+    def database_queryset(self):
+        return (
+            ContestantGameScore.objects.filter(game_id=self.game_id)
+            .values("contestant_id", "contestant__name", "total_score")
+            .order_by("-total_score", "-contestant_id")
+        )
+
+    def load_totals(self):
+        return (
+            ContestantGameScore.objects.filter(game_id=self.game_id)
+            .values_list("contestant_id", "total_score")
+            .iterator()
+        )
+
+
+class DateLeaderboard(RedisLeaderboard):
+    ttl = 8 * 24 * 60 * 60  # keep the last week of daily boards in Redis
+
+    def __init__(self, date, connection=None):
+        super().__init__(connection)
+        self.date = date
+        self.key = f"leaderboard:date:{date.isoformat()}"
+
+    def database_queryset(self):
+        return (
+            ContestantDailyScore.objects.filter(date=self.date)
+            .values("contestant_id", "contestant__name", "total_score")
+            .order_by("-total_score", "-contestant_id")
+        )
+
+    def load_totals(self):
+        return (
+            ContestantDailyScore.objects.filter(date=self.date)
+            .values_list("contestant_id", "total_score")
+            .iterator()
+        )
+
+
+def leaderboard_from_key(key, connection=None):
+    """Return the leaderboard stored at `key`, e.g. "leaderboard:game:<id>"."""
+    kind, _, value = key.removeprefix("leaderboard:").partition(":")
+    if kind == "global":
+        return GlobalLeaderboard(connection)
+    if kind == "game":
+        return GameLeaderboard(uuid.UUID(value), connection)
+    if kind == "date":
+        return DateLeaderboard(parse_date(value), connection)
+    raise ValueError(f"Unknown leaderboard key '{key}'.")
+
+
+def iter_leaderboards(days=7, connection=None):
+    """
+    Yield the global leaderboard, every game leaderboard and the date
+    leaderboards for the last `days` days.
+    """
+    connection = connection or get_redis_connection()
+    yield GlobalLeaderboard(connection)
+    for game_id in Game.objects.values_list("id", flat=True).iterator():
+        yield GameLeaderboard(game_id, connection)
+    today = timezone.localdate()
+    for offset in range(days):
+        yield DateLeaderboard(today - timedelta(days=offset), connection)
+
+
+def _rank_result(entries, start, position):
+    for rank, entry in enumerate(entries, start=start + 1):
+        entry["rank"] = rank
+    offset = position - start
+    return {
+        **entries[offset],
+        "above": entries[:offset],
+        "below": entries[offset + 1 :],
+    }
+
+
+class LeaderboardPageSource:
+    """
+    Sequence adapter so Django's Paginator (and DRF's PageNumberPagination)
+    can page through a Redis leaderboard with ZCARD + ZREVRANGE. Also
+    implements `keyset_slice` and `ordering_fields` for KeysetPagination's
+    cursor mode.
+    """
+
+    def __init__(self, leaderboard):
+        self.leaderboard = leaderboard
+
+    def count(self):
+        return self.leaderboard.count()
+
+    def __len__(self):
+        return self.count()
+
+    def keyset_slice(self, after, limit):
+        return self.leaderboard.entries_after(after, limit)
+
+    def ordering_fields(self, ordering):
+        return ordering_fields(self.leaderboard.database_queryset(), ordering)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.leaderboard.entries(item.start or 0, item.stop)
+        return self.leaderboard.entries(item, item + 1)[0]
+
+
+def record_session_score(game_id, contestant_id, date, delta):
+    """
+    Apply a score change to the global, game and date leaderboards in one round
+    trip. Failures are logged rather than raised; the periodic consistency check
+    repairs any missed updates.
+    """
+    record_session_scores([(game_id, contestant_id, date, delta)])
+
+
+def record_session_scores(scores):
+    """
+    Apply many (game_id, contestant_id, date, delta) score changes in one
+    pipeline, summing the changes per leaderboard entry first. The touched
+    leaderboards are marked in the same pipeline for `publish_pending_feeds`,
+    so the live feeds cost no extra round trip or query here.
+    """
+    deltas = defaultdict(int)
+    for game_id, contestant_id, date, delta in scores:
+        if not delta:
+            continue
+        deltas[(None, None, contestant_id)] += delta
+        deltas[(game_id, None, contestant_id)] += delta
+        deltas[(None, date, contestant_id)] += delta
+    if not deltas:
+        return
+
+    try:
+        connection = get_redis_connection()
+        pipe = connection.pipeline(transaction=False)
+        leaderboards = {}
+        for (game_id, date, contestant_id), delta in deltas.items():
+            if game_id is not None:
+                leaderboard = GameLeaderboard(game_id, connection)
+            elif date is not None:
+                leaderboard = DateLeaderboard(date, connection)
+            else:
+                leaderboard = GlobalLeaderboard(connection)
+            leaderboard = leaderboards.setdefault(leaderboard.key, leaderboard)
+            leaderboard.incr(contestant_id, delta, pipe=pipe)
+        pipe.sadd(FEED_PENDING_KEY, *leaderboards)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to update leaderboards for {len(deltas)} entries: {e}")
+
+
+def publish_pending_feeds(connection=None):
+    """
+    Publish the top-N changes of the leaderboards marked by
+    `record_session_scores` since the last call, each once however many
+    sessions touched it. Returns the number of leaderboards published.
+    """
+    connection = connection or get_redis_connection()
+    published = 0
+    while keys := connection.spop(FEED_PENDING_KEY, FEED_PENDING_BATCH):
+        publish_leaderboards(leaderboard_from_key(key, connection) for key in keys)
+        published += len(keys)
+    return published
@@ -0,0 +1,208 @@
+"""
+Live concurrent-player counters.
+
+A Redis hash maps game_id -> number of contestants currently playing. Starting
+a session increments the game's counter and ending one (or deleting the game)
+decrements it, so reading the live player counts is a single HGETALL/HGET
+instead of a COUNT(DISTINCT contestant) scan over open sessions. A contestant
+can only have one open session per game, so open sessions equal players.
+
+The database stays the source of truth: `reconcile_live_players()` recounts
+open sessions and replaces the hash, repairing drift from missed updates.
+Counters are only served once reconciled (tracked by a "ready" key). The first
+read that finds them unreconciled, e.g. after a Redis flush, reconciles them
+itself (one process at a time; the others count from the database meanwhile)
+rather than waiting for the periodic task.
+"""
+
+import logging
+import uuid
+
+from redis.exceptions import RedisError, WatchError
+
+from django.db.models import Count
+
+from gameboard.common.redis.client import get_redis_connection
+from gameboard.games.models import GameSession
+
+logger = logging.getLogger(__name__)
+
+LIVE_PLAYERS_KEY = "live:players"
+LIVE_PLAYERS_READY_KEY = f"{LIVE_PLAYERS_KEY}:ready"
+LIVE_PLAYERS_LOCK_KEY = f"{LIVE_PLAYERS_KEY}:reconciling"
+LIVE_PLAYERS_LOCK_TIMEOUT = 60  # seconds
+
+
+class LiveCountersUnavailable(Exception):
+    """The live counters are missing or unreachable; count from the database instead."""
+
+
+def database_player_counts(game_id=None):
+    """
+    Return {game_id: number of distinct contestants with an open session}.
+    """
+    sessions = GameSession.objects.filter(end_time__isnull=True)
+    if game_id is not None:
+        sessions = sessions.filter(game_id=game_id)
+    return dict(
+        sessions.values("game_id")
+        .annotate(n_current_players=Count("contestant", distinct=True))
+        .order_by()
+        .values_list("game_id", "n_current_players")
+    )
+
+
+def change_live_players(game_id, delta):
+    """
+    Add `delta` to a game's live player counter. Failures are logged rather
+    than raised; the reconciler repairs any missed updates.
+    """
+    if not delta:
+        return
+    try:
+        get_redis_connection().hincrby(LIVE_PLAYERS_KEY, str(game_id), delta)
+    except RedisError as e:
+        logger.warning(f"Failed to update live players for game {game_id}: {e}")
+
+
+def live_player_counts():
+    """
+    Return {game_id: live player count} for every game with players.
+    Raises LiveCountersUnavailable if the counters have not been reconciled.
+    """
+    pipe = get_redis_connection().pipeline(transaction=False)
+    pipe.exists(LIVE_PLAYERS_READY_KEY)
+    pipe.hgetall(LIVE_PLAYERS_KEY)
+    ready, counts = pipe.execute()
+    if not ready:
+        raise LiveCountersUnavailable(f"'{LIVE_PLAYERS_KEY}' is not built")
+    return {
+        uuid.UUID(game_id): int(count)
+        for game_id, count in counts.items()
+        if int(count) > 0
+    }
+
+
+def live_player_count(game_id):
+    """
+    Return the live player count of one game.
+    Raises LiveCountersUnavailable if the counters have not been reconciled.
+    """
+    pipe = get_redis_connection().pipeline(transaction=False)
+    pipe.exists(LIVE_PLAYERS_READY_KEY)
+    pipe.hget(LIVE_PLAYERS_KEY, str(game_id))
+    ready, count = pipe.execute()
+    if not ready:
+        raise LiveCountersUnavailable(f"'{LIVE_PLAYERS_KEY}' is not built")
+    return max(int(count or 0), 0)
+
+
+def reconcile_on_first_use():
+    """
+    Reconcile the counters unless another process already is.
+    Returns whether they were reconciled.
+    """
+    redis = get_redis_connection()
+    if not redis.set(LIVE_PLAYERS_LOCK_KEY, 1, nx=True, ex=LIVE_PLAYERS_LOCK_TIMEOUT):
+        return False
+    try:
+        reconcile_live_players()
+    finally:
+        redis.delete(LIVE_PLAYERS_LOCK_KEY)
+    return True
+
+
+def _read_live(read, *args):
+    try:
+        return read(*args)
+    except LiveCountersUnavailable:
+        if not reconcile_on_first_use():
+            raise
+        return read(*args)
+
+
+def current_player_counts():
+    """
+    Return {game_id: concurrent players} from the live counters, falling back
+    to counting open sessions when Redis is unavailable.
+    """
+    try:
+        return _read_live(live_player_counts)
+    except (LiveCountersUnavailable, RedisError) as e:
+        logger.warning(f"Counting current players from database: {e}")
+        return database_player_counts()
+
+
+def current_player_count(game_id):
+    try:
+        return _read_live(live_player_count, game_id)
+    except (LiveCountersUnavailable, RedisError) as e:
+        logger.warning(f"Counting current players of game {game_id} from database: {e}")
+        return database_player_counts(game_id).get(game_id, 0)
+
+
+def _read_counts(counts):
+    return {game_id: int(count) for game_id, count in counts.items()}
+
+
+def reconcile_live_players():
+    """
+    Recount open sessions and replace the live counters with the result.
+    Returns {game_id: (live count, database count)} for every counter that had drifted.
+
+    Counters changed while the sessions are counted would be lost by a plain
+    replace, so the hash is copied first and the changes made since the copy
+    are added to the new counts; the replace is a WATCHed transaction, retried
+    if a counter changes meanwhile. A session whose database commit precedes
+    the count but whose HINCRBY follows the copy is counted twice until the
+    next reconcile.
+    """
+    redis = get_redis_connection()
+    pipe = redis.pipeline(transaction=False)
+    pipe.exists(LIVE_PLAYERS_READY_KEY)
+    pipe.hgetall(LIVE_PLAYERS_KEY)
+    ready, before = pipe.execute()
+    before = _read_counts(before)
+
+    counts = {
+        str(game_id): count for game_id, count in database_player_counts().items()
+    }
+    drift = (
+        {
+            game_id: (before.get(game_id, 0), counts.get(game_id, 0))
+            for game_id in before.keys() | counts.keys()
+            if before.get(game_id, 0) != counts.get(game_id, 0)
+        }
+        if ready
+        else {}
+    )
+
+    with redis.pipeline() as pipe:
+        while True:
+            try:
+                pipe.watch(LIVE_PLAYERS_KEY)
+                current = _read_counts(pipe.hgetall(LIVE_PLAYERS_KEY))
+                rebuilt = {
+                    game_id: counts.get(game_id, 0)
+                    + current.get(game_id, 0)
+                    - before.get(game_id, 0)
+                    for game_id in counts.keys() | current.keys() | before.keys()
+                }
+                rebuilt = {
+                    game_id: count for game_id, count in rebuilt.items() if count
+                }
+
+                pipe.multi()
+                pipe.delete(LIVE_PLAYERS_KEY)
+                if rebuilt:
+                    pipe.hset(LIVE_PLAYERS_KEY, mapping=rebuilt)
+                pipe.set(LIVE_PLAYERS_READY_KEY, 1)
+                pipe.execute()
+                break
+            except WatchError:
+                continue
+
+    logger.info(
+        f"Reconciled live players for {len(counts)} games, {len(drift)} had drifted"
+    )
+    return drift
@@ -1,56 +1,90 @@
-import random
-from datetime import datetime, timedelta
+from time import perf_counter
 
-from django.core.management.base import BaseCommand
-from django.utils.timezone import make_aware
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 
-from gameboard.games.models import Contestant, Game, GameSession
+from gameboard.games.scores import rebuild_score_totals
+from gameboard.games.synthetic import generate
 
 
 class Command(BaseCommand):
-    help = "Populate the database with test data for games, contestants, and sessions"
-
-    def handle(self, *args, **kwargs):
-        self.create_games()
-        self.create_contestants()
-        self.create_game_sessions()
-
-    def create_games(self):
-        self.games = []
-        game_names = ["Chess", "Poker", "Tetris", "Fortnite", "Call of Duty"]
-        for name in game_names:
-            game = Game.objects.create(name=name, upvotes=random.randint(10, 100))
-            self.games.append(game)
-        self.stdout.write(self.style.SUCCESS(f"✅ Created {len(self.games)} games"))
-
-    def create_contestants(self):
-        self.contestants = []
-        base_time = make_aware(datetime.now() - timedelta(days=3))
-
-        for i in range(10):  # Creating 10 contestants
-            join_time = base_time + timedelta(hours=random.randint(0, 48))
-            contestant = Contestant.objects.create(
-                name=f"Player_{i+1}", is_active=True, joined_at=join_time
-            )
-            self.contestants.append(contestant)
+    help = (
+        "Populate the database with synthetic games, contestants and sessions "
+        "with skewed, seeded distributions, e.g. --sessions 10000000 --workers 8"
+    )
 
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=20)
+        parser.add_argument("--contestants", type=int, default=1000)
+        parser.add_argument("--sessions", type=int, default=10_000)
+        parser.add_argument(
+            "--days", type=int, default=7, help="Days of session history."
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--open-fraction",
+            type=float,
+            default=0.01,
+            help="Share of sessions left open (at most one per game and contestant).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes inserting sessions; use with PostgreSQL, not SQLite.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted per bulk_create batch.",
+        )
+        parser.add_argument(
+            "--skip-totals",
+            action="store_true",
+            help="Do not rebuild the contestant score tables afterwards.",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["games"], options["contestants"]) < 1:
+            raise CommandError("At least one game and one contestant are required.")
+        if options["workers"] > 1 and connection.vendor == "sqlite":
+            raise CommandError("SQLite allows a single writer; use --workers 1.")
+
+        started = perf_counter()
+        self.inserted = 0
+        counts = generate(
+            games=options["games"],
+            contestants=options["contestants"],
+            sessions=options["sessions"],
+            days=options["days"],
+            seed=options["seed"],
+            open_fraction=options["open_fraction"],
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            progress=self.report_progress,
+        )
+        elapsed = perf_counter() - started
         self.stdout.write(
-            self.style.SUCCESS(f"✅ Created {len(self.contestants)} contestants")
+            self.style.SUCCESS(
+                f"✅ Created {counts['games']} games, {counts['contestants']} contestants "
+                f"and {counts['sessions']} sessions ({counts['open_sessions']} open) "
+                f"in {elapsed:.1f}s"
+            )
         )
 
-    def create_game_sessions(self):
-        base_time = make_aware(datetime.now() - timedelta(days=1))
-        for contestant in self.contestants:
-            game = random.choice(self.games)
-            start_time = base_time + timedelta(minutes=random.randint(0, 300))
-            end_time = start_time + timedelta(minutes=random.randint(10, 60))
-
-            GameSession.objects.create(
-                game=game,
-                contestant=contestant,
-                start_time=start_time,
-                end_time=end_time,
-                score=random.randint(10, 100),
+        if not options["skip_totals"]:
+            n_game_scores, n_daily_scores, n_game_daily_scores = rebuild_score_totals(
+                batch_size=options["batch_size"]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ Rebuilt {n_game_scores} game scores, {n_daily_scores} daily "
+                    f"scores and {n_game_daily_scores} game daily scores in "
+                    f"{perf_counter() - started - elapsed:.1f}s"
+                )
             )
 
-        self.stdout.write(self.style.SUCCESS("✅ Created game sessions with scores"))
+    def report_progress(self, count):
+        self.inserted += count
+        self.stdout.write(f"Inserted {self.inserted} ended sessions")
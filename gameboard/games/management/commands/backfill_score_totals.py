@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from gameboard.games.scores import rebuild_score_totals
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-game, per-date and per-game-and-date contestant score tables "
+        "from game sessions"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows inserted per bulk_create batch.",
+        )
+
+    def handle(self, *args, **options):
+        n_game_scores, n_daily_scores, n_game_daily_scores = rebuild_score_totals(
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Backfilled {n_game_scores} game scores, {n_daily_scores} daily "
+                f"scores and {n_game_daily_scores} game daily scores"
+            )
+        )
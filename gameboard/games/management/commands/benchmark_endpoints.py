@@ -0,0 +1,187 @@
+import json
+import logging
+import platform
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from gameboard.common.redis.client import reset_redis_connections
+from gameboard.games.benchmark import (
+    DEFAULT_THRESHOLD,
+    SIZES,
+    benchmark_routes,
+    compare,
+    prepare_dataset,
+    redis_available,
+)
+
+# Nothing listens on port 1, so every Redis call fails fast and the views
+# take their database fallbacks
+UNREACHABLE_REDIS_URL = "redis://127.0.0.1:1/0"
+
+# A single process needs no shared cache, and clearing this one between
+# requests cannot flush a Redis database
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "gameboard.common.cache.TimedCache",
+        "TIMED_BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every API route against generated datasets of several sizes, "
+        "write latency percentiles, queries per request and peak memory to a "
+        "JSON file, and optionally compare them with a baseline run"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", nargs="+", choices=list(SIZES), default=["small"]
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Measured requests per route and size.",
+        )
+        parser.add_argument(
+            "--routes", nargs="+", help="Route names to run; defaults to all."
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="Keep the response cache between requests instead of clearing it.",
+        )
+        parser.add_argument(
+            "--redis-url",
+            help=(
+                "Scratch Redis database for the leaderboards; it is overwritten. "
+                "Without it Redis is disabled and the database fallbacks are measured."
+            ),
+        )
+        parser.add_argument("--output", default="benchmark-results.json")
+        parser.add_argument(
+            "--baseline", help="Results file of an earlier run to compare with."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help="Relative growth in p95 latency or peak memory that is a regression.",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        baseline = None
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+
+        setup_test_environment()
+        # Fallback warnings from every request would bury the results
+        logging.disable(logging.WARNING)
+        try:
+            with override_settings(
+                REDIS_URL=options["redis_url"] or UNREACHABLE_REDIS_URL,
+                CACHES=BENCHMARK_CACHES,
+            ):
+                reset_redis_connections()
+                results = self.run_sizes(options)
+        finally:
+            logging.disable(logging.NOTSET)
+            reset_redis_connections()
+            teardown_test_environment()
+
+        with open(options["output"], "w") as f:
+            json.dump(results, f, indent=2)
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Wrote benchmark results to {options['output']}")
+        )
+
+        if baseline is not None:
+            self.report_regressions(
+                compare(results, baseline, threshold=options["threshold"]),
+                options["baseline"],
+            )
+
+    def run_sizes(self, options):
+        redis = redis_available()
+        if options["redis_url"] and not redis:
+            raise CommandError(f"Cannot connect to Redis at {options['redis_url']}.")
+
+        results = {
+            "created_at": timezone.now().isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "redis": redis,
+                "cache": "warm" if options["warm_cache"] else "cold",
+            },
+            "iterations": options["iterations"],
+            "sizes": {},
+        }
+        for size in options["sizes"]:
+            # A fresh test database per size, so the dataset is exactly the seeded one
+            old_config = setup_databases(
+                verbosity=0, interactive=False, serialized_aliases=set()
+            )
+            try:
+                self.stdout.write(f"Generating the {size} dataset...")
+                dataset = prepare_dataset(size, seed=options["seed"], redis=redis)
+                self.stdout.write(
+                    f"{dataset['games']} games, {dataset['contestants']} "
+                    f"contestants, {dataset['sessions']} sessions"
+                )
+                routes = benchmark_routes(
+                    options["iterations"],
+                    names=options["routes"],
+                    cold=not options["warm_cache"],
+                    progress=self.report_route,
+                )
+            finally:
+                teardown_databases(old_config, verbosity=0)
+            results["sizes"][size] = {"dataset": dataset, "routes": routes}
+        return results
+
+    def report_route(self, name, result):
+        line = (
+            f"{result['method']:<5} {name:<32} p50 {result['p50_ms']:8.2f} ms  "
+            f"p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+            f"{result['queries']:6.1f} queries  {result['peak_memory_kib']:8.1f} KiB"
+        )
+        if result["errors"]:
+            line += f"  {result['errors']} errors {result['status']}"
+            self.stdout.write(self.style.WARNING(line))
+        else:
+            self.stdout.write(line)
+
+    def report_regressions(self, regressions, baseline_path):
+        for regression in regressions:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"{regression['size']} {regression['route']}: "
+                    f"{regression['metric']} {regression['baseline']} -> "
+                    f"{regression['current']}"
+                )
+            )
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} regressions against {baseline_path}."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ No regressions against {baseline_path}")
+        )
@@ -0,0 +1,133 @@
+from time import perf_counter
+
+import numpy as np
+
+from django.core.management.base import BaseCommand
+
+from gameboard.games.popularity import popularity_score
+from gameboard.games.scoring import (
+    DEFAULT_WEIGHTS,
+    build_factor_matrix,
+    build_weight_matrix,
+    score_matrix,
+)
+
+TRENDING_WEIGHTS = {
+    "daily_players_weight": 0.15,
+    "current_players_weight": 0.45,
+    "upvotes_weight": 0.1,
+    "session_length_weight": 0.1,
+    "daily_sessions_weight": 0.2,
+}
+
+
+class Command(BaseCommand):
+    help = "Compare per-game loop scoring with vectorized NumPy scoring on synthetic factors"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--games",
+            type=int,
+            nargs="+",
+            default=[10_000, 100_000],
+            help="Number of synthetic games to score.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per path; the best time is reported.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        profiles = [DEFAULT_WEIGHTS, TRENDING_WEIGHTS]
+        rng = np.random.default_rng(options["seed"])
+
+        for n_games in options["games"]:
+            game_ids, daily_factors, current_players, upvotes = self.synthetic_factors(
+                rng, n_games
+            )
+            max_values = {
+                "max_daily_players": max(
+                    f["n_daily_players"] for f in daily_factors.values()
+                ),
+                "max_concurrent_players": max(current_players.values()),
+                "max_upvotes": max(upvotes.values()),
+                "max_session_length_across_all_games": max(
+                    f["max_session_length_for_game"] for f in daily_factors.values()
+                ),
+                "max_daily_sessions": max(
+                    f["n_daily_sessions"] for f in daily_factors.values()
+                ),
+            }
+
+            def loop():
+                return [
+                    [
+                        popularity_score(
+                            n_daily_players=daily_factors[game_id]["n_daily_players"],
+                            n_current_players=current_players[game_id],
+                            n_upvotes=upvotes[game_id],
+                            max_session_length_for_game=daily_factors[game_id][
+                                "max_session_length_for_game"
+                            ],
+                            n_daily_sessions=daily_factors[game_id]["n_daily_sessions"],
+                            max_values=max_values,
+                            weights=weights,
+                        )
+                        for weights in profiles
+                    ]
+                    for game_id in game_ids
+                ]
+
+            def vector():
+                return score_matrix(
+                    build_factor_matrix(
+                        game_ids, daily_factors, current_players, upvotes
+                    ),
+                    max_values,
+                    build_weight_matrix(profiles),
+                )
+
+            loop_time, loop_scores = self.best_of(loop, options["repeat"])
+            vector_time, vector_scores = self.best_of(vector, options["repeat"])
+            max_diff = float(np.max(np.abs(np.array(loop_scores) - vector_scores)))
+
+            self.stdout.write(
+                f"{n_games} games x {len(profiles)} profiles: "
+                f"loop {loop_time * 1000:.1f} ms, vector {vector_time * 1000:.1f} ms "
+                f"({loop_time / vector_time:.1f}x), max score difference {max_diff:.2f}"
+            )
+
+    def synthetic_factors(self, rng, n_games):
+        game_ids = list(range(n_games))
+        daily_players = rng.integers(0, 5_000, n_games)
+        session_lengths = rng.exponential(1_800, n_games)
+        daily_sessions = daily_players * rng.integers(1, 5, n_games)
+        current_players = rng.integers(0, 500, n_games)
+        upvotes = rng.integers(0, 100_000, n_games)
+
+        daily_factors = {
+            game_id: {
+                "n_daily_players": int(daily_players[game_id]),
+                "max_session_length_for_game": float(session_lengths[game_id]),
+                "n_daily_sessions": int(daily_sessions[game_id]),
+            }
+            for game_id in game_ids
+        }
+        return (
+            game_ids,
+            daily_factors,
+            dict(zip(game_ids, current_players.tolist())),
+            dict(zip(game_ids, upvotes.tolist())),
+        )
+
+    def best_of(self, fn, repeat):
+        best = None
+        for _ in range(repeat):
+            started = perf_counter()
+            result = fn()
+            elapsed = perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from gameboard.games.popularity import cache_daily_factors
+
+
+class Command(BaseCommand):
+    help = "Compute and cache daily game popularity factors for a date (defaults to yesterday)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            help="Date to compute factors for (YYYY-MM-DD).",
+        )
+
+    def handle(self, *args, **options):
+        if options["date"]:
+            date = parse_date(options["date"])
+            if not date:
+                raise CommandError("Invalid date format.")
+        else:
+            date = timezone.now().date() - timedelta(days=1)
+
+        _, _, report = cache_daily_factors(date)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Cached popularity factors for {report['games']} games on {report['date']}: "
+                f"{report['rows_scanned']} sessions scanned in {report['elapsed_seconds']}s"
+            )
+        )
@@ -0,0 +1,202 @@
+import asyncio
+import itertools
+import resource
+from time import monotonic, perf_counter
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils import timezone
+
+from gameboard.games.models import Game
+
+# Read-heavy endpoints polled by many clients
+ENDPOINTS = (
+    "global-leaderboard",
+    "game-leaderboard",
+    "date-leaderboard",
+    "popularity-leaderboard",
+    "game-details",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test the read-heavy endpoints with many concurrent keep-alive "
+        "clients and report req/s and latency percentiles, optionally comparing "
+        "two servers, e.g. WSGI and ASGI"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000",
+            help="Server to load, e.g. gunicorn or uvicorn.",
+        )
+        parser.add_argument(
+            "--compare-base-url",
+            help="Second server running the same code to compare with, e.g. uvicorn.",
+        )
+        parser.add_argument("--clients", type=int, default=1000)
+        parser.add_argument(
+            "--duration", type=float, default=20, help="Seconds per endpoint."
+        )
+        parser.add_argument(
+            "--timeout", type=float, default=10, help="Seconds per request."
+        )
+        parser.add_argument(
+            "--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS)
+        )
+        parser.add_argument(
+            "--game-id", help="Game for the per-game endpoints; defaults to any game."
+        )
+        parser.add_argument(
+            "--cache-bust",
+            action="store_true",
+            help="Add a unique query parameter per request to bypass response caching.",
+        )
+
+    def handle(self, *args, **options):
+        self.request_ids = itertools.count()
+        self.raise_open_files_limit(options["clients"])
+        game_id = (
+            options["game_id"] or Game.objects.values_list("id", flat=True).first()
+        )
+        date = timezone.localdate().isoformat()
+        targets = [urlsplit(options["base_url"])]
+        if options["compare_base_url"]:
+            targets.append(urlsplit(options["compare_base_url"]))
+
+        for endpoint in options["endpoints"]:
+            if endpoint in ("game-leaderboard", "game-details"):
+                if game_id is None:
+                    raise CommandError("No games found; pass --game-id.")
+                path = reverse(endpoint, kwargs={"game_id": game_id})
+            else:
+                path = reverse(endpoint)
+            if endpoint == "date-leaderboard":
+                path += f"?date={date}"
+
+            results = []
+            for target in targets:
+                results.append(asyncio.run(self.run_load(target, path, options)))
+                self.report(endpoint, target.netloc, results[-1])
+
+            if len(results) == 2 and results[0]["rps"]:
+                self.stdout.write(
+                    f"{endpoint}: {targets[1].netloc}/{targets[0].netloc} throughput "
+                    f"{results[1]['rps'] / results[0]['rps']:.2f}x"
+                )
+
+        self.stdout.write(self.style.SUCCESS("✅ Load test complete"))
+
+    def raise_open_files_limit(self, clients):
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        wanted = clients + 256
+        if soft != resource.RLIM_INFINITY and soft < wanted:
+            limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+    async def run_load(self, target, path, options):
+        deadline = monotonic() + options["duration"]
+        latencies = []
+        errors = [0]
+        started = perf_counter()
+        await asyncio.gather(
+            *(
+                self.client(target, path, deadline, latencies, errors, options)
+                for _ in range(options["clients"])
+            )
+        )
+        elapsed = perf_counter() - started
+        latencies = np.array(latencies) * 1000
+        return {
+            "requests": len(latencies),
+            "errors": errors[0],
+            "rps": len(latencies) / elapsed,
+            "p50": float(np.percentile(latencies, 50)) if len(latencies) else None,
+            "p99": float(np.percentile(latencies, 99)) if len(latencies) else None,
+        }
+
+    async def client(self, target, path, deadline, latencies, errors, options):
+        """
+        One keep-alive client sending GET requests back to back until the
+        deadline. Only successful (2xx) responses are counted in the latencies.
+        """
+        connection = None
+        while monotonic() < deadline:
+            request_path = path
+            if options["cache_bust"]:
+                separator = "&" if "?" in path else "?"
+                request_path = f"{path}{separator}_={next(self.request_ids)}"
+            started = perf_counter()
+            try:
+                if connection is None:
+                    connection = await asyncio.wait_for(
+                        asyncio.open_connection(target.hostname, target.port or 80),
+                        options["timeout"],
+                    )
+                status, keep_alive = await asyncio.wait_for(
+                    self.get(*connection, target.netloc, request_path),
+                    options["timeout"],
+                )
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                errors[0] += 1
+                connection = self.close(connection)
+                continue
+
+            if 200 <= status < 300:
+                latencies.append(perf_counter() - started)
+            else:
+                errors[0] += 1
+            if not keep_alive:
+                connection = self.close(connection)
+        self.close(connection)
+
+    async def get(self, reader, writer, host, path):
+        """Send one HTTP/1.1 GET and read the response; returns (status, keep_alive)."""
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n"
+            "Connection: keep-alive\r\n\r\n".encode()
+        )
+        await writer.drain()
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding") == "chunked":
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                await reader.readexactly(size + 2)
+        else:
+            await reader.read()
+            return int(status_line.split()[1]), False
+
+        return int(status_line.split()[1]), headers.get("connection") != "close"
+
+    def close(self, connection):
+        if connection is not None:
+            connection[1].close()
+        return None
+
+    def report(self, endpoint, server, result):
+        latency = (
+            f"p50 {result['p50']:.1f} ms, p99 {result['p99']:.1f} ms"
+            if result["requests"]
+            else "no successful requests"
+        )
+        self.stdout.write(
+            f"{endpoint} [{server}]: {result['requests']} requests, "
+            f"{result['errors']} errors, {result['rps']:.1f} req/s, {latency}"
+        )
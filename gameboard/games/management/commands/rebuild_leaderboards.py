@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+
+from gameboard.games.leaderboard import iter_leaderboards
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis leaderboards from the database, or check them for drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report differences between Redis and the database.",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Number of recent daily leaderboards to include.",
+        )
+
+    def handle(self, *args, **options):
+        for leaderboard in iter_leaderboards(days=options["days"]):
+            if options["check"]:
+                self.check(leaderboard)
+            else:
+                total = leaderboard.rebuild()
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✅ Rebuilt leaderboard '{leaderboard.key}' with {total} contestants"
+                    )
+                )
+
+    def check(self, leaderboard):
+        if not leaderboard.is_ready():
+            self.stdout.write(
+                self.style.WARNING(f"⚠️ Leaderboard '{leaderboard.key}' is not built")
+            )
+            return
+
+        mismatches = leaderboard.check_consistency()
+        for contestant_id, expected, cached in mismatches:
+            self.stdout.write(f"{contestant_id}: database={expected} redis={cached}")
+        if mismatches:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"⚠️ {len(mismatches)} mismatches in '{leaderboard.key}'"
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ Leaderboard '{leaderboard.key}' is consistent")
+            )
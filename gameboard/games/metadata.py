@@ -0,0 +1,66 @@
+"""
+In-process cache of game and contestant metadata (name, is_active).
+
+Hot write paths such as starting a session only need to know that the game and
+contestant exist and are active, plus their names for the response. Entries
+are kept per process for METADATA_TIMEOUT seconds, so a repeat lookup costs no
+query. Views that change these fields invalidate the entry in their own
+process; other processes pick the change up when the entry expires. At most
+METADATA_MAXSIZE entries are kept per model; the least recently used one is
+evicted first.
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+from gameboard.games.models import Contestant, Game
+
+METADATA_TIMEOUT = 30  # seconds
+METADATA_MAXSIZE = 10_000
+
+
+class MetadataCache:
+    fields = ("name", "is_active")
+
+    def __init__(self, model, timeout=METADATA_TIMEOUT, maxsize=METADATA_MAXSIZE):
+        self.model = model
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        # Threaded WSGI/ASGI workers look objects up from several threads
+        self.lock = threading.Lock()
+
+    def get(self, object_id):
+        """
+        Return {"name", "is_active"} for the object, or None if it does not exist.
+        Missing objects are not cached, so newly created ones are found at once.
+        """
+        with self.lock:
+            entry = self.entries.get(object_id)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.entries.move_to_end(object_id)
+                    return entry[1]
+                del self.entries[object_id]
+
+        values = self.model.objects.filter(id=object_id).values(*self.fields).first()
+        if values is not None:
+            with self.lock:
+                self.entries[object_id] = (time.monotonic() + self.timeout, values)
+                self.entries.move_to_end(object_id)
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return values
+
+    def invalidate(self, object_id):
+        with self.lock:
+            self.entries.pop(object_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+game_metadata = MetadataCache(Game)
+contestant_metadata = MetadataCache(Contestant)
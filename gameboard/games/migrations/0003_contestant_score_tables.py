@@ -0,0 +1,109 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:09
+
+import django.db.models.deletion
+import django.utils.timezone
+import ulid2
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0002_game_is_active"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContestantDailyScore",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=ulid2.generate_ulid_as_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                ("total_score", models.IntegerField(default=0)),
+                (
+                    "contestant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="games.contestant",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["date", "-total_score", "contestant"],
+                        name="daily_score_rank_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "contestant"),
+                        name="unique_contestant_daily_score",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ContestantGameScore",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=ulid2.generate_ulid_as_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("total_score", models.IntegerField(default=0)),
+                (
+                    "contestant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="games.contestant",
+                    ),
+                ),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="games.game"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["game", "-total_score", "contestant"],
+                        name="game_score_rank_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "contestant"),
+                        name="unique_contestant_game_score",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0003_contestant_score_tables"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="contestantdailyscore",
+            name="daily_score_rank_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="contestantgamescore",
+            name="game_score_rank_idx",
+        ),
+        migrations.AddIndex(
+            model_name="contestantdailyscore",
+            index=models.Index(
+                fields=["date", "-total_score", "-contestant"],
+                name="daily_score_rank_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contestantgamescore",
+            index=models.Index(
+                fields=["game", "-total_score", "-contestant"],
+                name="game_score_rank_idx",
+            ),
+        ),
+    ]
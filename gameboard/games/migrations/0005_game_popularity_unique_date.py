@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:13
+
+from django.db import migrations, models
+
+
+def delete_duplicate_popularity_rows(apps, schema_editor):
+    """Keep only the most recently updated row per (game, date)."""
+    GamePopularity = apps.get_model("games", "GamePopularity")
+    seen = set()
+    duplicate_ids = []
+    for row in GamePopularity.objects.order_by(
+        "game_id", "date", "-last_updated"
+    ).values("id", "game_id", "date"):
+        key = (row["game_id"], row["date"])
+        if key in seen:
+            duplicate_ids.append(row["id"])
+        else:
+            seen.add(key)
+    GamePopularity.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0004_score_tables_tie_order"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_popularity_rows, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="gamepopularity",
+            constraint=models.UniqueConstraint(
+                fields=("game", "date"), name="unique_game_popularity_date"
+            ),
+        ),
+    ]
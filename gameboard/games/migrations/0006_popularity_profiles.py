@@ -0,0 +1,100 @@
+import django.db.models.deletion
+import django.utils.timezone
+import ulid2
+from django.db import migrations, models
+
+PROFILES = {
+    "default": {
+        "daily_players_weight": 0.3,
+        "current_players_weight": 0.2,
+        "upvotes_weight": 0.25,
+        "session_length_weight": 0.15,
+        "daily_sessions_weight": 0.1,
+    },
+    "trending": {
+        "daily_players_weight": 0.15,
+        "current_players_weight": 0.45,
+        "upvotes_weight": 0.1,
+        "session_length_weight": 0.1,
+        "daily_sessions_weight": 0.2,
+    },
+}
+
+
+def create_profiles(apps, schema_editor):
+    PopularityProfile = apps.get_model("games", "PopularityProfile")
+    GamePopularity = apps.get_model("games", "GamePopularity")
+    for name, weights in PROFILES.items():
+        PopularityProfile.objects.update_or_create(name=name, defaults=weights)
+    default = PopularityProfile.objects.get(name="default")
+    GamePopularity.objects.filter(profile__isnull=True).update(profile=default)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0005_game_popularity_unique_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PopularityProfile",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=ulid2.generate_ulid_as_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=64, unique=True)),
+                ("daily_players_weight", models.FloatField(default=0)),
+                ("current_players_weight", models.FloatField(default=0)),
+                ("upvotes_weight", models.FloatField(default=0)),
+                ("session_length_weight", models.FloatField(default=0)),
+                ("daily_sessions_weight", models.FloatField(default=0)),
+                ("is_active", models.BooleanField(default=True)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="gamepopularity",
+            name="profile",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="games.popularityprofile",
+            ),
+        ),
+        migrations.RunPython(create_profiles, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="gamepopularity",
+            name="profile",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                to="games.popularityprofile",
+            ),
+        ),
+        migrations.RemoveConstraint(
+            model_name="gamepopularity",
+            name="unique_game_popularity_date",
+        ),
+        migrations.AddConstraint(
+            model_name="gamepopularity",
+            constraint=models.UniqueConstraint(
+                fields=("game", "date", "profile"),
+                name="unique_game_popularity_date_profile",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:02
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def backfill_start_date(apps, schema_editor):
+    GameSession = apps.get_model("games", "GameSession")
+    GameSession.objects.update(start_date=TruncDate("start_time"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0006_popularity_profiles"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="start_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_start_date, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="gamesession",
+            name="start_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                condition=models.Q(("end_time__isnull", True)),
+                fields=["game", "contestant"],
+                name="session_open_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                fields=["game", "-start_time", "-id"], name="session_game_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                fields=["contestant", "-start_time", "-id"],
+                name="session_contestant_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                fields=["start_date", "game"], name="session_start_date_idx"
+            ),
+        ),
+    ]
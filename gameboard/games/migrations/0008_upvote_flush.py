@@ -0,0 +1,44 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:23
+
+import django.utils.timezone
+import ulid2
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0007_session_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UpvoteFlush",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=ulid2.generate_ulid_as_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("batch_id", models.CharField(max_length=32, unique=True)),
+                ("games", models.IntegerField(default=0)),
+                ("upvotes", models.IntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["created_at"], name="upvote_flush_created_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.1.6 on 2026-10-18 20:41
+
+import logging
+
+from django.db import migrations, models
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def end_duplicate_open_sessions(apps, schema_editor):
+    """
+    Keep the latest open session per (game, contestant) and end the others,
+    logging the ids of the sessions ended (their end_time is set to now).
+    """
+    GameSession = apps.get_model("games", "GameSession")
+    seen = set()
+    duplicate_ids = []
+    for row in (
+        GameSession.objects.filter(end_time__isnull=True)
+        .order_by("game_id", "contestant_id", "-start_time")
+        .values("id", "game_id", "contestant_id")
+    ):
+        key = (row["game_id"], row["contestant_id"])
+        if key in seen:
+            duplicate_ids.append(row["id"])
+        else:
+            seen.add(key)
+    if not duplicate_ids:
+        return
+    GameSession.objects.filter(id__in=duplicate_ids).update(end_time=timezone.now())
+    logger.warning(
+        f"Ended {len(duplicate_ids)} duplicate open sessions: "
+        f"{', '.join(str(session_id) for session_id in duplicate_ids)}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0008_upvote_flush"),
+    ]
+
+    operations = [
+        migrations.RunPython(end_duplicate_open_sessions, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="gamesession",
+            name="session_open_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="gamesession",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("end_time__isnull", True)),
+                fields=("game", "contestant"),
+                name="unique_open_session",
+            ),
+        ),
+    ]
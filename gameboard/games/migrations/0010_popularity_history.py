@@ -0,0 +1,62 @@
+# Generated by Django 5.1.6 on 2026-10-18 17:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0009_unique_open_session"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PopularityHistory",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "resolution",
+                    models.PositiveIntegerField(
+                        choices=[(300, "5 minutes"), (3600, "1 hour"), (86400, "1 day")]
+                    ),
+                ),
+                ("bucket", models.DateTimeField()),
+                ("score", models.FloatField()),
+                ("min_score", models.FloatField(blank=True, null=True)),
+                ("max_score", models.FloatField(blank=True, null=True)),
+                ("samples", models.PositiveIntegerField(default=1)),
+                (
+                    "game",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="games.game",
+                    ),
+                ),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="games.popularityprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "popularity history",
+                "indexes": [
+                    models.Index(
+                        fields=["resolution", "bucket"],
+                        name="popularity_history_bucket_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "profile", "resolution", "bucket"),
+                        name="unique_popularity_history_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0010_popularity_history"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamepopularity",
+            index=models.Index(
+                fields=["-date", "-id"], name="game_popularity_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                fields=["-start_time", "-id"], name="session_recent_idx"
+            ),
+        ),
+    ]
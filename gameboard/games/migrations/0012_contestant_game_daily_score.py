@@ -0,0 +1,88 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:03
+
+import django.db.models.deletion
+import django.utils.timezone
+import ulid2
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_game_daily_scores(apps, schema_editor):
+    GameSession = apps.get_model("games", "GameSession")
+    ContestantGameDailyScore = apps.get_model("games", "ContestantGameDailyScore")
+    totals = (
+        GameSession.objects.filter(end_time__isnull=False)
+        .values("game_id", "start_date", "contestant_id")
+        .annotate(total_score=Sum("score"))
+        .order_by()
+        .values_list("game_id", "start_date", "contestant_id", "total_score")
+    )
+    batch = []
+    for game_id, date, contestant_id, total_score in totals.iterator():
+        batch.append(
+            ContestantGameDailyScore(
+                game_id=game_id,
+                date=date,
+                contestant_id=contestant_id,
+                total_score=total_score or 0,
+            )
+        )
+        if len(batch) == 1000:
+            ContestantGameDailyScore.objects.bulk_create(batch)
+            batch = []
+    ContestantGameDailyScore.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0011_admin_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContestantGameDailyScore",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=ulid2.generate_ulid_as_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True, default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                ("total_score", models.IntegerField(default=0)),
+                (
+                    "contestant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="games.contestant",
+                    ),
+                ),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="games.game"
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game", "date", "contestant"),
+                        name="unique_contestant_game_daily_score",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_game_daily_scores, migrations.RunPython.noop),
+    ]
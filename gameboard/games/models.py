@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.dateformat import format
 
 from gameboard.common.db.models import AuditDates, UUIDAsPrimaryKey
@@ -33,19 +34,232 @@ class GameSession(AuditDates, UUIDAsPrimaryKey):
     game = models.ForeignKey(Game, on_delete=models.CASCADE)
     contestant = models.ForeignKey(Contestant, on_delete=models.CASCADE)
     start_time = models.DateTimeField()
+    # Local date of start_time, stored so per-date filters can use an index
+    start_date = models.DateField(editable=False)
     end_time = models.DateTimeField(null=True, blank=True)
     score = models.IntegerField(default=0)
 
+    class Meta:
+        constraints = [
+            # At most one open session per contestant per game
+            models.UniqueConstraint(
+                fields=["game", "contestant"],
+                condition=models.Q(end_time__isnull=True),
+                name="unique_open_session",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["game", "-start_time", "-id"],
+                name="session_game_recent_idx",
+            ),
+            models.Index(
+                fields=["contestant", "-start_time", "-id"],
+                name="session_contestant_recent_idx",
+            ),
+            models.Index(
+                fields=["start_date", "game"],
+                name="session_start_date_idx",
+            ),
+            # Admin changelist order (keyset pagination)
+            models.Index(
+                fields=["-start_time", "-id"],
+                name="session_recent_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.start_date = timezone.localtime(self.start_time).date()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.game.name} - {self.contestant.name} ({self.start_time})"
 
 
+class UpvoteFlush(AuditDates, UUIDAsPrimaryKey):
+    """
+    Record of a batch of buffered upvotes applied to Game.upvotes. The unique
+    batch_id makes re-running an interrupted flush a no-op.
+    """
+
+    batch_id = models.CharField(max_length=32, unique=True)
+    games = models.IntegerField(default=0)
+    upvotes = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="upvote_flush_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.batch_id} ({self.upvotes} upvotes)"
+
+
+class PopularityProfile(AuditDates, UUIDAsPrimaryKey):
+    """
+    Named set of weights for the popularity factors. Every active profile is
+    scored on each popularity refresh, producing one ranking per profile.
+    """
+
+    name = models.CharField(max_length=64, unique=True)
+    daily_players_weight = models.FloatField(default=0)
+    current_players_weight = models.FloatField(default=0)
+    upvotes_weight = models.FloatField(default=0)
+    session_length_weight = models.FloatField(default=0)
+    daily_sessions_weight = models.FloatField(default=0)
+    is_active = models.BooleanField(default=True)
+
+    def __str__(self):
+        return self.name
+
+
 class GamePopularity(AuditDates, UUIDAsPrimaryKey):
     game = models.ForeignKey(Game, on_delete=models.CASCADE)
+    profile = models.ForeignKey(PopularityProfile, on_delete=models.CASCADE)
     date = models.DateField()
     popularity_score = models.FloatField()
     last_updated = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "date", "profile"],
+                name="unique_game_popularity_date_profile",
+            ),
+        ]
+        indexes = [
+            # Admin changelist order (keyset pagination)
+            models.Index(fields=["-date", "-id"], name="game_popularity_recent_idx"),
+        ]
+
     def __str__(self):
         date_str = format(self.date, "N j, Y")
         return f"{self.game.name} - {date_str}"
+
+
+class ContestantGameScore(AuditDates, UUIDAsPrimaryKey):
+    """
+    Running total of a contestant's score in a game, kept up to date when sessions end.
+    """
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE)
+    contestant = models.ForeignKey(Contestant, on_delete=models.CASCADE)
+    total_score = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "contestant"], name="unique_contestant_game_score"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["game", "-total_score", "-contestant"],
+                name="game_score_rank_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.game.name} - {self.contestant.name} ({self.total_score})"
+
+
+class ContestantDailyScore(AuditDates, UUIDAsPrimaryKey):
+    """
+    Running total of a contestant's score for sessions started on a given date.
+    """
+
+    date = models.DateField()
+    contestant = models.ForeignKey(Contestant, on_delete=models.CASCADE)
+    total_score = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "contestant"], name="unique_contestant_daily_score"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["date", "-total_score", "-contestant"],
+                name="daily_score_rank_idx",
+            ),
+        ]
+
+    def __str__(self):
+        date_str = format(self.date, "N j, Y")
+        return f"{self.contestant.name} - {date_str} ({self.total_score})"
+
+
+class ContestantGameDailyScore(AuditDates, UUIDAsPrimaryKey):
+    """
+    Running total of a contestant's score in a game for sessions started on a
+    given date; the daily buckets that per-game time-window leaderboards sum.
+    """
+
+    date = models.DateField()
+    game = models.ForeignKey(Game, on_delete=models.CASCADE)
+    contestant = models.ForeignKey(Contestant, on_delete=models.CASCADE)
+    total_score = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Also serves the (game, date range) lookups of window leaderboards
+            models.UniqueConstraint(
+                fields=["game", "date", "contestant"],
+                name="unique_contestant_game_daily_score",
+            ),
+        ]
+
+    def __str__(self):
+        date_str = format(self.date, "N j, Y")
+        return (
+            f"{self.game.name} - {self.contestant.name} - {date_str} "
+            f"({self.total_score})"
+        )
+
+
+class PopularityHistory(models.Model):
+    """
+    Time series of popularity scores: one row per game, profile and time
+    bucket. Refreshes write 5-minute buckets, which are rolled up into hourly
+    and daily buckets (mean, min, max and sample count) and then pruned.
+
+    Rows are kept narrow on purpose (integer key, no audit dates), since this
+    table holds far more rows than any other.
+    """
+
+    class Resolution(models.IntegerChoices):
+        FIVE_MINUTES = 5 * 60, "5 minutes"
+        HOUR = 60 * 60, "1 hour"
+        DAY = 24 * 60 * 60, "1 day"
+
+    id = models.BigAutoField(primary_key=True)
+    # Covered by the unique constraint below, which leads with the game
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, db_index=False)
+    profile = models.ForeignKey(
+        PopularityProfile, on_delete=models.CASCADE, db_index=False
+    )
+    resolution = models.PositiveIntegerField(choices=Resolution.choices)
+    bucket = models.DateTimeField()
+    score = models.FloatField()
+    # Only set on rolled-up buckets; a 5-minute bucket holds a single sample
+    min_score = models.FloatField(null=True, blank=True)
+    max_score = models.FloatField(null=True, blank=True)
+    samples = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        verbose_name_plural = "popularity history"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "profile", "resolution", "bucket"],
+                name="unique_popularity_history_bucket",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["resolution", "bucket"], name="popularity_history_bucket_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.game_id} - {self.get_resolution_display()} at {self.bucket}"
@@ -0,0 +1,288 @@
+"""
+Set-based computation of game popularity factors.
+
+Every factor is computed for all games at once with grouped aggregate queries,
+so refreshing popularity costs a fixed number of queries instead of several
+per game. Daily factors and normalization maxima are cached per target date,
+so any date can be (re)computed without disturbing the values in use.
+
+Each refresh also replaces a Redis sorted set of game_id -> score per profile
+and date (PopularityRanking), so popularity pages are ranked and paginated in
+Redis; the GamePopularity table serves them when the set is unavailable.
+"""
+
+from datetime import timedelta
+from time import monotonic
+import uuid
+
+from django.core.cache import cache
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Max
+
+from gameboard.games.leaderboard import RedisLeaderboard
+from gameboard.games.live import current_player_counts
+from gameboard.games.models import Game, GamePopularity, GameSession
+from gameboard.games.scoring import DEFAULT_WEIGHTS
+
+DAILY_FACTORS_TIMEOUT = 86400  # 24 hours
+SCORE_TIMEOUT = 300  # 5 minutes
+RANKING_TTL = 2 * 24 * 60 * 60  # keep today's and yesterday's rankings
+
+DAILY_FACTORS = (
+    "n_daily_players",
+    "max_session_length_for_game",
+    "n_daily_sessions",
+)
+MAX_VALUES = (
+    "max_daily_players",
+    "max_concurrent_players",
+    "max_upvotes",
+    "max_session_length_across_all_games",
+    "max_daily_sessions",
+)
+
+
+def factor_cache_key(game_id, factor, date):
+    return f"game_{game_id}_{factor}_{date.isoformat()}"
+
+
+def max_value_cache_key(name, date):
+    return f"{name}_{date.isoformat()}"
+
+
+def score_cache_key(game_id, profile="default"):
+    if profile == "default":
+        return f"game_{game_id}_score"
+    return f"game_{game_id}_score_{profile}"
+
+
+def overlay_cached_scores(entries, profile):
+    """
+    Replace the stored popularity_score of `entries` (a page of rows) with the
+    latest cached scores, read with one get_many.
+    """
+    cached = cache.get_many(
+        [score_cache_key(entry["game_id"], profile) for entry in entries]
+    )
+    _apply_scores(entries, profile, cached)
+
+
+def _apply_scores(entries, profile, cached):
+    for entry in entries:
+        entry["popularity_score"] = cached.get(
+            score_cache_key(entry["game_id"], profile), entry["popularity_score"]
+        )
+
+
+class PopularityRanking(RedisLeaderboard):
+    """
+    Popularity scores of every game for one profile and date, in a sorted set
+    of game_id -> score replaced wholesale on each refresh (see `rebuild`).
+    Ties are ordered by game_id descending, as in `database_queryset`.
+    """
+
+    ttl = RANKING_TTL
+
+    def __init__(self, profile, date, connection=None):
+        super().__init__(connection)
+        self.profile = profile
+        self.date = date
+        self.key = f"popularity:{profile}:{date.isoformat()}"
+
+    def database_queryset(self):
+        return (
+            GamePopularity.objects.filter(date=self.date, profile__name=self.profile)
+            .order_by("-popularity_score", "-game_id")
+            .values("game_id", "game__name", "popularity_score")
+        )
+
+    def load_totals(self):
+        return self.database_queryset().values_list("game_id", "popularity_score")
+
+    def _hydrate(self, rows):
+        names = dict(
+            Game.objects.filter(id__in=[game_id for game_id, _ in rows]).values_list(
+                "id", "name"
+            )
+        )
+        return _popularity_entries(rows, names)
+
+
+def _popularity_entries(rows, names):
+    entries = []
+    for game_id, score in rows:
+        game_id = uuid.UUID(game_id)
+        entries.append(
+            {
+                "game_id": game_id,
+                "game__name": names.get(game_id),
+                "popularity_score": score,
+            }
+        )
+    return entries
+
+
+def compute_daily_factors(date):
+    """
+    Return {game_id: {factor: value}} for sessions started on `date`,
+    computed in a single grouped query.
+    """
+    rows = (
+        GameSession.objects.filter(start_date=date)
+        .values("game_id")
+        .annotate(
+            n_daily_players=Count("contestant", distinct=True),
+            n_daily_sessions=Count("id"),
+            max_session_length=Max(
+                ExpressionWrapper(
+                    F("end_time") - F("start_time"), output_field=DurationField()
+                )
+            ),
+        )
+        .order_by()
+    )
+    return {
+        row["game_id"]: {
+            "n_daily_players": row["n_daily_players"],
+            "max_session_length_for_game": (
+                row["max_session_length"] or timedelta(seconds=0)
+            ).total_seconds(),
+            "n_daily_sessions": row["n_daily_sessions"],
+        }
+        for row in rows
+    }
+
+
+def count_current_players():
+    """
+    Return {game_id: number of contestants playing right now}, read from the
+    live counters (see live.py) with a fallback to counting open sessions.
+    """
+    return current_player_counts()
+
+
+def compute_max_values(daily_factors, current_players):
+    """
+    Derive the normalization maxima from per-game factors, without rescanning sessions.
+    Every value is at least 1 to avoid division by zero.
+    """
+
+    def max_of(factor):
+        return max((values[factor] for values in daily_factors.values()), default=0)
+
+    return {
+        "max_daily_players": max_of("n_daily_players") or 1,
+        "max_concurrent_players": max(current_players.values(), default=0) or 1,
+        "max_upvotes": Game.objects.aggregate(Max("upvotes"))["upvotes__max"] or 1,
+        "max_session_length_across_all_games": max_of("max_session_length_for_game")
+        or 1,
+        "max_daily_sessions": max_of("n_daily_sessions") or 1,
+    }
+
+
+def cache_daily_factors(date):
+    """
+    Compute and cache every game's daily factors and the normalization maxima for
+    sessions started on `date`, in one grouped pass over that day's sessions.
+
+    Returns (factors, max_values, report) where report holds the number of
+    session rows scanned and the elapsed time.
+    """
+    started = monotonic()
+
+    computed = compute_daily_factors(date)
+    empty = {factor: 0 for factor in DAILY_FACTORS}
+    factors = {
+        game_id: computed.get(game_id, empty)
+        for game_id in Game.objects.values_list("id", flat=True)
+    }
+    max_values = compute_max_values(factors, count_current_players())
+
+    values = {
+        factor_cache_key(game_id, factor, date): value
+        for game_id, game_factors in factors.items()
+        for factor, value in game_factors.items()
+    }
+    values.update(
+        {max_value_cache_key(name, date): value for name, value in max_values.items()}
+    )
+    cache.set_many(values, timeout=DAILY_FACTORS_TIMEOUT)
+
+    report = {
+        "date": date.isoformat(),
+        "games": len(factors),
+        "rows_scanned": sum(
+            game_factors["n_daily_sessions"] for game_factors in computed.values()
+        ),
+        "elapsed_seconds": round(monotonic() - started, 3),
+    }
+    return factors, max_values, report
+
+
+def load_daily_factors(game_ids, date):
+    """
+    Return ({game_id: {factor: value}}, {max_value_name: value}) for the given
+    games, read from the cache with one get_many. If anything is missing, all
+    factors for the date are recomputed in one pass and written back.
+    """
+    keys = [
+        factor_cache_key(game_id, factor, date)
+        for game_id in game_ids
+        for factor in DAILY_FACTORS
+    ]
+    max_keys = {name: max_value_cache_key(name, date) for name in MAX_VALUES}
+    cached = cache.get_many(keys + list(max_keys.values()))
+
+    if len(cached) < len(keys) + len(max_keys):
+        factors, max_values, _ = cache_daily_factors(date)
+        empty = {factor: 0 for factor in DAILY_FACTORS}
+        return {
+            game_id: factors.get(game_id, empty) for game_id in game_ids
+        }, max_values
+
+    factors = {
+        game_id: {
+            factor: cached[factor_cache_key(game_id, factor, date)]
+            for factor in DAILY_FACTORS
+        }
+        for game_id in game_ids
+    }
+    max_values = {name: cached[key] for name, key in max_keys.items()}
+    return factors, max_values
+
+
+def popularity_score(
+    n_daily_players,
+    n_current_players,
+    n_upvotes,
+    max_session_length_for_game,
+    n_daily_sessions,
+    max_values,
+    weights=DEFAULT_WEIGHTS,
+):
+    """
+    Scalar popularity score for one game. Refreshes use the vectorized
+    `scoring.score_matrix`; this is kept as the per-game reference.
+    """
+    return round(
+        (
+            weights["daily_players_weight"]
+            * (n_daily_players / max_values["max_daily_players"])
+        )
+        + (
+            weights["current_players_weight"]
+            * (n_current_players / max_values["max_concurrent_players"])
+        )
+        + (weights["upvotes_weight"] * (n_upvotes / max_values["max_upvotes"]))
+        + (
+            weights["session_length_weight"]
+            * (
+                max_session_length_for_game
+                / max_values["max_session_length_across_all_games"]
+            )
+        )
+        + (
+            weights["daily_sessions_weight"]
+            * (n_daily_sessions / max_values["max_daily_sessions"])
+        ),
+        2,
+    )
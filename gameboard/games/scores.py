@@ -0,0 +1,259 @@
+"""
+Materialized per-game and per-date score totals.
+
+ContestantGameScore and ContestantDailyScore hold one row per contestant per
+game / per date, so leaderboards become indexed range scans instead of
+re-aggregating GameSession on every request. ContestantGameDailyScore holds
+one row per contestant per game and date. Only ended sessions are counted.
+
+Time-window leaderboards (a week, a month, the last 7 days...) sum the daily
+rows of the window, at most 31 per contestant, however many sessions were
+played in it.
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+import logging
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from gameboard.games.models import (
+    ContestantDailyScore,
+    ContestantGameDailyScore,
+    ContestantGameScore,
+    GameSession,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rolling windows end on the requested date; the others contain it
+ROLLING_WINDOWS = {"last-7-days": 7, "last-30-days": 30}
+WINDOWS = ("day", "week", "month", *ROLLING_WINDOWS)
+
+
+def session_date(start_time):
+    return timezone.localtime(start_time).date()
+
+
+def day_bounds(date):
+    """
+    Return the [start, end) datetimes of a date in the current timezone, so
+    timestamps can be filtered with a range instead of __date.
+    """
+    start = timezone.make_aware(datetime.combine(date, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _add_score(model, lookup, delta):
+    """
+    Add `delta` to a total with a single UPDATE when the row exists (the common
+    case), creating it otherwise.
+    """
+    values = {"total_score": F("total_score") + delta, "updated_at": timezone.now()}
+    if model.objects.filter(**lookup).update(**values):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, total_score=delta)
+    except IntegrityError:
+        # Created concurrently since the UPDATE
+        model.objects.filter(**lookup).update(**values)
+
+
+def record_score_totals(game_id, contestant_id, start_time, delta):
+    """
+    Add a session's score change to the per-game and per-date totals.
+    Must be called inside the transaction that ends the session.
+    """
+    _add_score(
+        ContestantGameScore, {"game_id": game_id, "contestant_id": contestant_id}, delta
+    )
+    date = session_date(start_time)
+    _add_score(
+        ContestantDailyScore, {"date": date, "contestant_id": contestant_id}, delta
+    )
+    _add_score(
+        ContestantGameDailyScore,
+        {"game_id": game_id, "date": date, "contestant_id": contestant_id},
+        delta,
+    )
+
+
+def _add_scores(model, fields, deltas):
+    """
+    Add {(*values of `fields`, contestant_id): delta} to `model` rows in three
+    statements: insert missing rows, lock every affected row, and upsert the
+    new totals. All rows are locked before the totals are computed, so
+    concurrent session ends cannot be overwritten.
+    """
+    fields = [*fields, "contestant_id"]
+    model.objects.bulk_create(
+        [model(**dict(zip(fields, key)), total_score=0) for key in deltas],
+        ignore_conflicts=True,
+    )
+    totals = {
+        tuple(row[:-1]): row[-1]
+        for row in model.objects.select_for_update()
+        .filter(
+            **{
+                f"{field}__in": {key[i] for key in deltas}
+                for i, field in enumerate(fields)
+            }
+        )
+        .values_list(*fields, "total_score")
+    }
+    now = timezone.now()
+    model.objects.bulk_create(
+        [
+            model(
+                **dict(zip(fields, key)),
+                total_score=totals[key] + delta,
+                updated_at=now,
+            )
+            for key, delta in deltas.items()
+        ],
+        update_conflicts=True,
+        unique_fields=[field.removesuffix("_id") for field in fields],
+        update_fields=["total_score", "updated_at"],
+    )
+
+
+def add_score_totals(scores):
+    """
+    Add many (game_id, contestant_id, date, delta) score changes to the per-game,
+    per-date and per-game-and-date totals in set-based queries. Must be called
+    inside the transaction that inserts the sessions.
+    """
+    game_deltas = defaultdict(int)
+    daily_deltas = defaultdict(int)
+    game_daily_deltas = defaultdict(int)
+    for game_id, contestant_id, date, delta in scores:
+        game_deltas[(game_id, contestant_id)] += delta
+        daily_deltas[(date, contestant_id)] += delta
+        game_daily_deltas[(game_id, date, contestant_id)] += delta
+    if game_deltas:
+        _add_scores(ContestantGameScore, ["game_id"], game_deltas)
+        _add_scores(ContestantDailyScore, ["date"], daily_deltas)
+        _add_scores(ContestantGameDailyScore, ["game_id", "date"], game_daily_deltas)
+
+
+def _bulk_insert(objs, batch_size):
+    objs = iter(objs)
+    total = 0
+    while batch := list(islice(objs, batch_size)):
+        type(batch[0]).objects.bulk_create(batch)
+        total += len(batch)
+    return total
+
+
+def rebuild_score_totals(batch_size=1000):
+    """
+    Recompute the summary tables from ended GameSession rows.
+    Returns the number of (game, daily, game daily) rows written.
+    """
+    ended_sessions = GameSession.objects.filter(end_time__isnull=False).order_by()
+
+    game_totals = (
+        ended_sessions.values("game_id", "contestant_id")
+        .annotate(total_score=Sum("score"))
+        .values_list("game_id", "contestant_id", "total_score")
+    )
+    daily_totals = (
+        ended_sessions.values("start_date", "contestant_id")
+        .annotate(total_score=Sum("score"))
+        .values_list("start_date", "contestant_id", "total_score")
+    )
+    game_daily_totals = (
+        ended_sessions.values("game_id", "start_date", "contestant_id")
+        .annotate(total_score=Sum("score"))
+        .values_list("game_id", "start_date", "contestant_id", "total_score")
+    )
+
+    with transaction.atomic():
+        ContestantGameScore.objects.all().delete()
+        ContestantDailyScore.objects.all().delete()
+        ContestantGameDailyScore.objects.all().delete()
+
+        n_game_scores = _bulk_insert(
+            (
+                ContestantGameScore(
+                    game_id=game_id,
+                    contestant_id=contestant_id,
+                    total_score=total_score or 0,
+                )
+                for game_id, contestant_id, total_score in game_totals.iterator()
+            ),
+            batch_size,
+        )
+        n_daily_scores = _bulk_insert(
+            (
+                ContestantDailyScore(
+                    date=date,
+                    contestant_id=contestant_id,
+                    total_score=total_score or 0,
+                )
+                for date, contestant_id, total_score in daily_totals.iterator()
+            ),
+            batch_size,
+        )
+        n_game_daily_scores = _bulk_insert(
+            (
+                ContestantGameDailyScore(
+                    game_id=game_id,
+                    date=date,
+                    contestant_id=contestant_id,
+                    total_score=total_score or 0,
+                )
+                for game_id, date, contestant_id, total_score in (
+                    game_daily_totals.iterator()
+                )
+            ),
+            batch_size,
+        )
+
+    logger.info(
+        f"Rebuilt score totals: {n_game_scores} game rows, {n_daily_scores} daily "
+        f"rows, {n_game_daily_scores} game daily rows"
+    )
+    return n_game_scores, n_daily_scores, n_game_daily_scores
+
+
+def window_bounds(window, date):
+    """
+    Return the first and last date of a window: the `day`, ISO `week` or
+    `month` containing `date`, or the rolling window ending on it.
+    """
+    if window == "day":
+        return date, date
+    if window == "week":
+        start = date - timedelta(days=date.weekday())
+        return start, start + timedelta(days=6)
+    if window == "month":
+        start = date.replace(day=1)
+        next_month = (start + timedelta(days=31)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    if window in ROLLING_WINDOWS:
+        return date - timedelta(days=ROLLING_WINDOWS[window] - 1), date
+    raise ValueError(
+        f"Unknown window '{window}'; expected one of {', '.join(WINDOWS)}."
+    )
+
+
+def window_scores(start, end, game_id=None):
+    """
+    Contestant totals between two dates (inclusive), globally or for one game,
+    in leaderboard order: a sum over the daily rows, not over sessions.
+    """
+    if game_id is None:
+        buckets = ContestantDailyScore.objects.all()
+    else:
+        buckets = ContestantGameDailyScore.objects.filter(game_id=game_id)
+    return (
+        buckets.filter(date__range=(start, end))
+        .values("contestant", "contestant__name")
+        .annotate(total_score=Sum("total_score"))
+        .order_by("-total_score", "-contestant")
+    )
@@ -0,0 +1,83 @@
+"""
+Vectorized popularity scoring.
+
+Factors for all games are loaded into one (games x factors) matrix, normalized
+by the per-factor maxima and multiplied by a (factors x profiles) weight
+matrix, so scoring every game under every weight profile is a single matrix
+product. `popularity_score` in popularity.py is the scalar equivalent.
+"""
+
+import numpy as np
+
+# Column order of the factor matrix, paired with the max value used to normalize it
+FACTORS = (
+    ("n_daily_players", "max_daily_players"),
+    ("n_current_players", "max_concurrent_players"),
+    ("n_upvotes", "max_upvotes"),
+    ("max_session_length_for_game", "max_session_length_across_all_games"),
+    ("n_daily_sessions", "max_daily_sessions"),
+)
+
+# PopularityProfile weight fields, in the same order as FACTORS
+WEIGHT_FIELDS = (
+    "daily_players_weight",
+    "current_players_weight",
+    "upvotes_weight",
+    "session_length_weight",
+    "daily_sessions_weight",
+)
+
+DEFAULT_WEIGHTS = {
+    "daily_players_weight": 0.3,
+    "current_players_weight": 0.2,
+    "upvotes_weight": 0.25,
+    "session_length_weight": 0.15,
+    "daily_sessions_weight": 0.1,
+}
+
+
+def build_factor_matrix(game_ids, daily_factors, current_players, upvotes):
+    """
+    Return a float64 array of shape (len(game_ids), len(FACTORS)).
+    `daily_factors` maps game_id -> cached daily factors, `current_players`
+    and `upvotes` map game_id -> count.
+    """
+    matrix = np.empty((len(game_ids), len(FACTORS)), dtype=np.float64)
+    for row, game_id in enumerate(game_ids):
+        game_factors = daily_factors[game_id]
+        matrix[row] = (
+            game_factors["n_daily_players"],
+            current_players.get(game_id, 0),
+            upvotes[game_id],
+            game_factors["max_session_length_for_game"],
+            game_factors["n_daily_sessions"],
+        )
+    return matrix
+
+
+def build_weight_matrix(profiles):
+    """
+    Return a float64 array of shape (len(FACTORS), len(profiles)) from objects
+    or dicts carrying the WEIGHT_FIELDS.
+    """
+    return np.array(
+        [
+            [
+                profile[field] if isinstance(profile, dict) else getattr(profile, field)
+                for profile in profiles
+            ]
+            for field in WEIGHT_FIELDS
+        ],
+        dtype=np.float64,
+    ).reshape(len(WEIGHT_FIELDS), len(profiles))
+
+
+def score_matrix(factor_matrix, max_values, weight_matrix):
+    """
+    Normalize each factor column by its max value and apply every weight
+    profile at once. Returns scores of shape (games, profiles), rounded to 2 places.
+    """
+    normalizers = np.array(
+        [max(max_values[name], 1) for _, name in FACTORS], dtype=np.float64
+    )
+    return np.round((factor_matrix / normalizers) @ weight_matrix, 2)
@@ -0,0 +1,141 @@
+"""
+Fast end-of-session path.
+
+Where the database supports it (PostgreSQL, SQLite 3.35+) a session is ended
+with one UPDATE ... RETURNING, which also returns the previous score so the
+score change can be applied to the summary tables and leaderboards without
+reading the row first. Other databases read the open session and then update
+it. Either way the UPDATE only matches a session whose end_time IS NULL, so of
+two concurrent requests ending the same session only one updates it; the
+other matches no row and gets None.
+"""
+
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from gameboard.games.leaderboard import record_session_score
+from gameboard.games.live import change_live_players
+from gameboard.games.models import GameSession
+from gameboard.games.scores import record_score_totals, session_date
+
+# Name in the result -> model field
+RETURNED_FIELDS = {
+    "game_id": "game",
+    "contestant_id": "contestant",
+    "start_time": "start_time",
+    "previous_score": "score",
+}
+
+
+def can_update_returning():
+    """UPDATE ... FROM a MATERIALIZED CTE ... RETURNING is available."""
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35)
+    return connection.vendor == "postgresql"
+
+
+def _to_db(field_name, value):
+    field = GameSession._meta.get_field(field_name)
+    return field.get_db_prep_value(value, connection)
+
+
+def _from_db(row):
+    """Convert raw column values as the ORM would (SQLite returns UUIDs as text)."""
+    ended = {}
+    for (name, field_name), value in zip(RETURNED_FIELDS.items(), row):
+        column = GameSession._meta.get_field(field_name).get_col(
+            GameSession._meta.db_table
+        )
+        converters = connection.ops.get_db_converters(
+            column
+        ) + column.get_db_converters(connection)
+        for converter in converters:
+            value = converter(value, column, connection)
+        ended[name] = value
+    return ended
+
+
+def _end_returning(session_id, score, end_time):
+    # The CTE is read before the row is updated, so it holds the previous score
+    table = connection.ops.quote_name(GameSession._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH previous AS MATERIALIZED (
+                SELECT id, score FROM {table} WHERE id = %s AND end_time IS NULL
+            )
+            UPDATE {table}
+            SET end_time = %s, score = %s, updated_at = %s
+            FROM previous
+            WHERE {table}.id = previous.id AND {table}.end_time IS NULL
+            RETURNING game_id, contestant_id, start_time,
+                (SELECT score FROM previous)
+            """,
+            [
+                _to_db("id", session_id),
+                _to_db("end_time", end_time),
+                score,
+                _to_db("updated_at", end_time),
+            ],
+        )
+        row = cursor.fetchone()
+    return _from_db(row) if row else None
+
+
+def _end_select_update(session_id, score, end_time):
+    open_session = GameSession.objects.filter(id=session_id, end_time__isnull=True)
+    previous = open_session.values(
+        "game_id", "contestant_id", "start_time", previous_score=F("score")
+    ).first()
+    if previous is None:
+        return None
+    if not open_session.update(end_time=end_time, score=score, updated_at=end_time):
+        return None
+    return previous
+
+
+def end_session(session_id, score):
+    """
+    End an open session with its final score and apply the score change to
+    the per-game/per-date totals, the Redis leaderboards and the live player
+    counters. Returns the ended session as a dict (session_id, game_id,
+    contestant_id, start_time, end_time, score, score_delta), or None if no
+    open session has that id.
+    """
+    end_time = timezone.now()
+    end = _end_returning if can_update_returning() else _end_select_update
+
+    with transaction.atomic():
+        ended = end(session_id, score, end_time)
+        if ended is None:
+            return None
+
+        previous_score = ended.pop("previous_score")
+        ended.update(
+            session_id=session_id,
+            end_time=end_time,
+            score=score,
+            score_delta=score - previous_score,
+        )
+
+        record_score_totals(
+            ended["game_id"],
+            ended["contestant_id"],
+            ended["start_time"],
+            ended["score_delta"],
+        )
+        transaction.on_commit(
+            partial(
+                record_session_score,
+                ended["game_id"],
+                ended["contestant_id"],
+                session_date(ended["start_time"]),
+                ended["score_delta"],
+            )
+        )
+        transaction.on_commit(partial(change_live_players, ended["game_id"], -1))
+
+    return ended
@@ -0,0 +1,244 @@
+"""
+Synthetic data for benchmarking.
+
+Games and contestants get Zipf-distributed weights, so a few games and a few
+heavy players account for most sessions. Session lengths are log-normal and
+scores Pareto-distributed (heavy tails), start times are spread over the last
+`days` days, and a fraction of sessions is left open (one per game and
+contestant at most, as the unique_open_session constraint requires).
+
+Sessions are generated in fixed-size chunks, each from its own seed derived
+from (seed, chunk number), so the data depends only on the seed and the
+counts, not on the number of worker processes. Ids are ULIDs built from each
+row's own timestamp and seeded random bits.
+"""
+
+from datetime import datetime
+import multiprocessing
+import uuid
+
+import numpy as np
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from gameboard.games.models import Contestant, Game, GameSession
+
+GAME_NAMES = ["Chess", "Poker", "Tetris", "Fortnite", "Call of Duty"]
+
+GAME_SKEW = 1.1  # Zipf exponent of game popularity
+CONTESTANT_SKEW = 0.8  # Zipf exponent of contestant activity
+SESSION_LENGTH_MEDIAN = 15 * 60  # seconds
+SESSION_LENGTH_SIGMA = 0.9
+SESSION_LENGTH_MAX = 6 * 60 * 60
+SCORE_SCALE = 10
+SCORE_TAIL = 1.2  # Pareto shape; lower means a heavier tail
+SCORE_MAX = 1_000_000
+OPEN_SESSION_WINDOW = 2 * 60 * 60  # open sessions started in the last 2 hours
+
+
+def zipf_weights(count, exponent):
+    """Return probabilities proportional to 1 / rank ** exponent."""
+    weights = np.arange(1, count + 1, dtype=float) ** -exponent
+    return weights / weights.sum()
+
+
+def ulid_uuids(rng, timestamps):
+    """Return ULIDs (as UUIDs) for POSIX timestamps in seconds, in order."""
+    milliseconds = (np.asarray(timestamps) * 1000).astype(">u8")
+    raw = np.hstack(
+        [
+            milliseconds.view(np.uint8).reshape(-1, 8)[:, 2:],
+            rng.integers(0, 256, size=(len(milliseconds), 10), dtype=np.uint8),
+        ]
+    ).tobytes()
+    return [uuid.UUID(bytes=raw[i : i + 16]) for i in range(0, len(raw), 16)]
+
+
+def to_datetimes(timestamps):
+    """Aware datetimes in the current time zone, so .date() is the local date."""
+    tz = timezone.get_current_timezone()
+    return [datetime.fromtimestamp(ts, tz=tz) for ts in timestamps]
+
+
+def create_games(rng, count, now, batch_size):
+    """Create `count` games; returns their ids, most popular first."""
+    weights = zipf_weights(count, GAME_SKEW)
+    created = now - rng.uniform(30, 365, count) * 86400
+    upvotes = rng.poisson(weights * count * 1000)
+    names = [
+        GAME_NAMES[i] if i < len(GAME_NAMES) else f"Game {i + 1}" for i in range(count)
+    ]
+    games = [
+        Game(id=game_id, name=name, upvotes=int(n_upvotes))
+        for game_id, name, n_upvotes in zip(ulid_uuids(rng, created), names, upvotes)
+    ]
+    Game.objects.bulk_create(games, batch_size=batch_size)
+    return [game.id for game in games]
+
+
+def create_contestants(rng, count, now, days, batch_size):
+    """Create `count` contestants who joined before the sessions start."""
+    joined = now - (days + rng.uniform(0, 90, count)) * 86400
+    contestant_ids = ulid_uuids(rng, joined)
+    for start in range(0, count, batch_size):
+        Contestant.objects.bulk_create(
+            Contestant(id=contestant_id, name=f"Player_{i + 1}", joined_at=joined_at)
+            for i, contestant_id, joined_at in zip(
+                range(start, start + batch_size),
+                contestant_ids[start : start + batch_size],
+                to_datetimes(joined[start : start + batch_size]),
+            )
+        )
+    return contestant_ids
+
+
+def open_sessions(rng, count, game_ids, contestant_ids, now):
+    """Return up to `count` open sessions, at most one per game and contestant."""
+    games = rng.choice(len(game_ids), count, p=zipf_weights(len(game_ids), GAME_SKEW))
+    contestants = rng.choice(
+        len(contestant_ids),
+        count,
+        p=zipf_weights(len(contestant_ids), CONTESTANT_SKEW),
+    )
+    _, first = np.unique(games * len(contestant_ids) + contestants, return_index=True)
+    started = now - rng.uniform(0, OPEN_SESSION_WINDOW, len(first))
+    return [
+        GameSession(
+            id=session_id,
+            game_id=game_ids[games[i]],
+            contestant_id=contestant_ids[contestants[i]],
+            start_time=start_time,
+            start_date=start_time.date(),
+            score=0,
+        )
+        for i, session_id, start_time in zip(
+            first, ulid_uuids(rng, started), to_datetimes(started)
+        )
+    ]
+
+
+def ended_sessions(rng, count, game_ids, contestant_ids, now, days):
+    """Return `count` ended sessions that started in the last `days` days."""
+    games = rng.choice(len(game_ids), count, p=zipf_weights(len(game_ids), GAME_SKEW))
+    contestants = rng.choice(
+        len(contestant_ids),
+        count,
+        p=zipf_weights(len(contestant_ids), CONTESTANT_SKEW),
+    )
+    lengths = np.minimum(
+        rng.lognormal(np.log(SESSION_LENGTH_MEDIAN), SESSION_LENGTH_SIGMA, count),
+        SESSION_LENGTH_MAX,
+    )
+    ended = now - rng.uniform(0, days * 86400, count)
+    started = ended - lengths
+    scores = np.minimum((rng.pareto(SCORE_TAIL, count) + 1) * SCORE_SCALE, SCORE_MAX)
+
+    return [
+        GameSession(
+            id=session_id,
+            game_id=game_ids[game],
+            contestant_id=contestant_ids[contestant],
+            start_time=start_time,
+            start_date=start_time.date(),
+            end_time=end_time,
+            score=int(score),
+        )
+        for session_id, game, contestant, start_time, end_time, score in zip(
+            ulid_uuids(rng, started),
+            games,
+            contestants,
+            to_datetimes(started),
+            to_datetimes(ended),
+            scores,
+        )
+    ]
+
+
+_worker_state = {}
+
+
+def _init_worker(game_ids, contestant_ids, spec):
+    _worker_state.update(game_ids=game_ids, contestant_ids=contestant_ids, spec=spec)
+
+
+def _write_chunk(chunk):
+    """Generate and insert one chunk of ended sessions; returns its row count."""
+    state = _worker_state
+    spec = state["spec"]
+    count = min(spec["chunk_size"], spec["sessions"] - chunk * spec["chunk_size"])
+    rng = np.random.default_rng([spec["seed"], chunk])
+    sessions = ended_sessions(
+        rng,
+        count,
+        state["game_ids"],
+        state["contestant_ids"],
+        spec["now"],
+        spec["days"],
+    )
+    with transaction.atomic():
+        GameSession.objects.bulk_create(sessions, batch_size=spec["batch_size"])
+    return count
+
+
+def generate(
+    games,
+    contestants,
+    sessions,
+    days,
+    seed=42,
+    open_fraction=0.01,
+    workers=1,
+    batch_size=5000,
+    chunk_size=100_000,
+    progress=None,
+):
+    """
+    Create games, contestants and sessions (of which `open_fraction` open).
+    Ended sessions are inserted by `workers` processes; `progress(n)` is called
+    after every chunk of n sessions. Returns the number of rows per model.
+    """
+    rng = np.random.default_rng(seed)
+    now = timezone.now().timestamp()
+
+    game_ids = create_games(rng, games, now, batch_size)
+    contestant_ids = create_contestants(rng, contestants, now, days, batch_size)
+
+    opened = open_sessions(
+        rng, round(sessions * open_fraction), game_ids, contestant_ids, now
+    )
+    GameSession.objects.bulk_create(opened, batch_size=batch_size)
+
+    spec = {
+        "seed": seed,
+        "now": now,
+        "days": days,
+        "sessions": sessions - len(opened),
+        "batch_size": batch_size,
+        "chunk_size": chunk_size,
+    }
+    chunks = range(-(-spec["sessions"] // chunk_size))
+    initargs = (game_ids, contestant_ids, spec)
+
+    if workers > 1:
+        # Children open their own connections; never share the parent's
+        connections.close_all()
+        with multiprocessing.get_context("fork").Pool(
+            workers, initializer=_init_worker, initargs=initargs
+        ) as pool:
+            for count in pool.imap_unordered(_write_chunk, chunks):
+                if progress:
+                    progress(count)
+    else:
+        _init_worker(*initargs)
+        for chunk in chunks:
+            count = _write_chunk(chunk)
+            if progress:
+                progress(count)
+
+    return {
+        "games": len(game_ids),
+        "contestants": len(contestant_ids),
+        "sessions": spec["sessions"] + len(opened),
+        "open_sessions": len(opened),
+    }
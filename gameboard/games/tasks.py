@@ -2,12 +2,36 @@ from datetime import timedelta
 import logging
 
 from celery import shared_task
+from redis.exceptions import RedisError
 
 from django.core.cache import cache
-from django.db.models import Max, Count
 from django.utils import timezone
-
-from gameboard.games.models import Game, GameSession, GamePopularity
+from django.utils.dateparse import parse_date
+
+from gameboard.games.feed import PopularityFeed, top_popularity
+from gameboard.games.history import HISTORY_KEY, Resolution, bucket_start, prune, rollup
+from gameboard.games.leaderboard import iter_leaderboards, publish_pending_feeds
+from gameboard.games.live import reconcile_live_players
+from gameboard.games.models import (
+    Game,
+    GamePopularity,
+    PopularityHistory,
+    PopularityProfile,
+)
+from gameboard.games.popularity import (
+    SCORE_TIMEOUT,
+    PopularityRanking,
+    cache_daily_factors,
+    count_current_players,
+    load_daily_factors,
+    score_cache_key,
+)
+from gameboard.games.scoring import (
+    build_factor_matrix,
+    build_weight_matrix,
+    score_matrix,
+)
+from gameboard.games.upvotes import flush_upvotes
 
 logger = logging.getLogger(__name__)
 
@@ -21,211 +45,212 @@ Create a popularity score of a game based on:
 """
 
 
-def calculate_n_daily_players(game, date):
-    return (
-        GameSession.objects.filter(game=game, start_time__date=date)
-        .values("contestant")
-        .distinct()
-        .count()
-    )
-
-
-def calculate_n_current_players(game):
-    return (
-        GameSession.objects.filter(game=game, end_time__isnull=True)
-        .values("contestant")
-        .distinct()
-        .count()
-    )
-
-
-def calculate_n_upvotes(game):
-    return game.upvotes
-
-
-def calculate_max_session_length_for_game(game, date):
-    session_length = GameSession.objects.filter(
-        game=game, start_time__date=date
-    ).annotate(session_length=Max("end_time") - Max("start_time")).aggregate(
-        Max("session_length")
-    )[
-        "session_length__max"
-    ] or timedelta(
-        seconds=0
-    )
-    return session_length.total_seconds()
-
-
-def calculate_n_daily_sessions(game, date):
-    return GameSession.objects.filter(game=game, start_time__date=date).count()
-
-
 @shared_task
-def cache_popularity_factors_and_max_values():
+def cache_popularity_factors_and_max_values(date=None):
     """
     Task to cache non-changing game popularity factors (n_daily_players, max_session_length_for_game, n_daily_sessions)
     and maximum values for normalization.
-    Runs once per day (every 24 hours).
+    Runs once per day (every 24 hours) for yesterday; pass an ISO `date` to backfill another day.
     """
     logger.info("Running cache_popularity_factors_and_max_values task")
-    yesterday = timezone.now().date() - timedelta(days=1)
-
-    popularity_cache = {}
+    target_date = timezone.now().date() - timedelta(days=1)
+    if date:
+        try:
+            target_date = parse_date(date)
+        except ValueError:
+            target_date = None
+        if target_date is None:
+            raise ValueError(f"Invalid date '{date}', expected YYYY-MM-DD.")
+
+    _, max_values, report = cache_daily_factors(target_date)
+
+    for name, value in max_values.items():
+        logger.info(f"Set cache for {name}: {value}")
+    logger.info(
+        f"Finished running cache_popularity_factors_and_max_values task for {report['date']}: "
+        f"{report['games']} games, {report['rows_scanned']} sessions scanned "
+        f"in {report['elapsed_seconds']}s"
+    )
+    return report
 
-    for game in Game.objects.all():
-        n_daily_players = calculate_n_daily_players(game, yesterday)
-        max_session_length_for_game = calculate_max_session_length_for_game(
-            game, yesterday
-        )
-        n_daily_sessions = calculate_n_daily_sessions(game, yesterday)
 
-        popularity_cache[f"game_{game.id}_n_daily_players"] = n_daily_players
-        popularity_cache[f"game_{game.id}_max_session_length_for_game"] = (
-            max_session_length_for_game
-        )
-        popularity_cache[f"game_{game.id}_n_daily_sessions"] = n_daily_sessions
-
-    # Calculate max values for normalization across all games
-    max_daily_players = (
-        GameSession.objects.filter(start_time__date=yesterday)
-        .values("game")
-        .annotate(count=Count("contestant", distinct=True))
-        .aggregate(Max("count"))["count__max"]
-        or 1
-    )
+@shared_task
+def refresh_game_popularity():
+    """
+    Task to refresh game popularity scores every 5 minutes.
+    Uses cached values for non-changing parameters. All games are scored under
+    every active PopularityProfile in one vectorized step and written with a
+    single bulk upsert, along with the current 5-minute bucket of the
+    popularity history. Each profile's Redis ranking is replaced and the top-N
+    changes are published to the live feeds.
+    """
+    logger.info("Running refresh_game_popularity task")
+    now = timezone.now()
+    yesterday = now.date() - timedelta(days=1)
 
-    max_concurrent_players = (
-        GameSession.objects.filter(end_time__isnull=True)
-        .values("game")
-        .annotate(count=Count("contestant", distinct=True))
-        .aggregate(Max("count"))["count__max"]
-        or 1
+    profiles = list(PopularityProfile.objects.filter(is_active=True).order_by("name"))
+    if not profiles:
+        logger.warning("No active popularity profiles, skipping refresh")
+        return
+
+    games = list(Game.objects.values_list("id", "name", "upvotes"))
+    game_ids = [game_id for game_id, _, _ in games]
+    names = {game_id: name for game_id, name, _ in games}
+    upvotes = {game_id: n_upvotes for game_id, _, n_upvotes in games}
+    factors, max_values = load_daily_factors(game_ids, yesterday)
+
+    scores = score_matrix(
+        build_factor_matrix(game_ids, factors, count_current_players(), upvotes),
+        max_values,
+        build_weight_matrix(profiles),
     )
 
-    max_upvotes = Game.objects.aggregate(Max("upvotes"))["upvotes__max"] or 1
-
-    max_session_length_across_all_games = GameSession.objects.filter(
-        start_time__date=yesterday
-    ).annotate(session_length=Max("end_time") - Max("start_time")).aggregate(
-        Max("session_length")
-    )[
-        "session_length__max"
-    ] or timedelta(
-        seconds=1
+    popularity_rows = []
+    history_rows = []
+    popularity_updates = {}
+    history_bucket = bucket_start(now, Resolution.FIVE_MINUTES)
+
+    for row, game_id in enumerate(game_ids):
+        for column, profile in enumerate(profiles):
+            score = float(scores[row, column])
+            popularity_rows.append(
+                GamePopularity(
+                    game_id=game_id,
+                    profile=profile,
+                    date=now.date(),
+                    popularity_score=score,
+                    last_updated=now,
+                )
+            )
+            history_rows.append(
+                PopularityHistory(
+                    game_id=game_id,
+                    profile=profile,
+                    resolution=Resolution.FIVE_MINUTES,
+                    bucket=history_bucket,
+                    score=score,
+                )
+            )
+            popularity_updates[score_cache_key(game_id, profile.name)] = score
+
+    GamePopularity.objects.bulk_create(
+        popularity_rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["game", "date", "profile"],
+        update_fields=["popularity_score", "last_updated", "updated_at"],
     )
-    max_session_length_across_all_games = (
-        max_session_length_across_all_games.total_seconds()
+    PopularityHistory.objects.bulk_create(
+        history_rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=HISTORY_KEY,
+        update_fields=["score"],
     )
 
-    max_daily_sessions = (
-        GameSession.objects.filter(start_time__date=yesterday)
-        .values("game")
-        .annotate(count=Count("id"))
-        .aggregate(Max("count"))["count__max"]
-        or 1
-    )
+    cache.set_many(popularity_updates, timeout=SCORE_TIMEOUT)
 
-    max_values_cache = {
-        "max_daily_players": max_daily_players,
-        "max_concurrent_players": max_concurrent_players,
-        "max_upvotes": max_upvotes,
-        "max_session_length_across_all_games": max_session_length_across_all_games,
-        "max_daily_sessions": max_daily_sessions,
-    }
-
-    # Store all cached values with a timeout of 24 hours (86,400 seconds)
-    cache.set_many({**popularity_cache, **max_values_cache}, timeout=86400)
-    logger.info("Finished running cache_popularity_factors_and_max_values task")
-    logger.info("Finished running cache_popularity_factors_and_max_values task")
-    logger.info(f"Set cache for max_daily_players: {max_daily_players}")
-    logger.info(f"Set cache for max_concurrent_players: {max_concurrent_players}")
-    logger.info(f"Set cache for max_upvotes: {max_upvotes}")
+    try:
+        for column, profile in enumerate(profiles):
+            PopularityRanking(profile.name, now.date()).rebuild(
+                zip(game_ids, scores[:, column].tolist())
+            )
+    except RedisError as e:
+        logger.warning(f"Failed to update popularity rankings: {e}")
+
+    for column, profile in enumerate(profiles):
+        PopularityFeed(profile.name).publish(
+            top_popularity(game_ids, names, scores[:, column].tolist())
+        )
     logger.info(
-        f"Set cache for max_session_length_across_all_games: {max_session_length_across_all_games}"
+        f"Finished running refresh_game_popularity task for {len(game_ids)} games "
+        f"and {len(profiles)} profiles"
     )
-    logger.info(f"Set cache for max_daily_sessions: {max_daily_sessions}")
 
 
 @shared_task
-def refresh_game_popularity():
+def rollup_popularity_history(lookback_hours=2):
     """
-    Task to refresh game popularity scores every 5 minutes.
-    Uses cached values for non-changing parameters.
+    Task to roll the popularity history up into hourly and daily buckets and
+    prune buckets past their retention. Runs every 15 minutes, recomputing the
+    last `lookback_hours`; pass a larger value to backfill missed runs.
     """
-    logger.info("Running refresh_game_popularity task")
-    now = timezone.now()
-    yesterday = now.date() - timedelta(days=1)
+    logger.info("Running rollup_popularity_history task")
 
-    popularity_updates = {}
+    written = rollup(timedelta(hours=lookback_hours))
+    deleted = prune()
 
-    for game in Game.objects.all():
-        # Get cached values or calculate if cache miss
-        n_daily_players = cache.get(f"game_{game.id}_n_daily_players")
-        if n_daily_players is None:
-            n_daily_players = calculate_n_daily_players(game, yesterday)
-            cache.set(f"game_{game.id}_n_daily_players", n_daily_players, timeout=86400)
+    logger.info(
+        f"Finished running rollup_popularity_history task: wrote {written}, "
+        f"pruned {deleted}"
+    )
+    return {"written": written, "deleted": deleted}
 
-        max_session_length_for_game = cache.get(
-            f"game_{game.id}_max_session_length_for_game"
-        )
-        if max_session_length_for_game is None:
-            max_session_length_for_game = calculate_max_session_length_for_game(
-                game, yesterday
-            )
-            cache.set(
-                f"game_{game.id}_max_session_length_for_game",
-                max_session_length_for_game,
-                timeout=86400,
-            )
 
-        n_daily_sessions = cache.get(f"game_{game.id}_n_daily_sessions")
-        if n_daily_sessions is None:
-            n_daily_sessions = calculate_n_daily_sessions(game, yesterday)
-            cache.set(
-                f"game_{game.id}_n_daily_sessions", n_daily_sessions, timeout=86400
+@shared_task
+def verify_leaderboards():
+    """
+    Task to verify the Redis leaderboards (global, per game and recent dates)
+    against the database. Rebuilds any that are missing (e.g. after a Redis
+    flush) or have drifted.
+    """
+    logger.info("Running verify_leaderboards task")
+
+    for leaderboard in iter_leaderboards():
+        if not leaderboard.is_ready():
+            logger.info(f"Leaderboard '{leaderboard.key}' missing, rebuilding")
+            leaderboard.rebuild()
+            continue
+
+        mismatches = leaderboard.check_consistency()
+        if mismatches:
+            logger.warning(
+                f"Leaderboard '{leaderboard.key}' has {len(mismatches)} mismatches, rebuilding"
             )
+            leaderboard.rebuild()
 
-        # Compute dynamic values
-        n_current_players = calculate_n_current_players(game)
-        n_upvotes = calculate_n_upvotes(game)
+    logger.info("Finished running verify_leaderboards task")
 
-        # Calculate max values for normalization
-        max_daily_players = cache.get("max_daily_players", 1)
-        max_concurrent_players = cache.get("max_concurrent_players", 1)
-        max_upvotes = cache.get("max_upvotes", 1)
-        max_session_length_across_all_games = cache.get(
-            "max_session_length_across_all_games", 1
-        )
-        max_daily_sessions = cache.get("max_daily_sessions", 1)
-
-        # Avoid division by zero
-        max_daily_players = max(max_daily_players, 1)
-        max_concurrent_players = max(max_concurrent_players, 1)
-        max_upvotes = max(max_upvotes, 1)
-        max_session_length_across_all_games = max(
-            max_session_length_across_all_games, 1
-        )
-        max_daily_sessions = max(max_daily_sessions, 1)
-
-        score = round(
-            (0.3 * (n_daily_players / max_daily_players))
-            + (0.2 * (n_current_players / max_concurrent_players))
-            + (0.25 * (n_upvotes / max_upvotes))
-            + (
-                0.15
-                * (max_session_length_for_game / max_session_length_across_all_games)
-            )
-            + (0.1 * (n_daily_sessions / max_daily_sessions)),
-            2,
-        )
 
-        GamePopularity.objects.update_or_create(
-            game=game,
-            date=now.date(),
-            defaults={"popularity_score": score, "last_updated": now},
+@shared_task
+def reconcile_live_player_counts():
+    """
+    Task to repair the live concurrent-player counters from the open sessions
+    in the database. Also rebuilds them after a Redis flush.
+    """
+    logger.info("Running reconcile_live_player_counts task")
+
+    drift = reconcile_live_players()
+    for game_id, (live_count, database_count) in drift.items():
+        logger.warning(
+            f"Live players for game {game_id} drifted: {live_count} in Redis, "
+            f"{database_count} in database"
         )
 
-        popularity_updates[f"game_{game.id}_score"] = score
+    logger.info("Finished running reconcile_live_player_counts task")
+
 
-    cache.set_many(popularity_updates, timeout=300)  # Cache scores for 5 minutes
-    logger.info("Finished running refresh_game_popularity task")
+@shared_task
+def flush_buffered_upvotes():
+    """
+    Task to apply upvotes buffered in Redis to Game.upvotes, one F() update
+    per game. Runs every few seconds; safe to re-run after an interrupted flush.
+    """
+    flushed = flush_upvotes()
+    if flushed is None:
+        logger.info("Another upvote flush is running, skipping")
+    return flushed
+
+
+@shared_task
+def publish_leaderboard_feeds():
+    """
+    Task to publish the top-N changes of the leaderboards changed since the
+    last run to the live feeds. Runs every few seconds, so sessions ending
+    close together produce a single delta per leaderboard.
+    """
+    try:
+        return publish_pending_feeds()
+    except RedisError as e:
+        logger.warning(f"Failed to publish leaderboard feeds: {e}")
+        return 0
@@ -1,3 +1,1566 @@
-from django.test import TestCase
+from datetime import date, timedelta
+import json
+import re
+import uuid
+from io import StringIO
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+import fakeredis
+
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Sum
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from gameboard.api.leaderboard.cache import game_scope
+from gameboard.api.response_cache import (
+    ResponseCache,
+    check_shared_cache,
+    invalidate_scopes,
+    metric_key,
+    response_cache_metrics,
+    response_cache_stats,
+)
+from gameboard.common.db.keyset import encode_cursor
+from gameboard.common.db.routers import ReadReplicaRouter
+from gameboard.games.admin import GameSessionAdmin
+from gameboard.games.benchmark import (
+    SKIPPED_ROUTES,
+    benchmark_routes,
+    compare,
+    iter_routes,
+    route_method,
+)
+from gameboard.games.feed import (
+    FEED_PENDING_KEY,
+    LeaderboardFeed,
+    diff_top,
+    stream_feed,
+)
+from gameboard.games.history import Resolution, bucket_start, prune, rollup
+from gameboard.games.leaderboard import (
+    DateLeaderboard,
+    GameLeaderboard,
+    GlobalLeaderboard,
+    iter_leaderboards,
+    record_session_scores,
+)
+from gameboard.games.live import (
+    LIVE_PLAYERS_KEY,
+    LIVE_PLAYERS_READY_KEY,
+    change_live_players,
+    database_player_counts,
+    reconcile_live_players,
+)
+from gameboard.games.metadata import (
+    MetadataCache,
+    contestant_metadata,
+    game_metadata,
+)
+from gameboard.games.models import (
+    Contestant,
+    ContestantDailyScore,
+    ContestantGameDailyScore,
+    ContestantGameScore,
+    Game,
+    GamePopularity,
+    GameSession,
+    PopularityHistory,
+    PopularityProfile,
+)
+from gameboard.games.popularity import (
+    PopularityRanking,
+    compute_daily_factors,
+    load_daily_factors,
+    popularity_score,
+)
+from gameboard.games.scores import (
+    rebuild_score_totals,
+    record_score_totals,
+    window_bounds,
+)
+from gameboard.games.tasks import (
+    cache_popularity_factors_and_max_values,
+    publish_leaderboard_feeds,
+    refresh_game_popularity,
+)
+from gameboard.games.upvotes import (
+    BATCH_KEY,
+    FLUSHING_KEY,
+    PENDING_KEY,
+    flush_upvotes,
+)
+
+
+class LeaderboardTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        start = timezone.now() - timedelta(hours=2)
+        cls.chess = Game.objects.create(name="Chess")
+        cls.poker = Game.objects.create(name="Poker")
+        cls.alice = Contestant.objects.create(name="Alice")
+        cls.bob = Contestant.objects.create(name="Bob")
+
+        for game, contestant, score in [
+            (cls.chess, cls.alice, 40),
+            (cls.poker, cls.alice, 30),
+            (cls.chess, cls.bob, 50),
+        ]:
+            GameSession.objects.create(
+                game=game,
+                contestant=contestant,
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                score=score,
+            )
+        rebuild_score_totals()
+
+    def setUp(self):
+        cache.clear()
+        game_metadata.clear()
+        contestant_metadata.clear()
+        response_cache_metrics.clear()
+
+
+class RedisTestCase(LeaderboardTestCase):
+    """Runs the Redis paths against an in-memory fake server of its own."""
+
+    def setUp(self):
+        super().setUp()
+        self.redis_server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(
+            server=self.redis_server, decode_responses=True
+        )
+        patcher = patch("gameboard.common.redis.client._connection", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class GlobalLeaderboardViewTests(LeaderboardTestCase):
+    def test_ranks_contestants_by_total_score(self):
+        response = self.client.get(reverse("global-leaderboard"))
+
+        self.assertEqual(response.status_code, 200)
+        leaderboard = response.json()["results"]["leaderboard"]
+        self.assertEqual(
+            [
+                (entry["contestant__name"], entry["total_score"], entry["rank"])
+                for entry in leaderboard
+            ],
+            [("Alice", 70, 1), ("Bob", 50, 2)],
+        )
+
+
+class RedisLeaderboardTests(RedisTestCase):
+    def setUp(self):
+        super().setUp()
+        # Ties with Bob; ties are ordered by contestant_id descending
+        self.carol = Contestant.objects.create(name="Carol")
+        GameSession.objects.create(
+            game=self.poker,
+            contestant=self.carol,
+            start_time=timezone.now() - timedelta(hours=1),
+            end_time=timezone.now(),
+            score=50,
+        )
+        rebuild_score_totals()
+        self.leaderboard = GlobalLeaderboard()
+        self.leaderboard.rebuild()
+
+    def database_order(self):
+        return [
+            (entry["contestant_id"], entry["total_score"])
+            for entry in self.leaderboard.database_queryset()
+        ]
+
+    def test_pages_match_database_order(self):
+        url = reverse("global-leaderboard")
+        with self.assertNoLogs("gameboard", "WARNING"):
+            pages = [
+                self.client.get(url, {"page_size": 2, "page": page}).json()
+                for page in (1, 2)
+            ]
+            cursor = self.client.get(url, {"pagination": "cursor", "page_size": 2})
+
+        entries = [entry for page in pages for entry in page["results"]["leaderboard"]]
+        self.assertEqual(pages[0]["count"], 3)
+        self.assertEqual(
+            [
+                (uuid.UUID(entry["contestant_id"]), entry["total_score"])
+                for entry in entries
+            ],
+            self.database_order(),
+        )
+        self.assertEqual([entry["rank"] for entry in entries], [1, 2, 3])
+
+        # The cursor resumes after the last entry of the page, within the tie
+        next_page = self.client.get(cursor.json()["next"]).json()
+        self.assertEqual(next_page["results"]["leaderboard"], [entries[2]])
+
+    def test_rejects_tampered_cursors(self):
+        for key in [["x", str(self.bob.id)], [50, "x"], [50]]:
+            cursor = encode_cursor({"p": 0, "k": key})
+            with self.subTest(key=key):
+                response = self.client.get(
+                    reverse("global-leaderboard"), {"cursor": cursor}
+                )
+                self.assertEqual(response.status_code, 404)
+
+    def test_rank_with_neighbours(self):
+        first, second, third = self.database_order()
+
+        result = self.leaderboard.rank(second[0], window=1)
+
+        self.assertEqual((result["rank"], result["total_score"]), (2, second[1]))
+        self.assertEqual(
+            [entry["contestant_id"] for entry in result["above"]], [str(first[0])]
+        )
+        self.assertEqual(
+            [entry["contestant_id"] for entry in result["below"]], [str(third[0])]
+        )
+        self.assertIsNone(self.leaderboard.rank(self.chess.id))
+
+    def test_session_scores_keep_boards_consistent(self):
+        for leaderboard in iter_leaderboards(days=1):
+            leaderboard.rebuild()
+        session = GameSession.objects.create(
+            game=self.chess, contestant=self.carol, start_time=timezone.now()
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("end-game-session"),
+                {"session_id": str(session.id), "score": 25},
+                content_type="application/json",
+            )
+
+        self.assertEqual(
+            self.redis.zscore(self.leaderboard.key, str(self.carol.id)), 75
+        )
+        for leaderboard in (
+            self.leaderboard,
+            GameLeaderboard(self.chess.id),
+            DateLeaderboard(timezone.localdate()),
+        ):
+            self.assertEqual(leaderboard.check_consistency(), [], leaderboard.key)
+
+        self.redis.zincrby(self.leaderboard.key, 5, str(self.bob.id))
+        self.assertEqual(
+            self.leaderboard.check_consistency(), [(str(self.bob.id), 50, 55)]
+        )
+
+    def test_rebuild_keeps_scores_applied_while_reading_the_database(self):
+        totals = list(self.leaderboard.load_totals())
+        newcomer = Contestant.objects.create(name="Dave")
+
+        def load_totals():
+            yield totals[0]
+            # Sessions end after the database was read
+            self.leaderboard.incr(self.bob.id, 5)
+            self.leaderboard.incr(newcomer.id, 10)
+            yield from totals[1:]
+
+        self.leaderboard.rebuild(load_totals())
+
+        self.assertEqual(self.redis.zscore(self.leaderboard.key, str(self.bob.id)), 55)
+        self.assertEqual(self.redis.zscore(self.leaderboard.key, str(newcomer.id)), 10)
+        self.assertEqual(self.redis.zcard(self.leaderboard.key), 4)
+        self.assertEqual(self.redis.keys(f"{self.leaderboard.key}:rebuild*"), [])
+
+
+class GameLeaderboardViewTests(LeaderboardTestCase):
+    def test_reads_from_game_score_table(self):
+        response = self.client.get(
+            reverse("game-leaderboard", kwargs={"game_id": self.chess.id})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        leaderboard = response.json()["results"]["leaderboard"]
+        self.assertEqual(
+            [
+                (entry["contestant__name"], entry["total_score"])
+                for entry in leaderboard
+            ],
+            [("Bob", 50), ("Alice", 40)],
+        )
+
+
+class EndGameSessionViewTests(LeaderboardTestCase):
+    def test_updates_score_tables(self):
+        session = GameSession.objects.create(
+            game=self.poker, contestant=self.bob, start_time=timezone.now()
+        )
+        daily_score = ContestantDailyScore.objects.filter(
+            date=timezone.localdate(session.start_time), contestant=self.bob
+        ).first()
+        previous_daily_total = daily_score.total_score if daily_score else 0
+
+        response = self.client.post(
+            reverse("end-game-session"),
+            {"session_id": str(session.id), "score": 25},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            ContestantGameScore.objects.get(
+                game=self.poker, contestant=self.bob
+            ).total_score,
+            25,
+        )
+        self.assertEqual(
+            ContestantDailyScore.objects.get(
+                date=timezone.localdate(session.start_time), contestant=self.bob
+            ).total_score,
+            previous_daily_total + 25,
+        )
+
+
+class EndGameSessionQueryTests(RedisTestCase):
+    def end_with_query_count(self, count):
+        game_metadata.get(self.poker.id)
+        contestant_metadata.get(self.bob.id)
+        session = GameSession.objects.create(
+            game=self.poker, contestant=self.bob, start_time=timezone.now(), score=10
+        )
+        # Make sure both score rows exist so the totals are plain UPDATEs
+        record_score_totals(self.poker.id, self.bob.id, session.start_time, 10)
+
+        leaderboard = GlobalLeaderboard()
+        leaderboard.rebuild()
+
+        # Includes the on_commit Redis updates, which must not query
+        with self.assertNumQueries(count), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("end-game-session"),
+                {"session_id": str(session.id), "score": 40},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["game"], "Poker")
+        self.assertEqual(response.json()["contestant"], "Bob")
+        self.assertEqual(
+            ContestantGameScore.objects.get(
+                game=self.poker, contestant=self.bob
+            ).total_score,
+            40,
+        )
+        self.assertEqual(self.redis.zscore(leaderboard.key, str(self.bob.id)), 90)
+        self.assertIn(leaderboard.key, self.redis.smembers(FEED_PENDING_KEY))
+
+        response = self.client.post(
+            reverse("end-game-session"),
+            {"session_id": str(session.id), "score": 50},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_fixed_query_count(self):
+        # savepoint, UPDATE ... RETURNING session, UPDATE game, daily and
+        # game daily totals, release
+        self.end_with_query_count(6)
+
+    def test_fixed_query_count_without_update_returning(self):
+        # As above, with the open session read by a SELECT first
+        with patch("gameboard.games.sessions.can_update_returning", return_value=False):
+            self.end_with_query_count(7)
+
+
+class WindowLeaderboardViewTests(LeaderboardTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        start = timezone.now() - timedelta(days=3)
+        GameSession.objects.create(
+            game=cls.chess,
+            contestant=cls.bob,
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            score=100,
+        )
+        record_score_totals(cls.chess.id, cls.bob.id, start, 100)
+
+    def leaderboard(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return [
+            (entry["contestant__name"], entry["total_score"], entry["rank"])
+            for entry in response.json()["results"]["leaderboard"]
+        ]
+
+    def test_sums_daily_scores_over_the_window(self):
+        url = reverse("window-leaderboard")
+
+        self.assertEqual(
+            self.leaderboard(url, window="last-7-days"),
+            [("Bob", 150, 1), ("Alice", 70, 2)],
+        )
+        self.assertEqual(
+            self.leaderboard(url, window="day"), [("Alice", 70, 1), ("Bob", 50, 2)]
+        )
+        self.assertEqual(
+            self.leaderboard(
+                reverse("game-window-leaderboard", kwargs={"game_id": self.chess.id}),
+                window="last-7-days",
+            ),
+            [("Bob", 150, 1), ("Alice", 40, 2)],
+        )
+
+    def test_incremental_totals_match_a_rebuild(self):
+        incremental = set(
+            ContestantGameDailyScore.objects.values_list(
+                "game", "date", "contestant", "total_score"
+            )
+        )
+        rebuild_score_totals()
+
+        self.assertEqual(
+            set(
+                ContestantGameDailyScore.objects.values_list(
+                    "game", "date", "contestant", "total_score"
+                )
+            ),
+            incremental,
+        )
+
+    def test_window_bounds(self):
+        sunday = date(2026, 10, 18)
+
+        self.assertEqual(window_bounds("week", sunday), (date(2026, 10, 12), sunday))
+        self.assertEqual(
+            window_bounds("month", date(2024, 2, 10)),
+            (date(2024, 2, 1), date(2024, 2, 29)),
+        )
+        self.assertEqual(
+            window_bounds("last-7-days", sunday), (date(2026, 10, 12), sunday)
+        )
+
+    def test_rejects_unknown_window(self):
+        response = self.client.get(reverse("window-leaderboard"), {"window": "year"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_windows_past_the_supported_dates(self):
+        for params in [
+            {"date": "9999-12-31", "window": "month"},
+            {"date": "9999-12-31", "window": "week"},
+            {"date": "0001-01-01", "window": "last-30-days"},
+        ]:
+            with self.subTest(**params):
+                response = self.client.get(reverse("window-leaderboard"), params)
+                self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(
+            reverse("game-window-leaderboard", kwargs={"game_id": self.chess.id}),
+            {"date": "9999-12-31", "window": "month"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class StartGameSessionViewTests(LeaderboardTestCase):
+    def start(self, game, contestant):
+        return self.client.post(
+            reverse("start-game-session"),
+            {"game_id": str(game.id), "contestant_id": str(contestant.id)},
+            content_type="application/json",
+        )
+
+    def test_single_insert_with_cached_metadata(self):
+        self.start(self.chess, self.bob)
+        self.start(self.poker, self.alice)
+
+        with self.assertNumQueries(3):  # savepoint, INSERT, release
+            response = self.start(self.chess, self.alice)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["game"], "Chess")
+
+    def test_rejects_second_ongoing_session(self):
+        self.assertEqual(self.start(self.chess, self.bob).status_code, 201)
+
+        response = self.start(self.chess, self.bob)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            GameSession.objects.filter(
+                game=self.chess, contestant=self.bob, end_time__isnull=True
+            ).count(),
+            1,
+        )
+
+
+class MetadataCacheTests(LeaderboardTestCase):
+    def test_evicts_least_recently_used_entries(self):
+        metadata = MetadataCache(Game, maxsize=2)
+        metadata.get(self.chess.id)
+        metadata.get(self.poker.id)
+        metadata.get(self.chess.id)  # Poker is now the least recently used
+
+        metadata.get(Game.objects.create(name="Go").id)
+
+        self.assertEqual(len(metadata.entries), 2)
+        self.assertNotIn(self.poker.id, metadata.entries)
+        with self.assertNumQueries(0):
+            self.assertEqual(metadata.get(self.chess.id)["name"], "Chess")
+
+    def test_drops_expired_entries(self):
+        metadata = MetadataCache(Game, timeout=-1)
+        metadata.get(self.chess.id)
+        Game.objects.filter(id=self.chess.id).delete()
+
+        self.assertIsNone(metadata.get(self.chess.id))
+        self.assertNotIn(self.chess.id, metadata.entries)
+
+
+class GameLiveViewTests(LeaderboardTestCase):
+    def test_counts_players_across_start_and_end(self):
+        url = reverse("game-live", kwargs={"game_id": self.chess.id})
+
+        response = self.client.post(
+            reverse("start-game-session"),
+            {"game_id": str(self.chess.id), "contestant_id": str(self.alice.id)},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.client.get(url).json()["current_players"], 1)
+
+        self.client.post(
+            reverse("end-game-session"),
+            {"session_id": response.json()["session_id"], "score": 10},
+            content_type="application/json",
+        )
+        self.assertEqual(self.client.get(url).json()["current_players"], 0)
+
+    def test_unknown_game(self):
+        response = self.client.get(
+            reverse("game-live", kwargs={"game_id": self.alice.id})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class LiveCountersTests(RedisTestCase):
+    def post(self, name, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse(name), data, content_type="application/json"
+            )
+
+    def test_first_read_reconciles_then_counts_in_redis(self):
+        url = reverse("game-live", kwargs={"game_id": self.chess.id})
+        GameSession.objects.create(
+            game=self.chess, contestant=self.alice, start_time=timezone.now()
+        )
+
+        with self.assertNoLogs("gameboard", "WARNING"):
+            self.assertEqual(self.client.get(url).json()["current_players"], 1)
+        self.assertTrue(self.redis.exists(LIVE_PLAYERS_READY_KEY))
+
+        response = self.post(
+            "start-game-session",
+            {"game_id": str(self.chess.id), "contestant_id": str(self.bob.id)},
+        )
+        self.assertEqual(self.redis.hget(LIVE_PLAYERS_KEY, str(self.chess.id)), "2")
+        self.post(
+            "end-game-session",
+            {"session_id": response.json()["session_id"], "score": 10},
+        )
+        with self.assertNumQueries(1):  # the game lookup
+            self.assertEqual(self.client.get(url).json()["current_players"], 1)
+
+    def test_reconcile_keeps_changes_made_while_counting(self):
+        GameSession.objects.create(
+            game=self.chess, contestant=self.alice, start_time=timezone.now()
+        )
+        self.redis.hset(LIVE_PLAYERS_KEY, str(self.chess.id), 3)
+        self.redis.set(LIVE_PLAYERS_READY_KEY, 1)
+
+        def count_while_a_session_starts():
+            counts = database_player_counts()
+            change_live_players(self.poker.id, 1)
+            return counts
+
+        with patch(
+            "gameboard.games.live.database_player_counts",
+            side_effect=count_while_a_session_starts,
+        ):
+            drift = reconcile_live_players()
+
+        self.assertEqual(drift, {str(self.chess.id): (3, 1)})
+        self.assertEqual(
+            self.redis.hgetall(LIVE_PLAYERS_KEY),
+            {str(self.chess.id): "1", str(self.poker.id): "1"},
+        )
+
+
+class LeaderboardResponseCacheTests(LeaderboardTestCase):
+    def end_session(self, game, contestant, score):
+        session = GameSession.objects.create(
+            game=game, contestant=contestant, start_time=timezone.now()
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("end-game-session"),
+                {"session_id": str(session.id), "score": score},
+                content_type="application/json",
+            )
+
+    def test_invalidated_when_session_ends(self):
+        url = reverse("game-leaderboard", kwargs={"game_id": self.poker.id})
+        self.assertEqual(self.client.get(url)["X-Cache"], "MISS")
+        self.assertEqual(self.client.get(url)["X-Cache"], "HIT")
+
+        self.end_session(self.poker, self.bob, 100)
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(
+            response.json()["results"]["leaderboard"][0]["contestant__name"], "Bob"
+        )
+
+        stats = self.client.get(reverse("leaderboard-cache-stats")).json()
+        self.assertEqual(stats["GameLeaderboardView"]["hits"], 1)
+        self.assertEqual(stats["GameLeaderboardView"]["misses"], 2)
+
+    def test_other_games_stay_cached(self):
+        url = reverse("game-leaderboard", kwargs={"game_id": self.chess.id})
+        self.client.get(url)
+
+        self.end_session(self.poker, self.bob, 100)
+
+        self.assertEqual(self.client.get(url)["X-Cache"], "HIT")
+
+    def test_serves_stale_while_another_request_recomputes(self):
+        url = reverse("game-leaderboard", kwargs={"game_id": self.chess.id})
+        self.client.get(url)
+        invalidate_scopes(game_scope(self.chess.id))
+
+        with patch.object(ResponseCache, "acquire", return_value=False):
+            self.assertEqual(self.client.get(url)["X-Cache"], "STALE")
+        self.assertEqual(self.client.get(url)["X-Cache"], "MISS")
+
+    def test_shared_with_other_cache_clients(self):
+        # A second client of the configured cache stands in for another worker
+        other_worker = caches.create_connection("default")
+        url = reverse("game-leaderboard", kwargs={"game_id": self.chess.id})
+        self.client.get(url)
+
+        with patch("gameboard.api.response_cache.cache", other_worker):
+            invalidate_scopes(game_scope(self.chess.id))
+            cached = ResponseCache(
+                "GameLeaderboardView", game_scope(self.chess.id), 10, 30
+            )
+            self.assertTrue(
+                cached.acquire(f"{cached.entry_key(RequestFactory().get(url))}:lock")
+            )
+
+        # The other worker holds the recompute lock for the invalidated entry
+        self.assertEqual(self.client.get(url)["X-Cache"], "STALE")
+        with patch("gameboard.api.response_cache.cache", other_worker):
+            stats = response_cache_stats()
+        self.assertEqual(stats["GameLeaderboardView"]["stale_hits"], 1)
+
+    def test_counts_in_process_until_the_interval_passes(self):
+        url = reverse("game-leaderboard", kwargs={"game_id": self.chess.id})
+        self.client.get(url)
+        self.client.get(url)
+
+        self.assertIsNone(cache.get(metric_key("GameLeaderboardView", "hits")))
+
+        with patch.object(response_cache_metrics, "interval", 0):
+            self.client.get(url)
+
+        self.assertEqual(cache.get(metric_key("GameLeaderboardView", "hits")), 2)
+        self.assertEqual(cache.get(metric_key("GameLeaderboardView", "misses")), 1)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_warns_about_per_process_cache(self):
+        self.assertEqual(
+            [message.id for message in check_shared_cache(None)], ["gameboard.W001"]
+        )
+
+
+class LiveFeedTests(LeaderboardTestCase):
+    def test_diff_top_reports_changed_and_removed_entries(self):
+        previous = [
+            {"contestant_id": "a", "total_score": 70, "rank": 1},
+            {"contestant_id": "b", "total_score": 50, "rank": 2},
+            {"contestant_id": "c", "total_score": 40, "rank": 3},
+        ]
+        current = [
+            {"contestant_id": "a", "total_score": 70, "rank": 1},
+            {"contestant_id": "d", "total_score": 60, "rank": 2},
+            {"contestant_id": "b", "total_score": 50, "rank": 3},
+        ]
+
+        changed, removed = diff_top(previous, current, "contestant_id")
+
+        self.assertEqual([entry["contestant_id"] for entry in changed], ["d", "b"])
+        self.assertEqual(removed, ["c"])
+
+    def test_requires_asgi(self):
+        response = self.client.get(reverse("global-leaderboard-feed"))
+
+        self.assertEqual(response.status_code, 501)
+
+    async def test_unknown_game(self):
+        response = await self.async_client.get(
+            reverse("game-leaderboard-feed", kwargs={"game_id": self.alice.id})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class FeedPublishTests(RedisTestCase):
+    def setUp(self):
+        super().setUp()
+        self.leaderboard = GlobalLeaderboard()
+        self.leaderboard.rebuild()
+        self.feed = LeaderboardFeed(self.leaderboard)
+
+    def ranks(self, entries):
+        return [(entry["contestant__name"], entry["rank"]) for entry in entries]
+
+    def test_publishes_consecutive_deltas_of_the_top_entries(self):
+        pubsub = self.redis.pubsub()
+        pubsub.subscribe(self.feed.channel)
+
+        first = self.feed.publish()
+        self.assertIsNone(self.feed.publish())
+        self.leaderboard.incr(self.bob.id, 30)
+        second = self.feed.publish()
+
+        self.assertEqual(first["seq"], 1)
+        self.assertEqual(self.ranks(first["changed"]), [("Alice", 1), ("Bob", 2)])
+        self.assertEqual(
+            (second["seq"], self.ranks(second["changed"]), second["removed"]),
+            (2, [("Bob", 1), ("Alice", 2)], []),
+        )
+        published = [pubsub.get_message(timeout=1) for _ in range(3)]
+        self.assertEqual(
+            [json.loads(message["data"]) for message in published[1:]],
+            [first, second],
+        )
+
+    def test_session_scores_are_published_by_the_periodic_task(self):
+        self.feed.publish()
+        today = timezone.now().date()
+        record_session_scores([(self.chess.id, self.bob.id, today, 30)])
+
+        self.assertEqual(
+            self.redis.smembers(FEED_PENDING_KEY),
+            {
+                self.leaderboard.key,
+                GameLeaderboard(self.chess.id).key,
+                DateLeaderboard(today).key,
+            },
+        )
+        self.assertEqual(json.loads(self.redis.get(self.feed.snapshot_key))["seq"], 1)
+
+        self.assertEqual(publish_leaderboard_feeds(), 3)
+        self.assertFalse(self.redis.exists(FEED_PENDING_KEY))
+        snapshot = json.loads(self.redis.get(self.feed.snapshot_key))
+        self.assertEqual(
+            (snapshot["seq"], self.ranks(snapshot["entries"])),
+            (2, [("Bob", 1), ("Alice", 2)]),
+        )
+
+    async def test_stream_starts_with_snapshot_then_sends_deltas(self):
+        async_redis = fakeredis.FakeAsyncRedis(
+            server=self.redis_server, decode_responses=True
+        )
+        stream = stream_feed(self.feed)
+        with patch(
+            "gameboard.games.feed.get_async_redis_connection",
+            return_value=async_redis,
+        ):
+            self.assertTrue((await anext(stream)).startswith("retry:"))
+            snapshot = await anext(stream)
+            self.leaderboard.incr(self.bob.id, 30)
+            await sync_to_async(self.feed.publish)()
+            # The subscribe confirmation ends an early wait with a keep-alive
+            delta = await anext(stream)
+            while delta.startswith(":"):
+                delta = await anext(stream)
+            await stream.aclose()
+
+        self.assertTrue(snapshot.startswith("event: snapshot\n"))
+        self.assertEqual(json.loads(snapshot.split("data: ")[1])["seq"], 1)
+        self.assertTrue(delta.startswith("event: delta\n"))
+        data = json.loads(delta.split("data: ")[1])
+        self.assertEqual(
+            (data["seq"], self.ranks(data["changed"])),
+            (2, [("Bob", 1), ("Alice", 2)]),
+        )
+
+
+class UpvoteGameViewTests(LeaderboardTestCase):
+    def test_updates_row_when_redis_is_unavailable(self):
+        url = reverse("upvote-game", kwargs={"game_id": self.chess.id})
+
+        responses = [self.client.post(url) for _ in range(2)]
+
+        self.assertEqual([response.json()["upvotes"] for response in responses], [1, 2])
+        self.chess.refresh_from_db()
+        self.assertEqual(self.chess.upvotes, 2)
+
+
+class UpvoteBufferTests(RedisTestCase):
+    def test_buffers_upvotes_until_flushed(self):
+        url = reverse("upvote-game", kwargs={"game_id": self.chess.id})
+
+        responses = [self.client.post(url) for _ in range(2)]
+
+        self.assertEqual([response.json()["upvotes"] for response in responses], [1, 2])
+        self.chess.refresh_from_db()
+        self.assertEqual(self.chess.upvotes, 0)
+
+        self.assertEqual(flush_upvotes(), 2)
+        self.chess.refresh_from_db()
+        self.assertEqual(self.chess.upvotes, 2)
+        self.assertEqual(self.redis.keys("upvotes:*"), [])
+        self.assertEqual(self.client.post(url).json()["upvotes"], 3)
+
+    def test_resumes_interrupted_flush_once(self):
+        self.redis.hset(FLUSHING_KEY, str(self.chess.id), 3)
+        self.redis.hset(PENDING_KEY, str(self.chess.id), 1)
+        self.redis.set(BATCH_KEY, "interrupted")
+
+        self.assertEqual(flush_upvotes(), 3)
+        self.assertEqual(flush_upvotes(), 1)
+
+        # Interrupted after the batch was committed: discarded, not reapplied
+        self.redis.hset(FLUSHING_KEY, str(self.chess.id), 3)
+        self.redis.set(BATCH_KEY, "interrupted")
+        with self.assertLogs("gameboard.games.upvotes", "WARNING"):
+            self.assertEqual(flush_upvotes(), 0)
+
+        self.chess.refresh_from_db()
+        self.assertEqual(self.chess.upvotes, 4)
+
+
+class BulkGameSessionsViewTests(LeaderboardTestCase):
+    def test_imports_json_lines_and_reports_bad_rows(self):
+        start = timezone.now() - timedelta(days=3)
+        row = {
+            "game_id": str(self.poker.id),
+            "contestant_id": str(self.bob.id),
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=10)).isoformat(),
+            "score": 15,
+        }
+        body = "\n".join(
+            [
+                json.dumps(row),
+                json.dumps({**row, "score": 5}),
+                json.dumps({**row, "game_id": str(self.alice.id)}),
+                json.dumps({**row, "end_time": "yesterday"}),
+                "{not json",
+            ]
+        )
+
+        response = self.client.post(
+            reverse("bulk-game-sessions") + "?batch_size=2",
+            body,
+            content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual((report["created"], report["failed"]), (2, 3))
+        self.assertEqual(sorted(error["line"] for error in report["errors"]), [3, 4, 5])
+        self.assertEqual(
+            ContestantGameScore.objects.get(
+                game=self.poker, contestant=self.bob
+            ).total_score,
+            20,
+        )
+        self.assertEqual(
+            ContestantDailyScore.objects.get(
+                date=timezone.localdate(start), contestant=self.bob
+            ).total_score,
+            20,
+        )
+        self.assertEqual(
+            ContestantGameDailyScore.objects.get(
+                game=self.poker, date=timezone.localdate(start), contestant=self.bob
+            ).total_score,
+            20,
+        )
+
+    def test_imports_csv(self):
+        start = timezone.now() - timedelta(days=3)
+        body = (
+            "game_id,contestant_id,start_time,end_time,score\n"
+            f"{self.chess.id},{self.alice.id},{start.isoformat()},"
+            f"{(start + timedelta(minutes=5)).isoformat()},7\n"
+        )
+
+        response = self.client.post(
+            reverse("bulk-game-sessions"), body, content_type="text/csv"
+        )
+
+        self.assertEqual(response.json()["created"], 1)
+        self.assertEqual(
+            ContestantGameScore.objects.get(
+                game=self.chess, contestant=self.alice
+            ).total_score,
+            47,
+        )
+
+
+class ExportViewTests(LeaderboardTestCase):
+    def test_global_leaderboard_csv(self):
+        response = self.client.get(reverse("global-leaderboard-export"))
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            lines,
+            [
+                "rank,contestant_id,contestant_name,total_score",
+                f"1,{self.alice.id},Alice,70",
+                f"2,{self.bob.id},Bob,50",
+            ],
+        )
+
+    def test_game_sessions_ndjson(self):
+        response = self.client.get(
+            reverse("game-sessions-export"),
+            {"game_id": str(self.chess.id), "output": "ndjson"},
+        )
+
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(sorted(row["score"] for row in rows), [40, 50])
+        self.assertEqual({row["game_id"] for row in rows}, {str(self.chess.id)})
+
+
+class ContestantRankViewTests(LeaderboardTestCase):
+    def test_global_rank_with_neighbours(self):
+        response = self.client.get(
+            reverse("global-rank", kwargs={"contestant_id": self.bob.id}),
+            {"window": 1},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data["rank"], data["total_score"]), (2, 50))
+        self.assertEqual(
+            [entry["contestant__name"] for entry in data["above"]], ["Alice"]
+        )
+        self.assertEqual(data["below"], [])
+
+    def test_game_rank(self):
+        response = self.client.get(
+            reverse(
+                "game-rank",
+                kwargs={"contestant_id": self.alice.id, "game_id": self.chess.id},
+            )
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rank"], 2)
+
+    def test_unknown_contestant(self):
+        response = self.client.get(
+            reverse("global-rank", kwargs={"contestant_id": self.chess.id})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CursorPaginationTests(LeaderboardTestCase):
+    def walk(self, url, params):
+        results = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertNotIn("count", data)
+            results.append(data["results"])
+            if not data["next"]:
+                return results
+            response = self.client.get(data["next"])
+
+    def test_global_leaderboard_cursor(self):
+        pages = self.walk(
+            reverse("global-leaderboard"), {"pagination": "cursor", "page_size": 1}
+        )
+
+        entries = [page["leaderboard"][0] for page in pages]
+        self.assertEqual(
+            [(entry["contestant__name"], entry["rank"]) for entry in entries],
+            [("Alice", 1), ("Bob", 2)],
+        )
+
+    def test_game_sessions_cursor(self):
+        for _ in range(3):
+            GameSession.objects.create(
+                game=self.chess,
+                contestant=self.alice,
+                start_time=timezone.now(),
+                end_time=timezone.now(),
+            )
+
+        pages = self.walk(
+            reverse("list-game-sessions", kwargs={"game_id": self.chess.id}),
+            {"pagination": "cursor", "page_size": 2},
+        )
+
+        session_ids = [session["id"] for page in pages for session in page]
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len(set(session_ids)), 5)
+
+    def test_contestants_cursor(self):
+        Contestant.objects.create(name="Carol")
+
+        pages = self.walk(reverse("list-contestants"), {"pagination": "cursor"})
+
+        self.assertEqual(
+            [contestant["name"] for contestant in pages[0]], ["Alice", "Bob", "Carol"]
+        )
+
+    def test_rejects_tampered_cursors(self):
+        urls = [
+            reverse("global-leaderboard"),
+            reverse("game-leaderboard", kwargs={"game_id": self.chess.id}),
+            reverse("window-leaderboard"),
+            reverse("list-game-sessions", kwargs={"game_id": self.chess.id}),
+            reverse("list-contestants"),
+        ]
+        keys = [["x"], "x", {"k": 1}, [None, None], ["x", "y", "z"], ["x", "y"]]
+
+        for url in urls:
+            for key in keys:
+                cursor = encode_cursor({"p": 0, "k": key})
+                with self.subTest(url=url, key=key):
+                    response = self.client.get(url, {"cursor": cursor})
+                    self.assertEqual(response.status_code, 404)
+
+
+class RefreshGamePopularityTests(LeaderboardTestCase):
+    def test_upserts_one_row_per_game_in_constant_queries(self):
+        for i in range(10):
+            Game.objects.create(name=f"Game {i}")
+
+        refresh_game_popularity()
+        with self.assertNumQueries(5):
+            refresh_game_popularity()
+
+        self.assertEqual(
+            GamePopularity.objects.filter(
+                date=timezone.now().date(), profile__name="default"
+            ).count(),
+            Game.objects.count(),
+        )
+        self.assertEqual(
+            PopularityHistory.objects.filter(
+                profile__name="default", resolution=300
+            ).count(),
+            Game.objects.count(),
+        )
+        self.assertIsNotNone(cache.get(f"game_{self.chess.id}_score"))
+        self.assertIsNotNone(cache.get(f"game_{self.chess.id}_score_trending"))
+
+    def test_vectorized_scores_match_scalar_formula(self):
+        Game.objects.filter(id=self.chess.id).update(upvotes=10)
+        GameSession.objects.create(
+            game=self.poker, contestant=self.bob, start_time=timezone.now()
+        )
+
+        refresh_game_popularity()
+
+        factors, max_values = load_daily_factors(
+            [self.chess.id, self.poker.id], timezone.now().date() - timedelta(days=1)
+        )
+        for game, n_upvotes, n_current_players in [
+            (self.chess, 10, 0),
+            (self.poker, 0, 1),
+        ]:
+            expected = popularity_score(
+                n_daily_players=factors[game.id]["n_daily_players"],
+                n_current_players=n_current_players,
+                n_upvotes=n_upvotes,
+                max_session_length_for_game=factors[game.id][
+                    "max_session_length_for_game"
+                ],
+                n_daily_sessions=factors[game.id]["n_daily_sessions"],
+                max_values=max_values,
+            )
+            self.assertAlmostEqual(
+                GamePopularity.objects.get(
+                    game=game, profile__name="default"
+                ).popularity_score,
+                expected,
+            )
+
+
+class GamePopularityViewTests(LeaderboardTestCase):
+    def test_overlays_cached_scores_on_the_page_only(self):
+        for i in range(10):
+            Game.objects.create(name=f"Game {i}")
+        Game.objects.filter(id=self.chess.id).update(upvotes=10)
+        refresh_game_popularity()
+        cache.set(f"game_{self.chess.id}_score", 99.0)
+
+        with patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            response = self.client.get(
+                reverse("popularity-leaderboard"), {"page_size": 5}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], Game.objects.count())
+        get_many.assert_called_once()
+        self.assertEqual(len(get_many.call_args.args[0]), 5)
+        games = response.json()["results"]["games"]
+        self.assertEqual([entry["rank"] for entry in games], [1, 2, 3, 4, 5])
+        self.assertIn(
+            (str(self.chess.id), 99.0),
+            [(entry["game_id"], entry["popularity_score"]) for entry in games],
+        )
+
+
+class PopularityRankingTests(RedisTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(10):
+            Game.objects.create(name=f"Game {i}", upvotes=i % 3)
+        refresh_game_popularity()
+        self.ranking = PopularityRanking("default", timezone.now().date())
+
+    def test_refresh_replaces_each_profile_ranking(self):
+        self.assertEqual(self.redis.zcard(self.ranking.key), Game.objects.count())
+        self.assertGreater(self.redis.ttl(self.ranking.key), 0)
+        self.assertTrue(self.ranking.is_ready())
+        trending = PopularityRanking("trending", timezone.now().date())
+        self.assertEqual(self.redis.zcard(trending.key), Game.objects.count())
+
+    def test_pages_are_served_from_redis_in_database_order(self):
+        url = reverse("popularity-leaderboard")
+        with self.assertNoLogs("gameboard", "WARNING"):
+            pages = [
+                self.client.get(url, {"page_size": 5, "page": page}).json()
+                for page in (1, 2, 3)
+            ]
+            cursor = self.client.get(url, {"pagination": "cursor", "page_size": 5})
+            next_page = self.client.get(cursor.json()["next"]).json()
+
+        entries = [entry for page in pages for entry in page["results"]["games"]]
+        self.assertEqual(pages[0]["count"], Game.objects.count())
+        self.assertEqual(
+            [
+                (uuid.UUID(entry["game_id"]), entry["popularity_score"])
+                for entry in entries
+            ],
+            list(self.ranking.load_totals()),
+        )
+        self.assertEqual(
+            [entry["rank"] for entry in entries], list(range(1, len(entries) + 1))
+        )
+        self.assertEqual(next_page["results"]["games"], entries[5:10])
+
+
+class PopularityHistoryTests(LeaderboardTestCase):
+    def add_buckets(self, resolution, start, scores):
+        profile = PopularityProfile.objects.get(name="default")
+        PopularityHistory.objects.bulk_create(
+            PopularityHistory(
+                game=self.chess,
+                profile=profile,
+                resolution=resolution,
+                bucket=start + timedelta(seconds=resolution * i),
+                score=score,
+            )
+            for i, score in enumerate(scores)
+        )
+
+    def test_rollup_aggregates_buckets_and_prune_applies_retention(self):
+        hour = bucket_start(timezone.now(), Resolution.HOUR)
+        self.add_buckets(Resolution.FIVE_MINUTES, hour, [1.0, 2.0, 6.0])
+        self.add_buckets(Resolution.FIVE_MINUTES, hour - timedelta(days=3), [5.0])
+
+        now = hour + timedelta(minutes=15)
+        rollup(now=now)
+        prune(now=now)
+
+        for resolution, bucket in [
+            (Resolution.HOUR, hour),
+            (Resolution.DAY, bucket_start(hour, Resolution.DAY)),
+        ]:
+            row = PopularityHistory.objects.get(resolution=resolution, bucket=bucket)
+            self.assertEqual(
+                (row.score, row.min_score, row.max_score, row.samples),
+                (3.0, 1.0, 6.0, 3),
+            )
+        self.assertEqual(
+            PopularityHistory.objects.filter(
+                resolution=Resolution.FIVE_MINUTES
+            ).count(),
+            3,
+        )
+
+    def test_returns_curve_at_resolution_fitting_the_range(self):
+        since = bucket_start(timezone.now() - timedelta(days=30), Resolution.HOUR)
+        self.add_buckets(Resolution.HOUR, since, [0.1, 0.2, 0.3])
+        url = reverse("game-popularity-history", kwargs={"game_id": self.chess.id})
+
+        response = self.client.get(url, {"since": since.isoformat()})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["resolution"], "1h")
+        self.assertEqual(
+            [point["score"] for point in response.json()["points"]], [0.1, 0.2, 0.3]
+        )
+        self.assertEqual(self.client.get(url, {"since": "yesterday"}).status_code, 400)
+        self.assertEqual(
+            self.client.get(
+                url, {"since": since.isoformat(), "resolution": "5m"}
+            ).status_code,
+            400,
+        )
+
+    def test_rejects_impossible_dates(self):
+        url = reverse("game-popularity-history", kwargs={"game_id": self.chess.id})
+
+        for params in (
+            {"since": "2024-02-30"},
+            {"until": "2024-01-01T25:00:00"},
+            {"until": "0001-01-01"},
+        ):
+            self.assertEqual(self.client.get(url, params).status_code, 400)
+
+
+class AddTestDataCommandTests(TestCase):
+    def generate(self):
+        call_command(
+            "add_test_data",
+            games=3,
+            contestants=20,
+            sessions=300,
+            days=2,
+            open_fraction=0.05,
+            stdout=StringIO(),
+        )
+        return list(
+            GameSession.objects.order_by(
+                "game__name", "contestant__name", "score", "end_time"
+            ).values_list("game__name", "contestant__name", "score", "end_time")
+        )
+
+    def test_generates_seeded_skewed_sessions(self):
+        sessions = self.generate()
+
+        self.assertEqual(len(sessions), 300)
+        per_game = [
+            sum(1 for session in sessions if session[0] == name)
+            for name in ("Chess", "Poker", "Tetris")
+        ]
+        self.assertEqual(per_game, sorted(per_game, reverse=True))
+        self.assertTrue(any(session[3] is None for session in sessions))
+        self.assertEqual(
+            ContestantGameScore.objects.aggregate(total=Sum("total_score"))["total"],
+            sum(session[2] for session in sessions),
+        )
+
+        GameSession.objects.all().delete()
+        Contestant.objects.all().delete()
+        Game.objects.all().delete()
+        self.assertEqual(
+            [session[:3] for session in self.generate()],
+            [session[:3] for session in sessions],
+        )
+
+
+class EndpointBenchmarkTests(TestCase):
+    def test_benchmarks_read_and_write_routes(self):
+        call_command(
+            "add_test_data", games=3, contestants=20, sessions=200, stdout=StringIO()
+        )
+        names = ["game-leaderboard", "date-rank", "end-game-session"]
+
+        results = benchmark_routes(2, names=names)
+
+        self.assertEqual(list(results), names)
+        for result in results.values():
+            self.assertEqual(result["errors"], 0)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+            self.assertGreater(result["max_queries"], 0)
+            self.assertGreater(result["peak_memory_kib"], 0)
+        self.assertEqual(results["end-game-session"]["method"], "POST")
+
+    def test_every_api_route_is_benchmarked_or_skipped(self):
+        for name, route, view_class in iter_routes():
+            if name not in SKIPPED_ROUTES:
+                self.assertIn(route_method(view_class), ("get", "post", "patch"))
+
+    def test_compare_flags_regressions_beyond_the_threshold(self):
+        def run(p95_ms, max_queries):
+            route = {
+                "p95_ms": p95_ms,
+                "peak_memory_kib": 100,
+                "max_queries": max_queries,
+                "errors": 0,
+            }
+            return {"sizes": {"small": {"routes": {"global-leaderboard": route}}}}
+
+        self.assertEqual(compare(run(11, 2), run(10, 2)), [])
+        self.assertEqual(
+            [r["metric"] for r in compare(run(20, 3), run(10, 2))],
+            ["p95_ms", "max_queries"],
+        )
+
+
+class CachePopularityFactorsTests(LeaderboardTestCase):
+    def test_reports_rows_scanned_for_target_date(self):
+        date = timezone.localdate(timezone.now() - timedelta(hours=2))
+
+        report = cache_popularity_factors_and_max_values(date.isoformat())
+
+        self.assertEqual(report["date"], date.isoformat())
+        self.assertEqual(report["rows_scanned"], 3)
+        self.assertEqual(cache.get(f"game_{self.chess.id}_n_daily_players_{date}"), 2)
+        self.assertEqual(cache.get(f"max_daily_sessions_{date}"), 2)
+
+    def test_rejects_invalid_dates(self):
+        for date in ("yesterday", "2024-02-30"):
+            with self.assertRaisesMessage(ValueError, f"Invalid date '{date}'"):
+                cache_popularity_factors_and_max_values(date)
+
+
+class QueryPlanTests(LeaderboardTestCase):
+    """
+    EXPLAIN every GameSession query issued by the hot API paths and fail if
+    the planner falls back to a full table scan. Sequential scans are disabled
+    on PostgreSQL so tiny test tables don't hide a missing index.
+    """
+
+    table = GameSession._meta.db_table
+    full_scan_patterns = {
+        "sqlite": rf"\bSCAN (TABLE )?{table}\b(?! USING)",
+        "postgresql": rf"Seq Scan on {table}\b",
+    }
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+            else:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+    def assertNoFullScan(self, queries):
+        pattern = self.full_scan_patterns.get(connection.vendor)
+        if pattern is None:
+            self.skipTest(f"No query plan check for {connection.vendor}")
+
+        explained = 0
+        for query in queries:
+            sql = query["sql"]
+            if self.table not in sql or not sql.startswith(("SELECT", "UPDATE")):
+                continue
+            plan = self.explain(sql)
+            self.assertIsNone(re.search(pattern, plan), f"Full scan in:\n{sql}\n{plan}")
+            explained += 1
+        self.assertGreater(explained, 0)
+
+    def test_session_lifecycle(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("start-game-session"),
+                {"game_id": str(self.poker.id), "contestant_id": str(self.bob.id)},
+                content_type="application/json",
+            )
+            self.client.get(reverse("game-live", kwargs={"game_id": self.poker.id}))
+            self.client.post(
+                reverse("end-game-session"),
+                {"session_id": response.json()["session_id"], "score": 10},
+                content_type="application/json",
+            )
+            self.client.post(reverse("delete-game", kwargs={"game_id": self.poker.id}))
+
+        self.assertNoFullScan(queries)
+
+    def test_session_lists(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(
+                reverse("list-game-sessions", kwargs={"game_id": self.chess.id}),
+                {"pagination": "cursor", "page_size": 1},
+            )
+            self.client.get(
+                reverse(
+                    "list-contestant-sessions", kwargs={"contestant_id": self.alice.id}
+                ),
+                {"date": timezone.localdate().isoformat()},
+            )
+            self.client.get(reverse("game-details", kwargs={"game_id": self.chess.id}))
+
+        self.assertNoFullScan(queries)
+
+    def test_daily_factors(self):
+        with CaptureQueriesContext(connection) as queries:
+            compute_daily_factors(timezone.localdate())
+
+        self.assertNoFullScan(queries)
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1)
+class RequestTimingMiddlewareTests(LeaderboardTestCase):
+    def test_reports_server_timing(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("game-details", kwargs={"game_id": self.chess.id})
+            )
+
+        self.assertRegex(
+            response["Server-Timing"], rf'db;dur=[\d.]+;desc="{len(queries)} calls"'
+        )
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+    async def test_reports_server_timing_under_asgi(self):
+        response = await self.async_client.get(
+            reverse("game-details", kwargs={"game_id": self.chess.id})
+        )
+
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="2 calls"')
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0, REQUEST_TIMING_SAMPLE_RATE=0)
+    def test_logs_slow_requests_without_timing_unsampled_ones(self):
+        with self.assertLogs("gameboard.performance", "WARNING") as logs:
+            response = self.client.get(reverse("global-leaderboard"))
+
+        self.assertNotIn("Server-Timing", response)
+        entry = json.loads(logs.records[0].getMessage().split(": ", 1)[1])
+        self.assertEqual(entry["path"], reverse("global-leaderboard"))
+        self.assertFalse(entry["sampled"])
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_slow_request_log_includes_slowest_sql(self):
+        with self.assertLogs("gameboard.performance", "WARNING") as logs:
+            self.client.get(reverse("game-details", kwargs={"game_id": self.chess.id}))
+
+        entry = json.loads(logs.records[0].getMessage().split(": ", 1)[1])
+        self.assertEqual(entry["db"]["calls"], 2)
+        self.assertEqual(len(entry["slowest_queries"]), 2)
+        self.assertEqual(entry["repeated_queries"], 0)
+
+    def test_times_the_configured_cache_backend(self):
+        self.assertIsInstance(caches["default"], RedisCache)
+        response = self.client.get(reverse("global-leaderboard"))
+
+        self.assertRegex(
+            response["Server-Timing"], r'cache;dur=[\d.]+;desc="\d+ calls"'
+        )
+
+
+@patch.object(GameSessionAdmin, "list_per_page", 2)
+class LargeTableAdminTests(LeaderboardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(
+            User.objects.create_superuser("admin", "admin@example.com", "password")
+        )
+        self.url = reverse("admin:games_gamesession_changelist")
+
+    def test_pages_by_keyset_without_count_star(self):
+        with CaptureQueriesContext(connection) as queries:
+            first = self.client.get(self.url)
+        second = self.client.get(self.url + first.context["cl"].next_page_url)
+
+        first_page = [session.id for session in first.context["cl"].result_list]
+        second_page = [session.id for session in second.context["cl"].result_list]
+        self.assertEqual(
+            first_page + second_page,
+            list(
+                GameSession.objects.order_by("-start_time", "-id").values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+        self.assertIsNone(second.context["cl"].next_page_url)
+        self.assertEqual(first.context["cl"].result_count, 3)
+        self.assertFalse(
+            any(
+                query["sql"].startswith('SELECT COUNT(*) AS "__count" FROM')
+                for query in queries
+            )
+        )
+
+    def test_searches_uuid_fields_exactly(self):
+        response = self.client.get(self.url, {"q": str(self.bob.id)})
+
+        self.assertEqual(
+            [session.contestant for session in response.context["cl"].result_list],
+            [self.bob],
+        )
+
+        response = self.client.get(self.url, {"q": "Alice"})
+
+        self.assertEqual(response.context["cl"].result_count, 2)
+
+    def test_score_tables_search_ids_and_names_exactly(self):
+        url = reverse("admin:games_contestantgamescore_changelist")
+
+        response = self.client.get(url, {"q": str(self.chess.id)})
+
+        self.assertEqual(
+            {score.game for score in response.context["cl"].result_list},
+            {self.chess},
+        )
+
+        response = self.client.get(url, {"q": "bob"})
+
+        self.assertEqual(
+            {score.contestant for score in response.context["cl"].result_list},
+            {self.bob},
+        )
+        self.assertEqual(
+            self.client.get(url, {"q": "Bo"}).context["cl"].result_count, 0
+        )
+
+    def test_history_and_daily_score_changelists_page_by_keyset(self):
+        for model in [
+            "popularityhistory",
+            "contestantdailyscore",
+            "contestantgamedailyscore",
+        ]:
+            response = self.client.get(reverse(f"admin:games_{model}_changelist"))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.context["cl"].can_show_all)
+
+    def test_rejects_invalid_cursor(self):
+        response = self.client.get(self.url, {"after": "not-a-cursor"})
+
+        self.assertRedirects(response, f"{self.url}?e=1")
+
+        response = self.client.get(
+            self.url, {"after": encode_cursor(["x", str(self.bob.id)])}
+        )
+
+        self.assertRedirects(response, f"{self.url}?e=1")
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReadReplicaRouterTests(SimpleTestCase):
+    def test_routes_leaderboard_reads_to_replicas(self):
+        router = ReadReplicaRouter()
+
+        self.assertEqual(router.db_for_read(ContestantGameScore), "replica_1")
+        self.assertEqual(router.db_for_read(GameSession), "default")
+        self.assertEqual(router.db_for_write(ContestantGameScore), "default")
+        with patch.object(connection, "in_atomic_block", True):
+            self.assertEqual(router.db_for_read(ContestantGameScore), "default")
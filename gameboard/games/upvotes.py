@@ -0,0 +1,108 @@
+"""
+Write-behind upvote counters.
+
+Upvotes are added to a Redis hash (game_id -> pending upvotes) with HINCRBY,
+so concurrent upvotes never wait on the game row. `flush_upvotes()` moves the
+pending hash aside with RENAME and applies it to Game.upvotes with one F()
+update per game.
+
+Each flush runs under a batch id kept in Redis until the batch is fully
+applied, and the id is stored in UpvoteFlush in the same transaction as the
+updates. A flush interrupted at any point is picked up by the next run: the
+renamed hash is still there, and if the batch was already committed it is
+discarded instead of being applied twice.
+"""
+
+from datetime import timedelta
+import logging
+import uuid
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from gameboard.common.redis.client import get_redis_connection
+from gameboard.games.models import Game, UpvoteFlush
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "upvotes:pending"
+FLUSHING_KEY = "upvotes:flushing"
+BATCH_KEY = "upvotes:flushing:batch"
+FLUSH_LOCK_KEY = "upvotes:flush:lock"
+FLUSH_LOCK_TIMEOUT = 60  # seconds
+FLUSH_RETENTION = timedelta(days=1)
+
+
+def buffer_upvote(game_id):
+    """
+    Add one pending upvote to a game and return the game's upvotes that have
+    not reached the database yet (pending plus any batch being flushed).
+    """
+    pipe = get_redis_connection().pipeline(transaction=False)
+    pipe.hincrby(PENDING_KEY, str(game_id), 1)
+    pipe.hget(FLUSHING_KEY, str(game_id))
+    pending, flushing = pipe.execute()
+    return pending + int(flushing or 0)
+
+
+def _apply_batch(batch_id, deltas):
+    """
+    Apply {game_id: delta} to Game.upvotes and record the batch, in one
+    transaction. Returns False if the batch had already been applied.
+    """
+    try:
+        with transaction.atomic():
+            UpvoteFlush.objects.create(
+                batch_id=batch_id, games=len(deltas), upvotes=sum(deltas.values())
+            )
+            for game_id, delta in deltas.items():
+                Game.objects.filter(id=game_id).update(upvotes=F("upvotes") + delta)
+    except IntegrityError:
+        return False
+    return True
+
+
+def flush_upvotes():
+    """
+    Apply buffered upvotes to the database. Returns the number of upvotes
+    applied, or None if another flush is running.
+    """
+    redis = get_redis_connection()
+    if not redis.set(FLUSH_LOCK_KEY, 1, nx=True, ex=FLUSH_LOCK_TIMEOUT):
+        return None
+
+    try:
+        # Resume an interrupted flush under its original batch id
+        redis.set(BATCH_KEY, uuid.uuid4().hex, nx=True)
+        batch_id = redis.get(BATCH_KEY)
+
+        if not redis.exists(FLUSHING_KEY):
+            if not redis.exists(PENDING_KEY):
+                redis.delete(BATCH_KEY)
+                return 0
+            redis.rename(PENDING_KEY, FLUSHING_KEY)
+
+        deltas = {
+            game_id: int(delta)
+            for game_id, delta in redis.hgetall(FLUSHING_KEY).items()
+            if int(delta)
+        }
+        applied = _apply_batch(batch_id, deltas)
+        if not applied:
+            logger.warning(f"Upvote batch {batch_id} was already applied, discarding")
+
+        pipe = redis.pipeline()
+        pipe.delete(FLUSHING_KEY)
+        pipe.delete(BATCH_KEY)
+        pipe.execute()
+
+        UpvoteFlush.objects.filter(
+            created_at__lt=timezone.now() - FLUSH_RETENTION
+        ).delete()
+
+        total = sum(deltas.values()) if applied else 0
+        logger.info(f"Flushed {total} upvotes for {len(deltas)} games")
+        return total
+    finally:
+        redis.delete(FLUSH_LOCK_KEY)
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 from pathlib import Path
 
+import environ
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -44,6 +46,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "gameboard.common.middleware.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -76,18 +79,50 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "gameboard.wsgi.application"
+ASGI_APPLICATION = "gameboard.asgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_URL selects the primary database, e.g.
+# postgres://gameboard:gameboard@db:5432/gameboard (SQLite by default), and
+# DATABASE_REPLICA_URLS an optional comma-separated list of read replicas.
+DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+DB_CONN_HEALTH_CHECKS = os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower() == "true"
+
+
+def database_config(url):
+    config = environ.Env.db_url_config(url)
+    config["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+    config["CONN_HEALTH_CHECKS"] = DB_CONN_HEALTH_CHECKS
+    return config
+
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_config(
+        os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
+    ),
 }
 
+DATABASE_REPLICAS = []
+for url in filter(None, os.getenv("DATABASE_REPLICA_URLS", "").split(",")):
+    alias = f"replica_{len(DATABASE_REPLICAS) + 1}"
+    # Tests treat replicas as mirrors of the primary
+    DATABASES[alias] = {**database_config(url.strip()), "TEST": {"MIRROR": "default"}}
+    DATABASE_REPLICAS.append(alias)
+
+# Models whose reads (leaderboards, rankings, history) may be served by replicas
+DATABASE_REPLICA_MODELS = [
+    "games.contestantgamescore",
+    "games.contestantdailyscore",
+    "games.contestantgamedailyscore",
+    "games.gamepopularity",
+    "games.popularityhistory",
+]
+
+DATABASE_ROUTERS = ["gameboard.common.db.routers.ReadReplicaRouter"]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -140,6 +175,56 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+# Redis database used for application data such as leaderboards
+# REDIS_URL = "redis://localhost:6379/2"
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/2")
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
+
+# Buffer upvotes in Redis and flush them to Game.upvotes periodically
+# instead of updating the game row on every request
+UPVOTES_WRITE_BEHIND = os.getenv("UPVOTES_WRITE_BEHIND", "true").lower() == "true"
+
+# Number of top entries streamed by the live leaderboard and popularity feeds
+FEED_TOP_N = int(os.getenv("FEED_TOP_N", "10"))
+
+# Share of requests timed with query, cache and Redis counters and a
+# Server-Timing header, and the duration above which requests are logged
+# to "gameboard.performance" (see gameboard/common/middleware.py). Sampled
+# requests pay for the counters, so only 1% are timed unless raised here
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv("REQUEST_TIMING_SAMPLE_RATE", "0.01"))
+SLOW_REQUEST_THRESHOLD_MS = float(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "500"))
+
+# Cache shared by the web and Celery workers: response cache entries and
+# their invalidation tokens, popularity factors and scores. It gets its own
+# Redis database, as clearing the cache flushes it. CACHE_BACKEND may name
+# another backend, but a per-process one such as LocMemCache only suits a
+# single process. CACHE_TIMING counts cache calls in the per-request stats.
+CACHE_BACKEND = os.getenv(
+    "CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"
+)
+# CACHE_URL = "redis://localhost:6379/3"
+CACHE_URL = os.getenv("CACHE_URL", "redis://redis:6379/3")
+CACHE_TIMING = os.getenv("CACHE_TIMING", "true").lower() == "true"
+
+CACHES = {
+    "default": {
+        "BACKEND": (
+            "gameboard.common.cache.TimedCache" if CACHE_TIMING else CACHE_BACKEND
+        ),
+        "TIMED_BACKEND": CACHE_BACKEND,
+        "LOCATION": CACHE_URL,
+    }
+}
+if CACHE_BACKEND == "django.core.cache.backends.redis.RedisCache":
+    CACHES["default"]["OPTIONS"] = {
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+    }
+
+# Tests run the default cache on an in-memory fake Redis server
+# (requirements-dev.txt)
+TEST_RUNNER = "gameboard.common.test_runner.TestRunner"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -165,5 +250,10 @@ LOGGING = {
             "level": "INFO",
             "propagate": True,
         },
+        "gameboard.performance": {
+            "handlers": ["file"],
+            "level": "WARNING",
+            "propagate": True,
+        },
     },
 }